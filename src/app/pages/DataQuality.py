@@ -14,17 +14,17 @@
 from src.app.ui.navbar import render_navbar
 from src.app.ui.floating_action_bar import render_floating_action_bar
 from src.app.ui.page_state import set_active_page
-from src.config.paths import LONG_SNAPSHOT
+from src.ingestion.long_snapshot_store import LongSnapshotStore, load_long_snapshot, long_snapshot_exists
 
 
 # ------------------------------------------------------------
 # Load Snapshot
 # ------------------------------------------------------------
 def _load_long_snapshot() -> pd.DataFrame:
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         return pd.DataFrame()
     try:
-        return pd.read_parquet(LONG_SNAPSHOT)
+        return load_long_snapshot()
     except Exception:
         return pd.DataFrame()
 
@@ -61,7 +61,8 @@ def main() -> None:
     st.subheader("Snapshot Freshness")
 
     try:
-        ts = datetime.utcfromtimestamp(LONG_SNAPSHOT.stat().st_mtime)
+        updated_at = LongSnapshotStore().index()["updated_at"]
+        ts = datetime.fromisoformat(updated_at).replace(tzinfo=None)
         age_days = (datetime.utcnow() - ts).days
         freshness = (
             "🟢 Fresh" if age_days <= 1 else
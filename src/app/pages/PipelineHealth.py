@@ -29,6 +29,7 @@
 )
 
 from src.config.paths import DATA_DIR, LONG_SNAPSHOT
+from src.ingestion.long_snapshot_store import load_long_snapshot, long_snapshot_exists
 from src.app.ui.pipeline_controls import render_pipeline_controls
 
 render_pipeline_controls()
@@ -65,7 +66,7 @@ def _prediction_file_status(pred_date: date) -> pd.DataFrame:
 
 def _snapshot_status() -> dict:
     """Check canonical long snapshot health."""
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         return {
             "exists": False,
             "rows": 0,
@@ -74,7 +75,7 @@ def _snapshot_status() -> dict:
         }
 
     try:
-        df = pd.read_parquet(LONG_SNAPSHOT)
+        df = load_long_snapshot()
         return {
             "exists": True,
             "rows": len(df),
@@ -21,10 +21,20 @@
 CANONICAL_DIR.mkdir(parents=True, exist_ok=True)
 
 DAILY_SCHEDULE_SNAPSHOT = CANONICAL_DIR / "schedule_daily.parquet"
-LONG_SNAPSHOT = CANONICAL_DIR / "long_snapshot.parquet"
-FEATURES_SNAPSHOT = CANONICAL_DIR / "features_snapshot.parquet"
 SEASON_SCHEDULE_PATH = CANONICAL_DIR / "schedule_season.parquet"
 
+# Long snapshot: date-partitioned dataset (season/date.parquet) + manifest
+LONG_SNAPSHOT = CANONICAL_DIR / "long_snapshot"
+LONG_SNAPSHOT_MANIFEST_PATH = LONG_SNAPSHOT / "_manifest.json"
+
+# Previous single-file layout, migrated into LONG_SNAPSHOT on first access
+# (long_snapshot_exists / load_long_snapshot / LongSnapshotStore)
+LEGACY_LONG_SNAPSHOT = CANONICAL_DIR / "long_snapshot.parquet"
+
+# Feature store: Hive-partitioned dataset (season=YYYY-YYYY/) + manifest
+FEATURES_SNAPSHOT = CANONICAL_DIR / "features"
+FEATURES_MANIFEST_PATH = FEATURES_SNAPSHOT / "_manifest.json"
+
 # ------------------------------------------------------------
 # Raw snapshots
 # ------------------------------------------------------------
@@ -48,6 +58,16 @@
 FEATURES_DIR = DATA_DIR / "features"
 FEATURES_DIR.mkdir(parents=True, exist_ok=True)
 
+# Persisted feature state (per-team Elo, windows and form)
+FEATURE_STATE_DIR = FEATURES_DIR / "state"
+FEATURE_STATE_DIR.mkdir(parents=True, exist_ok=True)
+
+TEAM_STATE_PATH = FEATURE_STATE_DIR / "team_state.parquet"
+
+# Content-addressed cache of built feature frames
+FEATURE_CACHE_DIR = FEATURES_DIR / "cache"
+FEATURE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
 # ------------------------------------------------------------
 # Models + registry
 # ------------------------------------------------------------
@@ -114,12 +134,22 @@
 REPORTS_DIR = DATA_DIR / "reports"
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Feature pipeline scale benchmarks (latest run + reference baseline)
+FEATURE_BENCHMARK_RESULTS = REPORTS_DIR / "feature_benchmark.json"
+FEATURE_BENCHMARK_BASELINE = REPORTS_DIR / "feature_benchmark_baseline.json"
+
+# Last schedule-aware backfill plan (written before executing)
+BACKFILL_PLAN_REPORT = REPORTS_DIR / "backfill_plan.json"
+
 # ------------------------------------------------------------
 # Monitoring logs + dashboards
 # ------------------------------------------------------------
 LOGS_DIR = DATA_DIR / "logs"
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Per-step feature build profiles (one JSON line per build)
+FEATURE_PROFILE_LOG = LOGS_DIR / "feature_build_profiles.jsonl"
+
 DASHBOARD_DIR = DATA_DIR / "dashboard"
 DASHBOARD_DIR.mkdir(parents=True, exist_ok=True)
 
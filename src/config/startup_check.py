@@ -15,9 +15,9 @@
 from src.config.paths import (
     MODEL_REGISTRY_PATH,
     DAILY_SCHEDULE_SNAPSHOT,
-    LONG_SNAPSHOT,
     FEATURES_SNAPSHOT,
 )
+from src.ingestion.long_snapshot_store import long_snapshot_exists
 from src.config.env import (
     TELEGRAM_BOT_TOKEN,
     TELEGRAM_CHAT_ID,
@@ -56,7 +56,7 @@ def check_model_registry() -> dict:
 def check_snapshots() -> dict:
     snapshots = {
         "daily_schedule_snapshot": DAILY_SCHEDULE_SNAPSHOT.exists(),
-        "long_snapshot": LONG_SNAPSHOT.exists(),
+        "long_snapshot": long_snapshot_exists(),
         "features_snapshot": FEATURES_SNAPSHOT.exists(),
     }
     return {"ok": all(snapshots.values()), "snapshots": snapshots}
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Feature Pipeline Benchmarks
+# File: src/features/benchmark.py
+# Author: Sadiq
+#
+# Description:
+#     Scale benchmarks for the feature pipeline on synthetic
+#     leagues (synthetic_league.py) at multiples of the current
+#     data size:
+#         - build_features (full, validated)
+#         - every legacy add_* step, chained in pipeline order
+#         - _validate_feature_rows
+#
+#     Each benchmark records wall time, throughput (rows/s) and
+#     peak traced allocation (tracemalloc, measured in a second,
+#     untimed run so tracing does not skew the timings).
+#
+#     Results are written as JSON; compare_benchmarks() flags
+#     regressions against a stored baseline.
+# ============================================================
+
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable
+
+import pandas as pd
+from loguru import logger
+
+from src.config.paths import FEATURE_BENCHMARK_BASELINE
+from src.features.elo import add_elo_features
+from src.features.elo_rolling import add_elo_rolling_features
+from src.features.feature_pipeline import _validate_feature_rows, build_features
+from src.features.form import add_form_features
+from src.features.margin_features import add_margin_features
+from src.features.opponent_adjusted import add_opponent_adjusted_features
+from src.features.rest import add_rest_features
+from src.features.rolling import add_rolling_features
+from src.features.sos import add_sos_features
+from src.features.win_streak import add_win_streak
+from src.utils.synthetic_league import LeagueConfig, generate_long_df
+
+# "Current" data size: a few full seasons of a 30-team league
+BASE_LEAGUE = LeagueConfig(seasons=3, teams=30, games_per_team=82, start_year=1950)
+BENCHMARK_SCALES = (1, 10, 100)
+
+# Legacy per-step functions, in the order each one's inputs exist
+ADD_STEPS: list[tuple[str, Callable[[pd.DataFrame], pd.DataFrame]]] = [
+    ("add_elo_features", add_elo_features),
+    ("add_elo_rolling_features", add_elo_rolling_features),
+    ("add_rolling_features", add_rolling_features),
+    ("add_margin_features", add_margin_features),
+    ("add_form_features", add_form_features),
+    ("add_rest_features", add_rest_features),
+    ("add_sos_features", add_sos_features),
+    ("add_opponent_adjusted_features", add_opponent_adjusted_features),
+    ("add_win_streak", add_win_streak),
+]
+
+REGRESSION_TOLERANCE = 0.25
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    scale: int
+    rows: int
+    wall_s: float
+    rows_per_s: float
+    peak_alloc_bytes: int | None = None
+
+
+def league_for_scale(scale: int, base: LeagueConfig = BASE_LEAGUE) -> LeagueConfig:
+    """base with scale times as many seasons."""
+    if scale < 1:
+        raise ValueError(f"Benchmark scale must be >= 1, got {scale}")
+    return replace(base, seasons=base.seasons * scale)
+
+
+def _measure(func: Callable, arg, track_memory: bool):
+    """(result, wall seconds, peak traced bytes or None)."""
+    gc.collect()
+    started = time.perf_counter()
+    result = func(arg)
+    wall = time.perf_counter() - started
+
+    peak = None
+    if track_memory:
+        del result
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = func(arg)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, wall, peak
+
+
+def benchmark_scale(scale: int, track_memory: bool = True, base: LeagueConfig = BASE_LEAGUE) -> list[BenchmarkResult]:
+    """Run every benchmark on one synthetic league size."""
+    long_df = generate_long_df(league_for_scale(scale, base))
+    rows = len(long_df)
+    results: list[BenchmarkResult] = []
+
+    def record(name: str, wall: float, peak: int | None) -> None:
+        entry = BenchmarkResult(name, scale, rows, wall, rows / wall if wall else 0.0, peak)
+        results.append(entry)
+        mem = "" if peak is None else f", peak {peak / 1e6:.1f} MB"
+        logger.info(f"⏱️ [Benchmark] {scale}× {name}: {wall:.3f}s ({entry.rows_per_s:,.0f} rows/s{mem})")
+
+    features, wall, peak = _measure(build_features, long_df, track_memory)
+    record("build_features", wall, peak)
+
+    _, wall, peak = _measure(_validate_feature_rows, features, track_memory)
+    record("_validate_feature_rows", wall, peak)
+    del features
+
+    df = long_df
+    for name, func in ADD_STEPS:
+        df, wall, peak = _measure(func, df, track_memory)
+        record(name, wall, peak)
+
+    return results
+
+
+def run_benchmarks(
+    scales: Iterable[int] = BENCHMARK_SCALES,
+    track_memory: bool = True,
+    base: LeagueConfig = BASE_LEAGUE,
+) -> list[BenchmarkResult]:
+    results = []
+    for scale in scales:
+        logger.info(f"🏋️ [Benchmark] Scale {scale}× ({league_for_scale(scale, base).rows} rows)")
+        results.extend(benchmark_scale(scale, track_memory=track_memory, base=base))
+    return results
+
+
+# ------------------------------------------------------------
+# Baselines
+# ------------------------------------------------------------
+def write_results(results: list[BenchmarkResult], path: Path = FEATURE_BENCHMARK_BASELINE) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "results": [asdict(r) for r in results],
+    }
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    temp_path.replace(path)
+    logger.info(f"📝 [Benchmark] Wrote {len(results)} results → {path}")
+    return path
+
+
+def read_results(path: Path = FEATURE_BENCHMARK_BASELINE) -> list[BenchmarkResult]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [BenchmarkResult(**r) for r in payload["results"]]
+
+
+def compare_benchmarks(
+    current: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    tolerance: float = REGRESSION_TOLERANCE,
+) -> pd.DataFrame:
+    """
+    One row per (name, scale) in both runs with wall time and peak
+    allocation ratios (current / baseline); `regression` is set
+    when either grew by more than `tolerance`.
+    """
+    base = {(r.name, r.scale): r for r in baseline}
+    rows = []
+    for r in current:
+        b = base.get((r.name, r.scale))
+        if b is None:
+            continue
+        wall_ratio = r.wall_s / b.wall_s if b.wall_s else float("nan")
+        mem_ratio = (
+            r.peak_alloc_bytes / b.peak_alloc_bytes
+            if r.peak_alloc_bytes is not None and b.peak_alloc_bytes
+            else float("nan")
+        )
+        rows.append(
+            {
+                "name": r.name,
+                "scale": r.scale,
+                "wall_s": r.wall_s,
+                "baseline_wall_s": b.wall_s,
+                "wall_ratio": wall_ratio,
+                "memory_ratio": mem_ratio,
+                "regression": wall_ratio > 1 + tolerance or mem_ratio > 1 + tolerance,
+            }
+        )
+    return pd.DataFrame(
+        rows,
+        columns=["name", "scale", "wall_s", "baseline_wall_s", "wall_ratio", "memory_ratio", "regression"],
+    )
@@ -7,16 +7,17 @@
 # Author: Sadiq
 #
 # Description:
-#     Loads the canonical long snapshot, builds the full
-#     feature matrix using the feature pipeline, persists the
-#     snapshot, and runs validation.
+#     Loads the canonical long snapshot, refreshes the
+#     season-partitioned feature snapshot (only seasons whose
+#     input changed are rebuilt; only columns whose feature
+#     module changed are recomputed), and runs validation.
 # ============================================================
 
-import pandas as pd
 from loguru import logger
 
 from src.config.paths import LONG_SNAPSHOT, FEATURES_SNAPSHOT
-from src.features.feature_pipeline import build_features
+from src.ingestion.long_snapshot_store import load_long_snapshot, long_snapshot_exists
+from src.features.feature_pipeline import refresh_feature_snapshot
 from src.scripts.validate_features import validate_features
 
 
@@ -26,23 +27,23 @@ def main():
     # --------------------------------------------------------
     # Load canonical long-format dataset
     # --------------------------------------------------------
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         logger.error(f"❌ Missing canonical snapshot: {LONG_SNAPSHOT}")
         return
 
     logger.info(f"📥 Loading canonical long snapshot: {LONG_SNAPSHOT}")
-    long_df = pd.read_parquet(LONG_SNAPSHOT)
+    long_df = load_long_snapshot()
     logger.info(f"Loaded {len(long_df)} team-game rows.")
 
     # --------------------------------------------------------
-    # Build features + persist
+    # Build features + persist (changed seasons only)
     # --------------------------------------------------------
     logger.info("🔧 Running feature pipeline...")
-    features = build_features(long_df, persist=True)
+    rebuilt = refresh_feature_snapshot(long_df)
 
     logger.success(
-        f"🎉 Feature build complete! Saved to {FEATURES_SNAPSHOT} "
-        f"({features.shape[0]} rows, {features.shape[1]} columns)"
+        f"🎉 Feature build complete! Snapshot: {FEATURES_SNAPSHOT} "
+        f"(rebuilt seasons: {', '.join(rebuilt) or 'none'})"
     )
 
     # --------------------------------------------------------
@@ -7,31 +7,229 @@
 # Author: Sadiq
 # ============================================================
 
+from datetime import date
+
 import pandas as pd
 from loguru import logger
 
-from src.features.feature_pipeline import build_features
+from src.features.columnar_engine import FEATURE_ENGINES
+from src.features.feature_cache import FeatureCache, default_feature_cache, feature_cache_key
+from src.features.feature_pipeline import build_features, _validate_feature_rows
 from src.features.feature_schema import FeatureRow
+from src.features.frame_layout import compact_feature_frame
+from src.features.profiling import FeatureProfile
+from src.model.config.model_config import FEATURE_MAP, TARGET_MAP
+from src.features.team_state import (
+    TeamState,
+    TeamStateStore,
+    build_team_state,
+    compute_incremental_features,
+    compute_schedule_features,
+    latest_state_date,
+    rows_behind_state,
+)
+from src.ingestion.long_snapshot_store import LongSnapshotStore, load_long_snapshot
+
+
+def _state_input(rows: pd.DataFrame) -> pd.DataFrame:
+    """Canonical snapshot rows (opponent_score, nullable ints) as team-state input."""
+    df = rows.rename(columns={"opponent_score": "opp_score"}) if "opp_score" not in rows.columns else rows.copy()
+    df["date"] = pd.to_datetime(df["date"])
+    for col in ("score", "opp_score"):
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+    return df
 
 
 class FeatureBuilder:
     """
     Version‑agnostic feature builder.
     Wraps the canonical feature pipeline and exposes a stable API.
+
+    Builds are memoized in a content-addressed FeatureCache (shared
+    process-wide by default); pass use_cache=False to always rebuild.
+
+    engine selects the feature executor ("pandas" or "columnar", see
+    build_features). Both produce identical frames, so they share
+    cache entries.
     """
 
-    def __init__(self, version: str | None = None):
+    def __init__(
+        self,
+        version: str | None = None,
+        state_store: TeamStateStore | None = None,
+        cache: FeatureCache | None = None,
+        use_cache: bool = True,
+        engine: str = "pandas",
+    ):
+        if engine not in FEATURE_ENGINES:
+            raise ValueError(f"Unknown feature engine '{engine}'. Expected one of {FEATURE_ENGINES}.")
+
         self.version = version
+        self.engine = engine
+        self.state_store = state_store or TeamStateStore()
+        self.cache = (cache or default_feature_cache()) if use_cache else None
 
     # ------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------
-    def build(self, long_df: pd.DataFrame, persist: bool = False) -> pd.DataFrame:
+    def build(
+        self,
+        long_df: pd.DataFrame,
+        persist: bool = False,
+        columns: list[str] | None = None,
+        profile: FeatureProfile | None = None,
+    ) -> pd.DataFrame:
         """
         Build full feature matrix from canonical long-format input.
+        With `columns`, only the feature steps those columns need run.
+
+        Identical input + columns + feature code return the cached
+        frame. Persisting and profiled builds always run the pipeline.
         """
+        if self.cache is None or persist or profile is not None:
+            logger.info(f"🏗️  FeatureBuilder: building features for {len(long_df)} rows...")
+            return build_features(
+                long_df, persist=persist, columns=columns, engine=self.engine, profile=profile
+            )
+
+        key = feature_cache_key(long_df, columns)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info(f"♻️  FeatureBuilder: cache hit for {len(long_df)} rows ({key[:12]}).")
+            return cached
+
         logger.info(f"🏗️  FeatureBuilder: building features for {len(long_df)} rows...")
-        return build_features(long_df, persist=persist)
+        features = build_features(long_df, columns=columns, engine=self.engine)
+        self.cache.put(key, features)
+        return features
+
+    def build_for_model(self, long_df: pd.DataFrame, model_type: str) -> pd.DataFrame:
+        """
+        Build only the feature + target columns consumed by a model type
+        (FEATURE_MAP / TARGET_MAP).
+        """
+        if model_type not in FEATURE_MAP:
+            raise ValueError(f"Unknown model_type '{model_type}'. Expected one of {list(FEATURE_MAP)}.")
+
+        columns = FEATURE_MAP[model_type] + [TARGET_MAP[model_type]]
+        return self.build(long_df, columns=columns)
+
+    # ------------------------------------------------------------
+    # Incremental API (per-team persisted state)
+    # ------------------------------------------------------------
+    def build_state(self, long_df: pd.DataFrame, persist: bool = True) -> int:
+        """
+        Rebuild per-team state from full history. Returns the number
+        of teams stored.
+        """
+        states = build_team_state(_state_input(long_df))
+        if persist:
+            self.state_store.save(states)
+        logger.info(f"🧠 FeatureBuilder: state rebuilt for {len(states)} teams.")
+        return len(states)
+
+    def build_incremental(self, new_rows: pd.DataFrame, persist: bool = True) -> pd.DataFrame:
+        """
+        Build feature rows for new team-games only, from persisted
+        per-team state (no full-history recompute). State is advanced
+        with the completed games and saved when persist=True.
+        """
+        if not self.state_store.exists():
+            raise FileNotFoundError(
+                f"No team state at {self.state_store.path}. Run build_state() first."
+            )
+
+        states = self.state_store.load()
+        features = compute_incremental_features(new_rows, states)
+
+        if persist:
+            self.state_store.save(states)
+
+        if features.empty:
+            return features
+
+        logger.info(f"⚡ FeatureBuilder: incremental features for {len(features)} rows.")
+        return _validate_feature_rows(features)
+
+    def advance_state(self, new_rows: pd.DataFrame) -> None:
+        """
+        Fold rows just written to the long snapshot into the persisted
+        state, so prediction runs start from it instead of history.
+
+        Rows of dates already folded in are skipped. Without a stored
+        state, or when a completed game predates its team's last
+        stored game (backfill, repair), the state is rebuilt from the
+        full snapshot instead.
+        """
+        new_rows = _state_input(new_rows)
+        states = self.state_store.load()
+        if not states or rows_behind_state(new_rows, states):
+            logger.info("🧠 FeatureBuilder: rebuilding team state from the long snapshot.")
+            history = load_long_snapshot()
+            if len(history):
+                self.build_state(history)
+            return
+
+        compute_incremental_features(new_rows, states)
+        self.state_store.save(states)
+
+    def state_before(self, day: date, store: LongSnapshotStore | None = None) -> dict[str, TeamState]:
+        """
+        Per-team state as of the last game before `day`: the persisted
+        state when it ends exactly there (the daily case, kept current
+        by advance_state), otherwise rebuilt from the earlier snapshot
+        partitions (predictions for past dates).
+        """
+        store = store or LongSnapshotStore()
+        earlier = [d for d in store.days() if d < day]
+        last_game = pd.Timestamp(earlier[-1]) if earlier else None
+
+        states = self.state_store.load()
+        if states and latest_state_date(states) == last_game:
+            return states
+
+        logger.info(f"🧠 FeatureBuilder: rebuilding team state from history before {day}")
+        history = store.read(end=earlier[-1]) if earlier else pd.DataFrame()
+        return build_team_state(_state_input(history)) if len(history) else {}
+
+    def build_for_schedule(
+        self,
+        schedule_rows: pd.DataFrame,
+        as_of: date | pd.Timestamp | None = None,
+        states: dict[str, TeamState] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Build pre-game feature rows for future games from per-team
+        state, without touching history (constant work per game).
+
+        as_of:
+            Prediction date; defaults to the first scheduled date.
+            The state must only contain games before it (ValueError
+            otherwise), so no result on or after as_of can leak in.
+        states:
+            State to read instead of the persisted snapshot (e.g.
+            rebuilt for a past date). It is not modified.
+
+        Outcome columns (score, win, margin, ...) are left empty, so
+        rows are returned in FeatureRow column order but unvalidated.
+        """
+        if states is None:
+            if not self.state_store.exists():
+                raise FileNotFoundError(
+                    f"No team state at {self.state_store.path}. Run build_state() first."
+                )
+            states = self.state_store.load()
+
+        if as_of is None:
+            as_of = pd.to_datetime(schedule_rows["date"]).min()
+
+        features = compute_schedule_features(schedule_rows, states, pd.Timestamp(as_of))
+        if features.empty:
+            return features
+
+        logger.info(f"📅 FeatureBuilder: pre-game features for {len(features)} scheduled rows.")
+        features = compact_feature_frame(features)
+        return features[[c for c in FeatureRow.model_fields if c in features.columns]]
 
     # ------------------------------------------------------------
     # Canonical expected columns
@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Columnar Feature Engine
+# File: src/features/columnar_engine.py
+# Author: Sadiq
+#
+# Description:
+#     Alternative executor for feature plans that works on
+#     Arrow / numpy columns instead of a pandas frame.
+#
+#     The FeaturePlan is treated as a lazy query:
+#         1. scan:    only the base columns the plan reads are
+#                     projected from the input (Arrow table)
+#         2. sort:    one (team, date) sort_indices + take over
+#                     the projected columns (fused)
+#         3. execute: columnar kernels per step, level by level;
+#                     intermediate columns are released after
+#                     their last consumer
+#         4. project: requested columns only, then one pandas
+#                     frame in the compact layout
+#
+#     Kernels mirror the registered pandas steps exactly, so
+#     output is identical to the pandas engine.
+# ============================================================
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.features.elo import _apply_elo_array
+from src.features.elo_rolling import ELO_ROLLING_SPECS
+from src.features.ewma import ewma_features
+from src.features.form import FORM_SPECS
+from src.features.frame_layout import season_dtype, team_dtype
+from src.features.margin_features import MARGIN_SPECS
+from src.features.mirror import gather_opponent, mirror_index
+from src.features.opponent_adjusted import OPPONENT_COLUMNS
+from src.features.profiling import FeatureProfile, profile_stage
+from src.features.registry import BASE_COLUMNS, FeaturePlan
+from src.features.rest import DEFAULT_REST_DAYS
+from src.features.rolling import _STEP_SPECS as ROLLING_STEP_SPECS
+from src.features.rolling_engine import RollingSpec, TeamSegments, rolling_from_values
+from src.features.sos import SOS_FILL, SOS_SPECS
+
+FEATURE_ENGINES = ("pandas", "columnar")
+
+# Columns the scan turns into integer codes / computes itself
+_ENCODED = ("team", "opponent")
+_COMPUTED = ("season",)
+
+
+@dataclass
+class ColumnBatch:
+    """(team, date)-sorted columns plus the shared per-run indexes."""
+
+    columns: dict[str, np.ndarray]
+    teams: pd.CategoricalDtype          # dictionary of team / opponent codes
+    seasons: pd.CategoricalDtype        # dictionary of season codes
+    segments: TeamSegments
+    mirror: np.ndarray
+    input_position: np.ndarray
+
+    # Warm start (see registry.prepare_base_frame)
+    carried: np.ndarray | None = None
+    carried_elo: np.ndarray | None = None
+    initial_elo: dict[str, float] | None = None
+    initial_ewma: dict[str, dict[str, float]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.input_position)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def numeric(self, name: str) -> np.ndarray:
+        """Column (or derived margin / win_flag) as float64, NaN for nulls."""
+        if name in self.columns:
+            return np.asarray(self.columns[name], dtype="float64")
+        if name == "margin":
+            return self.numeric("score") - self.numeric("opp_score")
+        if name == "win_flag":
+            return (self.numeric("score") > self.numeric("opp_score")).astype("float64")
+        raise ValueError(f"Rolling input column not found: '{name}'")
+
+
+# ------------------------------------------------------------
+# Scan: projection + fused (team, date) sort
+# ------------------------------------------------------------
+def _to_numpy(col: pa.ChunkedArray) -> np.ndarray:
+    if pa.types.is_integer(col.type) and col.null_count:
+        col = col.cast(pa.float64())
+    return col.to_numpy()
+
+
+def _names(col: pa.ChunkedArray) -> pa.ChunkedArray:
+    if pa.types.is_dictionary(col.type):
+        col = col.cast(col.type.value_type)
+    return col.cast(pa.string())
+
+
+def scan_long_frame(
+    long_df: pd.DataFrame,
+    columns: list[str],
+    carry_in: pd.DataFrame | None = None,
+    initial_elo: dict[str, float] | None = None,
+    initial_ewma: dict[str, dict[str, float]] | None = None,
+) -> ColumnBatch:
+    """
+    Project `columns` of long_df (plus replayed carry_in rows in
+    front) into Arrow, encode teams on the shared dictionary, and
+    take every column once in (team, date) order.
+    """
+    projected = [c for c in columns if c in long_df.columns]
+    frame = long_df[projected]
+    if carry_in is not None:
+        carry = carry_in[[c for c in projected if c in carry_in.columns] + ["elo"]]
+        frame = pd.concat(
+            [carry.assign(_carried=True), frame.assign(_carried=False)],
+            ignore_index=True,
+        )
+    if not pd.api.types.is_datetime64_any_dtype(frame["date"]):
+        frame = frame.assign(date=pd.to_datetime(frame["date"]))
+
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+
+    names = {c: _names(table[c]) for c in _ENCODED}
+    teams = team_dtype(*(pd.Series(pc.unique(col).to_pylist(), dtype=object) for col in names.values()))
+    dictionary = pa.array(teams.categories.tolist(), type=pa.string())
+    codes = {
+        c: pc.fill_null(pc.index_in(col, value_set=dictionary), -1).cast(pa.int32())
+        for c, col in names.items()
+    }
+
+    order = pc.sort_indices(
+        pa.table({"team": codes["team"], "date": table["date"]}),
+        sort_keys=[("team", "ascending"), ("date", "ascending")],
+    )
+
+    table = table.drop_columns(list(_ENCODED)).append_column(
+        "_input_position", pa.array(np.arange(len(table)))
+    )
+    table = table.take(order)
+
+    cols = {c: _to_numpy(table[c]) for c in table.column_names}
+    for c in _ENCODED:
+        cols[c] = codes[c].take(order).to_numpy()
+
+    input_position = cols.pop("_input_position")
+    years = cols["date"].astype("datetime64[Y]").astype(np.int64) + 1970
+    labels = {y: f"{y}-{y + 1}" for y in np.unique(years).tolist()}
+    seasons = season_dtype(pd.Series(list(labels.values()), dtype=object))
+    uniq = np.array(list(labels), dtype=np.int64)
+    season_codes = seasons.categories.get_indexer(list(labels.values()))
+    cols["season"] = season_codes[np.searchsorted(uniq, years)] if len(years) else years
+
+    batch = ColumnBatch(
+        columns=cols,
+        teams=teams,
+        seasons=seasons,
+        segments=TeamSegments.from_keys(cols["team"]),
+        mirror=mirror_index(cols["game_id"], cols["team"], cols["opponent"]),
+        input_position=input_position,
+    )
+
+    if carry_in is not None:
+        batch.carried = cols.pop("_carried").astype(bool)
+        batch.carried_elo = cols.pop("elo").astype("float64")
+        batch.initial_elo = initial_elo or {}
+        batch.initial_ewma = initial_ewma or {}
+
+    return batch
+
+
+# ------------------------------------------------------------
+# Kernels (one per registered step)
+# ------------------------------------------------------------
+COLUMNAR_KERNELS: dict[str, Callable[[ColumnBatch, frozenset], dict]] = {}
+
+
+def columnar_kernel(*steps: str):
+    def decorator(func):
+        for name in steps:
+            COLUMNAR_KERNELS[name] = func
+        return func
+    return decorator
+
+
+def _rolling(batch: ColumnBatch, specs: list[RollingSpec], wanted: frozenset) -> dict:
+    specs = [s for s in specs if s.name in wanted]
+    return rolling_from_values(batch.numeric, specs, batch.segments)
+
+
+@columnar_kernel("elo")
+def _elo_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    frame = pd.DataFrame(
+        {c: batch[c] for c in ("game_id", "team", "opponent", "date", "score", "opp_score")}
+    )
+    if batch.carried is None:
+        run = _apply_elo_array(frame, order_key=batch.input_position, mirror=batch.mirror)
+        return {"elo": run.elo, "opp_elo": run.opp_elo}
+
+    live = ~batch.carried
+    code = {name: i for i, name in enumerate(batch.teams.categories)}
+    run = _apply_elo_array(
+        frame[live],
+        initial={code[t]: r for t, r in batch.initial_elo.items() if t in code},
+        order_key=batch.input_position[live],
+    )
+    elo = batch.carried_elo.copy()
+    opp_elo = np.full(len(batch), np.nan)
+    elo[live] = run.elo
+    opp_elo[live] = run.opp_elo
+    return {"elo": elo, "opp_elo": opp_elo}
+
+
+@columnar_kernel("margin")
+def _margin_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    return {"margin": batch.numeric("margin").astype("float32")}
+
+
+@columnar_kernel("margin_rolling")
+def _margin_rolling_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    return _rolling(batch, MARGIN_SPECS, wanted)
+
+
+@columnar_kernel("rolling")
+def _rolling_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    return _rolling(batch, ROLLING_STEP_SPECS, wanted)
+
+
+@columnar_kernel("form")
+def _form_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    return _rolling(batch, FORM_SPECS, wanted)
+
+
+@columnar_kernel("elo_rolling")
+def _elo_rolling_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    return _rolling(batch, ELO_ROLLING_SPECS, wanted)
+
+
+@columnar_kernel("ewma")
+def _ewma_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    row_start = batch.segments.row_start
+    starts = np.unique(row_start)
+    return ewma_features(
+        batch.numeric("score"),
+        batch.numeric("opp_score"),
+        batch["elo"],
+        row_start,
+        batch.teams.categories[batch["team"][starts]].tolist(),
+        wanted,
+        carried=batch.carried,
+        initial_ewma=batch.initial_ewma,
+    )
+
+
+@columnar_kernel("sos")
+def _sos_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    allowed = rolling_from_values(batch.numeric, SOS_SPECS, batch.segments)["opp_points_allowed_roll10"]
+    sos = gather_opponent(allowed, batch.mirror)
+    return {"sos": np.where(np.isnan(sos), SOS_FILL, sos).astype("float32")}
+
+
+@columnar_kernel("rest")
+def _rest_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    dates = batch["date"]
+    first = batch.segments.row_start == np.arange(len(batch))
+    prev = np.r_[dates[:1], dates[:-1]]
+    days = (dates - prev) // np.timedelta64(1, "D")
+    rest_days = np.where(first, DEFAULT_REST_DAYS, days).astype(np.int64)
+    return {"rest_days": rest_days, "is_b2b": (rest_days == 1).astype(np.int64)}
+
+
+@columnar_kernel("win_streak")
+def _win_streak_kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+    pos = np.arange(len(batch))
+    win = batch.numeric("win")
+    prev_win = np.r_[np.nan, win[:-1]]
+    breaks = (batch.segments.row_start == pos) | (prev_win != 1)
+    run_start = np.maximum.accumulate(np.where(breaks, pos, 0)) if len(pos) else pos
+    return {"win_streak": pos - run_start}
+
+
+def _register_opponent_kernel(source: str, target: str) -> None:
+    @columnar_kernel(f"opponent:{target}")
+    def _kernel(batch: ColumnBatch, wanted: frozenset) -> dict:
+        return {target: gather_opponent(batch[source], batch.mirror)}
+
+
+for _source, _target in OPPONENT_COLUMNS.items():
+    _register_opponent_kernel(_source, _target)
+
+
+# ------------------------------------------------------------
+# Execution
+# ------------------------------------------------------------
+def scan_columns(plan: FeaturePlan, output: list[str]) -> list[str]:
+    """Base columns the plan and the output read from the input."""
+    needed = set(output) | {"game_id", "team", "opponent", "date"}
+    for step in plan.steps:
+        needed.update(step.inputs)
+    return [c for c in BASE_COLUMNS if c in needed and c not in _COMPUTED]
+
+
+def run_columnar_plan(
+    batch: ColumnBatch,
+    plan: FeaturePlan,
+    keep: list[str],
+    profile: FeatureProfile | None = None,
+) -> None:
+    """
+    Execute plan levels on the batch (in place). Columns not in
+    `keep` are released once no later level reads them. Each step
+    is timed into `profile` when given.
+    """
+    missing = [s.name for s in plan.steps if s.name not in COLUMNAR_KERNELS]
+    if missing:
+        raise ValueError(f"No columnar kernel for feature steps: {missing}")
+
+    last_use: dict[str, int] = {}
+    for i, level in enumerate(plan.levels):
+        for step in level:
+            for col in step.inputs:
+                last_use[col] = i
+
+    for i, level in enumerate(plan.levels):
+        for step in level:
+            with profile_stage(profile, step.name, rows_in=len(batch)) as timer:
+                produced = COLUMNAR_KERNELS[step.name](batch, frozenset(plan.wanted[step.name]))
+                timer.done(produced)
+            batch.columns.update(produced)
+
+        for col, last in last_use.items():
+            if last == i and col not in keep and col not in _ENCODED and col != "date":
+                batch.columns.pop(col, None)
+
+
+def to_frame(batch: ColumnBatch, columns: list[str]) -> pd.DataFrame:
+    """Decode the requested columns into a pandas frame (carried rows dropped)."""
+    rows = slice(None) if batch.carried is None else ~batch.carried
+
+    data = {}
+    for col in columns:
+        values = batch[col][rows]
+        if col in _ENCODED:
+            values = pd.Categorical.from_codes(values, dtype=batch.teams)
+        elif col == "season":
+            values = pd.Categorical.from_codes(values, dtype=batch.seasons)
+        data[col] = values
+    return pd.DataFrame(data)
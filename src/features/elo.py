@@ -14,12 +14,27 @@
 #     Produces:
 #         - elo (pre-game)
 #         - opp_elo (opponent pre-game)
+#
+#     Two interchangeable engines are available:
+#         - "loop":  reference implementation (itertuples + dict)
+#         - "array": integer-encoded teams, one iteration per
+#                    game, opponent Elo gathered without a merge
 # ============================================================
 
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 
+from src.features.mirror import build_mirror_index, gather_opponent
+from src.features.registry import feature_step
+
+ELO_INITIAL = 1500.0
+ELO_K = 20.0
+ELO_ENGINES = ("loop", "array")
+
 
-def _apply_elo(df: pd.DataFrame, k: float = 20.0) -> pd.Series:
+def _apply_elo(df: pd.DataFrame, k: float = ELO_K) -> pd.Series:
     """
     Compute pre-game ELO for each team in chronological order.
     Uses canonical columns: score, opp_score.
@@ -27,16 +42,16 @@ def _apply_elo(df: pd.DataFrame, k: float = 20.0) -> pd.Series:
     elo_map = {}  # team -> current ELO
     results = []
 
-    # Sort chronologically to avoid leakage
-    df_sorted = df.sort_values("date")
+    # Sort chronologically to avoid leakage (stable → deterministic ties)
+    df_sorted = df.sort_values("date", kind="mergesort")
 
     for row in df_sorted.itertuples():
         team = row.team
         opp = row.opponent
 
         # Current ratings (default 1500)
-        elo_team = elo_map.get(team, 1500.0)
-        elo_opp = elo_map.get(opp, 1500.0)
+        elo_team = elo_map.get(team, ELO_INITIAL)
+        elo_opp = elo_map.get(opp, ELO_INITIAL)
 
         # Pre-game ELO is the feature
         results.append(elo_team)
@@ -52,14 +67,143 @@ def _apply_elo(df: pd.DataFrame, k: float = 20.0) -> pd.Series:
     return pd.Series(results, index=df_sorted.index)
 
 
-def add_elo_features(df: pd.DataFrame) -> pd.DataFrame:
+# ------------------------------------------------------------
+# Array engine
+# ------------------------------------------------------------
+@dataclass
+class EloRun:
+    """Output of the array engine."""
+
+    elo: np.ndarray                # pre-game rating per row
+    opp_elo: np.ndarray            # opponent pre-game rating per row
+    teams: np.ndarray              # team name per integer code
+    ratings: np.ndarray            # post-run rating per team code
+    day_ends: np.ndarray           # game dates (day resolution), if tracked
+    day_ratings: np.ndarray        # ratings after each date, shape (days, teams)
+
+    def final_ratings(self) -> dict[str, float]:
+        return dict(zip(self.teams.tolist(), self.ratings.tolist()))
+
+
+def _apply_elo_array(
+    df: pd.DataFrame,
+    k: float = ELO_K,
+    initial: dict[str, float] | None = None,
+    track_days: bool = False,
+    order_key: np.ndarray | None = None,
+    mirror: np.ndarray | None = None,
+) -> EloRun:
+    """
+    Array-backed equivalent of _apply_elo.
+
+    Teams are integer-encoded and ratings live in a flat list. Rows are
+    visited in the same stable date order as the loop engine; when a
+    row is visited its mirror row is processed immediately after it,
+    so both sides of a game are handled in one iteration.
+
+    initial:
+        Optional starting ratings (e.g. from TeamState). Teams not
+        present start at ELO_INITIAL.
+    track_days:
+        Record the rating vector at the end of every game date.
+    order_key:
+        Tie-break for rows sharing a date (default: row position).
+        Lets a re-sorted frame keep the visit order of its input.
+    mirror:
+        Precomputed opponent row index for df's row order.
+    """
+    n = len(df)
+    initial = initial or {}
+
+    codes, teams = pd.factorize(
+        pd.concat(
+            [pd.Series(list(initial), dtype=object), df["team"], df["opponent"]],
+            ignore_index=True,
+        )
+    )
+    teams = np.asarray(teams, dtype=object)
+    team = codes[len(initial):len(initial) + n].tolist()
+    opp = codes[len(initial) + n:].tolist()
+
+    ratings = [float(initial.get(t, ELO_INITIAL)) for t in teams.tolist()]
+    pre = [0.0] * n
+    done = [False] * n
+
+    score = pd.to_numeric(df["score"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    opp_score = pd.to_numeric(df["opp_score"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    has_result = (~np.isnan(score) & ~np.isnan(opp_score)).tolist()
+    actual = np.where(score > opp_score, 1.0, np.where(score == opp_score, 0.5, 0.0)).tolist()
+
+    if mirror is None:
+        mirror = build_mirror_index(df)
+    mirror_list = mirror.tolist()
+
+    dates = pd.to_datetime(df["date"])
+    days = dates.dt.normalize().to_numpy()
+    if order_key is None:
+        order = np.argsort(dates.to_numpy(), kind="stable").tolist()
+    else:
+        order = np.lexsort((order_key, dates.to_numpy())).tolist()
+
+    day_ends: list = []
+    day_ratings: list[list[float]] = []
+
+    for i in order:
+        if done[i]:
+            continue
+
+        if track_days and (not day_ends or days[i] != day_ends[-1]):
+            if day_ends:
+                day_ratings.append(list(ratings))
+            day_ends.append(days[i])
+
+        j = mirror_list[i]
+        for r in (i,) if j < 0 else (i, j):
+            t = team[r]
+            rt = ratings[t]
+            pre[r] = rt
+            done[r] = True
+
+            if has_result[r]:
+                expected = 1.0 / (1.0 + 10 ** ((ratings[opp[r]] - rt) / 400))
+                ratings[t] = rt + k * (actual[r] - expected)
+
+    if day_ends:
+        day_ratings.append(list(ratings))
+
+    elo = np.asarray(pre, dtype="float64")
+    opp_elo = gather_opponent(elo, mirror)
+
+    return EloRun(
+        elo=elo,
+        opp_elo=opp_elo,
+        teams=teams,
+        ratings=np.asarray(ratings, dtype="float64"),
+        day_ends=np.asarray(day_ends, dtype="datetime64[ns]"),
+        day_ratings=np.asarray(day_ratings, dtype="float64").reshape(len(day_ends), len(teams)),
+    )
+
+
+def add_elo_features(df: pd.DataFrame, engine: str = "array") -> pd.DataFrame:
     """
     Adds:
         - elo: pre-game ELO for each team
         - opp_elo: opponent's pre-game ELO
+
+    engine:
+        "array" (default) or "loop" (reference implementation).
     """
+    if engine not in ELO_ENGINES:
+        raise ValueError(f"Unknown ELO engine '{engine}'. Expected one of {ELO_ENGINES}.")
+
     out = df.copy()
 
+    if engine == "array":
+        run = _apply_elo_array(out)
+        out["elo"] = run.elo
+        out["opp_elo"] = run.opp_elo
+        return out.reset_index(drop=True)
+
     # Compute pre-game ELO
     out["elo"] = _apply_elo(out)
 
@@ -72,3 +216,29 @@ def add_elo_features(df: pd.DataFrame) -> pd.DataFrame:
     out = out.merge(opp_elo, on=["game_id", "opponent"], how="left")
 
     return out
+
+
+@feature_step(
+    "elo",
+    inputs=("game_id", "team", "opponent", "date", "score", "opp_score"),
+    outputs=("elo", "opp_elo"),
+)
+def _elo_step(df, ctx, wanted):
+    # Rows are (team, date)-sorted here; keep the input's visit order
+    if ctx.carried is None:
+        run = _apply_elo_array(df, order_key=ctx.input_position, mirror=ctx.mirror)
+        return {"elo": run.elo, "opp_elo": run.opp_elo}
+
+    # Warm start: replayed rows keep their stored Elo, live rows
+    # continue from the carried-in ratings
+    live = ~ctx.carried
+    run = _apply_elo_array(
+        df[live],
+        initial=ctx.initial_elo,
+        order_key=ctx.input_position[live],
+    )
+    elo = ctx.carried_elo.copy()
+    opp_elo = np.full(len(df), np.nan)
+    elo[live] = run.elo
+    opp_elo[live] = run.opp_elo
+    return {"elo": elo, "opp_elo": opp_elo}
@@ -14,6 +14,14 @@
 
 import pandas as pd
 
+from src.features.registry import feature_step
+from src.features.rolling_engine import RollingSpec, add_rolling, compute_rolling, sort_team_frame
+
+ELO_ROLLING_SPECS = [
+    RollingSpec("elo_roll5", "elo", 5),
+    RollingSpec("elo_roll10", "elo", 10),
+]
+
 
 def add_elo_rolling_features(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -36,28 +44,17 @@ def add_elo_rolling_features(df: pd.DataFrame) -> pd.DataFrame:
     if missing:
         raise ValueError(f"add_elo_rolling_features missing columns: {missing}")
 
-    # Ensure proper ordering
-    out = out.sort_values(["team", "date"]).reset_index(drop=True)
-
-    grouped = out.groupby("team")
+    # Ensure proper ordering (no-op if already sorted)
+    out = sort_team_frame(out)
 
     # Leakage-safe rolling ELO (shift → rolling → mean)
-    out["elo_roll5"] = (
-        grouped["elo"]
-        .shift(1)
-        .rolling(window=5, min_periods=1)
-        .mean()
-        .reset_index(level=0, drop=True)
-        .astype("float32")
-    )
-
-    out["elo_roll10"] = (
-        grouped["elo"]
-        .shift(1)
-        .rolling(window=10, min_periods=1)
-        .mean()
-        .reset_index(level=0, drop=True)
-        .astype("float32")
-    )
-
-    return out
+    return add_rolling(out, ELO_ROLLING_SPECS)
+
+
+@feature_step(
+    "elo_rolling",
+    inputs=("elo",),
+    outputs=tuple(s.name for s in ELO_ROLLING_SPECS),
+)
+def _elo_rolling_step(df, ctx, wanted):
+    return compute_rolling(df, [s for s in ELO_ROLLING_SPECS if s.name in wanted], ctx.segments)
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: ELO Hyperparameter Sweep
+# File: src/features/elo_sweep.py
+# Author: Sadiq
+#
+# Description:
+#     Evaluates a grid of ELO settings in one pass over the
+#     games:
+#         - K-factor
+#         - home-court advantage (rating points)
+#         - season carryover (fraction regressed to the mean
+#           at the first game date of each NBA season: the
+#           snapshot's season column, else infer_season_label)
+#
+#     Ratings are a (settings × teams) array. Games of the same
+#     date that share no team are updated together (one round),
+#     so the loop runs per round, not per game or per setting.
+#
+#     Update order matches the array engine in elo.py: the first
+#     row of a game (in date / input order) is updated first and
+#     its opponent's update sees the new rating. With no home
+#     advantage and no carryover, a setting reproduces
+#     _apply_elo_array(k=K) exactly.
+#
+#     Each setting is scored on the pre-game win probability of
+#     the first row's team: log loss, Brier score, accuracy.
+# ============================================================
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.features.elo import ELO_INITIAL, ELO_K
+from src.features.mirror import build_mirror_index
+from src.ingestion.normalizer.season import infer_season_label
+
+LOG_LOSS_EPS = 1e-15
+
+
+@dataclass(frozen=True)
+class EloSetting:
+    k: float = ELO_K
+    home_advantage: float = 0.0
+    carryover: float = 0.0        # 0 = full carry, 1 = reset to ELO_INITIAL
+
+
+def elo_grid(
+    ks: Iterable[float],
+    home_advantages: Iterable[float] = (0.0,),
+    carryovers: Iterable[float] = (0.0,),
+) -> list[EloSetting]:
+    """Cartesian product of the given values."""
+    return [EloSetting(k, h, c) for k, h, c in product(ks, home_advantages, carryovers)]
+
+
+@dataclass
+class _Games:
+    """One entry per game, in engine visit order."""
+
+    first: np.ndarray          # team code of the row visited first
+    second: np.ndarray         # its opponent's team code
+    paired: np.ndarray         # opponent row present (second team is updated)
+    home_sign: np.ndarray      # +1 first team at home, -1 away, 0 neutral
+    actual: np.ndarray         # first team's result (1 / 0.5 / 0)
+    has_result: np.ndarray
+    rounds: list[np.ndarray]   # game indices updated together
+    season_start: list[bool]   # round opens a new season
+    teams: np.ndarray
+
+
+def _rounds_for_day(first: np.ndarray, second: np.ndarray) -> list[np.ndarray]:
+    """Split one date's games so no team appears twice in a round."""
+    n = len(first)
+    teams = np.r_[first, second]
+    if len(np.unique(teams)) == len(teams):
+        return [np.arange(n)]
+
+    last: dict[int, int] = {}
+    round_of = np.empty(n, dtype=np.int64)
+    for g in range(n):
+        r = max(last.get(first[g], -1), last.get(second[g], -1)) + 1
+        round_of[g] = r
+        last[first[g]] = last[second[g]] = r
+    return [np.flatnonzero(round_of == r) for r in range(round_of.max() + 1)]
+
+
+def _nba_seasons(df: pd.DataFrame, dates: pd.Series) -> np.ndarray:
+    """NBA season per row (Oct-Jun), never split at Jan 1."""
+    inferred = dates.dt.date.map(infer_season_label)
+    if "season" not in df.columns:
+        return inferred.to_numpy(dtype=object)
+    season = df["season"].astype("string")
+    return season.where(season.notna(), inferred).to_numpy(dtype=object)
+
+
+def _prepare_games(long_df: pd.DataFrame) -> _Games:
+    df = long_df.reset_index(drop=True)
+    n = len(df)
+
+    codes, teams = pd.factorize(pd.concat([df["team"], df["opponent"]], ignore_index=True))
+    team, opp = codes[:n], codes[n:]
+
+    dates = pd.to_datetime(df["date"])
+    order = np.argsort(dates.to_numpy(), kind="stable")
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n)
+
+    mirror = build_mirror_index(df)
+    paired = mirror >= 0
+    is_first = ~paired | (rank < rank[np.maximum(mirror, 0)])
+    rows = order[is_first[order]]
+
+    score = pd.to_numeric(df["score"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    opp_score = pd.to_numeric(df["opp_score"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    actual = np.where(score > opp_score, 1.0, np.where(score == opp_score, 0.5, 0.0))
+
+    is_home = (
+        pd.to_numeric(df["is_home"], errors="coerce").fillna(0).to_numpy(dtype="float64")
+        if "is_home" in df.columns else np.zeros(n)
+    )
+    partner_home = np.where(paired, is_home[np.maximum(mirror, 0)], 1.0 - is_home)
+    home_sign = is_home - partner_home
+
+    days = dates.dt.normalize().to_numpy()[rows]
+    seasons = _nba_seasons(df, dates)[rows]
+    first, second = team[rows], opp[rows]
+
+    rounds: list[np.ndarray] = []
+    season_start: list[bool] = []
+    bounds = np.flatnonzero(np.r_[True, days[1:] != days[:-1], True])
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        new_season = lo > 0 and seasons[lo] != seasons[lo - 1]
+        for i, idx in enumerate(_rounds_for_day(first[lo:hi], second[lo:hi])):
+            rounds.append(idx + lo)
+            season_start.append(new_season and i == 0)
+
+    return _Games(
+        first=first,
+        second=second,
+        paired=paired[rows],
+        home_sign=home_sign[rows],
+        actual=actual[rows],
+        has_result=(~np.isnan(score) & ~np.isnan(opp_score))[rows],
+        rounds=rounds,
+        season_start=season_start,
+        teams=np.asarray(teams, dtype=object),
+    )
+
+
+def _expected(rating: np.ndarray, opp_rating: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + 10 ** ((opp_rating - rating) / 400))
+
+
+def run_elo_sweep(
+    long_df: pd.DataFrame,
+    settings: Iterable[EloSetting],
+    burn_in: int = 0,
+) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """
+    Run every setting over long_df at once.
+
+    burn_in:
+        Number of leading games (with results) left out of the
+        metrics while ratings settle.
+
+    Returns:
+        (metrics frame with one row per setting in input order,
+         final ratings of shape (settings, teams), team names)
+    """
+    settings = list(settings)
+    if not settings:
+        raise ValueError("run_elo_sweep needs at least one EloSetting.")
+
+    games = _prepare_games(long_df)
+    k = np.array([s.k for s in settings])[:, None]
+    home = np.array([s.home_advantage for s in settings])[:, None]
+    carry = np.array([s.carryover for s in settings])[:, None]
+
+    ratings = np.full((len(settings), len(games.teams)), ELO_INITIAL)
+    prob = np.full((len(settings), len(games.first)), np.nan)
+
+    for idx, new_season in zip(games.rounds, games.season_start):
+        if new_season:
+            ratings -= carry * (ratings - ELO_INITIAL)
+
+        t1, t2 = games.first[idx], games.second[idx]
+        h = home * games.home_sign[idx]
+        r1, r2 = ratings[:, t1], ratings[:, t2]
+
+        e1 = _expected(r1 + h, r2)
+        prob[:, idx] = e1
+
+        done = games.has_result[idx]
+        a1 = games.actual[idx]
+        new1 = np.where(done, r1 + k * (a1 - e1), r1)
+        ratings[:, t1] = new1
+
+        # Opponent row: its expectation sees the updated rating (engine order)
+        pair = games.paired[idx] & done
+        if pair.any():
+            e2 = _expected(r2[:, pair] - h[:, pair], new1[:, pair])
+            ratings[:, t2[pair]] = r2[:, pair] + k * ((1.0 - a1[pair]) - e2)
+
+    scored = np.flatnonzero(games.has_result)[burn_in:]
+    actual = games.actual[scored]
+    p = np.clip(prob[:, scored], LOG_LOSS_EPS, 1 - LOG_LOSS_EPS)
+
+    metrics = pd.DataFrame(
+        {
+            "k": [s.k for s in settings],
+            "home_advantage": [s.home_advantage for s in settings],
+            "carryover": [s.carryover for s in settings],
+            "log_loss": -(actual * np.log(p) + (1 - actual) * np.log(1 - p)).mean(axis=1),
+            "brier": ((p - actual) ** 2).mean(axis=1),
+            "accuracy": ((p > 0.5) == (actual > 0.5)).mean(axis=1),
+            "games": len(scored),
+        }
+    )
+    return metrics, ratings, games.teams
+
+
+def sweep_elo(
+    long_df: pd.DataFrame,
+    settings: Iterable[EloSetting],
+    burn_in: int = 0,
+) -> pd.DataFrame:
+    """
+    Log loss, Brier score and accuracy for every setting, best
+    (lowest log loss) first.
+    """
+    settings = list(settings)
+    metrics, _, _ = run_elo_sweep(long_df, settings, burn_in=burn_in)
+    metrics = metrics.sort_values(["log_loss", "brier"], kind="mergesort").reset_index(drop=True)
+
+    best = metrics.iloc[0]
+    logger.info(
+        f"🎯 [EloSweep] {len(settings)} settings over {int(best['games'])} games — best: "
+        f"K={best['k']}, home={best['home_advantage']}, carryover={best['carryover']} "
+        f"(log loss {best['log_loss']:.4f}, Brier {best['brier']:.4f})"
+    )
+    return metrics
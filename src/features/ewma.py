@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: EWMA Team Form
+# File: src/features/ewma.py
+# Author: Sadiq
+#
+# Description:
+#     Exponentially weighted team form at several half-lives:
+#         - points for / against
+#         - margin
+#         - win rate
+#         - Elo change per game
+#
+#     Each (stat, half-life) is a single float of state per
+#     team, so a game updates it in O(1) both here (batch) and
+#     in TeamState.push (incremental serving):
+#
+#         m ← x                        (first game)
+#         m ← (1 − α)·m + α·x          α = 1 − 0.5^(1 / half_life)
+#
+#     Features are pre-game (the current game is excluded) and
+#     only completed games update the state. Batch and
+#     incremental updates use the same arithmetic, so warm-started
+#     builds match a full build exactly.
+# ============================================================
+
+import numpy as np
+import pandas as pd
+
+from src.features.registry import feature_step
+
+EWMA_HALF_LIVES = (5, 10, 20)
+EWMA_STATS = ("points_for", "points_against", "margin", "win_rate", "elo_delta")
+
+EWMA_COLUMNS = tuple(f"ewma_{stat}_hl{h}" for stat in EWMA_STATS for h in EWMA_HALF_LIVES)
+_STAT_OF = {f"ewma_{stat}_hl{h}": stat for stat in EWMA_STATS for h in EWMA_HALF_LIVES}
+_HALF_LIFE_OF = {f"ewma_{stat}_hl{h}": h for stat in EWMA_STATS for h in EWMA_HALF_LIVES}
+
+
+def ewma_alpha(half_life: float) -> float:
+    """Smoothing factor giving an observation half weight after half_life games."""
+    if half_life <= 0:
+        raise ValueError(f"EWMA half-life must be positive, got {half_life}")
+    return 1.0 - 0.5 ** (1.0 / half_life)
+
+
+EWMA_ALPHAS = {col: ewma_alpha(_HALF_LIFE_OF[col]) for col in EWMA_COLUMNS}
+
+
+# ------------------------------------------------------------
+# Scalar update (TeamState)
+# ------------------------------------------------------------
+def game_observation(score: float, opp_score: float, elo_delta: float) -> dict[str, float]:
+    """Per-stat values one completed game contributes."""
+    score, opp_score = float(score), float(opp_score)
+    return {
+        "points_for": score,
+        "points_against": opp_score,
+        "margin": score - opp_score,
+        "win_rate": 1.0 if score > opp_score else 0.0,
+        "elo_delta": float(elo_delta),
+    }
+
+
+def ewma_update(state: float, x: float, alpha: float) -> float:
+    if np.isnan(x):
+        return state
+    if np.isnan(state):
+        return x
+    return (1.0 - alpha) * state + alpha * x
+
+
+def update_ewma_state(ewma: dict[str, float], observation: dict[str, float]) -> None:
+    """Fold one game into a team's {column: value} state (in place)."""
+    for col in EWMA_COLUMNS:
+        ewma[col] = ewma_update(ewma.get(col, np.nan), observation[_STAT_OF[col]], EWMA_ALPHAS[col])
+
+
+# ------------------------------------------------------------
+# Batch (team, date)-sorted arrays
+# ------------------------------------------------------------
+def observation_matrix(
+    score: np.ndarray,
+    opp_score: np.ndarray,
+    elo_delta: np.ndarray,
+    columns: tuple[str, ...] = EWMA_COLUMNS,
+    skip: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    (rows, columns) observations; NaN where a row is not a
+    completed game or is flagged in `skip`.
+    """
+    score = np.asarray(score, dtype="float64")
+    opp_score = np.asarray(opp_score, dtype="float64")
+    played = ~np.isnan(score) & ~np.isnan(opp_score)
+    if skip is not None:
+        played &= ~skip
+
+    stats = {
+        "points_for": score,
+        "points_against": opp_score,
+        "margin": score - opp_score,
+        "win_rate": (score > opp_score).astype("float64"),
+        "elo_delta": np.asarray(elo_delta, dtype="float64"),
+    }
+    out = np.empty((len(score), len(columns)))
+    for i, col in enumerate(columns):
+        out[:, i] = np.where(played, stats[_STAT_OF[col]], np.nan)
+    return out
+
+
+def next_game_delta(elo: np.ndarray, row_start: np.ndarray, final: np.ndarray | None = None) -> np.ndarray:
+    """
+    Elo change of each row's game: the team's next pre-game rating
+    minus this one. A team's last row uses `final` (its rating
+    after that game) when given, NaN otherwise.
+    """
+    elo = np.asarray(elo, dtype="float64")
+    n = len(elo)
+    pos = np.arange(n)
+    last = np.r_[row_start[1:] != row_start[:-1], True] if n else np.zeros(0, dtype=bool)
+    nxt = np.where(last, pos, np.minimum(pos + 1, max(n - 1, 0)))
+    after = elo[nxt] if n else elo
+    if final is None:
+        after = np.where(last, np.nan, after)
+    else:
+        after = np.where(last, final, after)
+    return after - elo
+
+
+def ewma_sweep(
+    values: np.ndarray,
+    row_start: np.ndarray,
+    columns: tuple[str, ...] = EWMA_COLUMNS,
+    initial: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Run the recursion over every team at once.
+
+    values:
+        (rows, columns) observations of a (team, date)-sorted frame.
+    initial:
+        (teams, columns) state before each team's first row, in
+        segment order (NaN = no history).
+
+    Returns (pre, post): state before and after each row.
+    """
+    n = len(values)
+    alphas = np.array([EWMA_ALPHAS[c] for c in columns])
+    pre = np.empty_like(values)
+    post = np.empty_like(values)
+    if n == 0:
+        return pre, post
+
+    pos = np.arange(n)
+    first = row_start == pos
+    segment = np.cumsum(first) - 1
+    state = np.full((int(first.sum()), len(columns)), np.nan) if initial is None else initial.copy()
+
+    # Step k updates every team's k-th row together
+    k = pos - row_start
+    order = np.argsort(k, kind="stable")
+    bounds = np.searchsorted(k[order], np.arange(k.max() + 2))
+
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        idx = order[lo:hi]
+        seg = segment[idx]
+        cur = state[seg]
+        x = values[idx]
+        new = np.where(np.isnan(cur), x, (1.0 - alphas) * cur + alphas * x)
+        new = np.where(np.isnan(x), cur, new)
+        pre[idx] = cur
+        post[idx] = new
+        state[seg] = new
+
+    return pre, post
+
+
+def initial_matrix(
+    teams: list[str],
+    initial_ewma: dict[str, dict[str, float]] | None,
+    columns: tuple[str, ...] = EWMA_COLUMNS,
+) -> np.ndarray:
+    """(teams, columns) carried-in state, NaN where a team has none."""
+    initial_ewma = initial_ewma or {}
+    return np.array(
+        [[initial_ewma.get(t, {}).get(c, np.nan) for c in columns] for t in teams],
+        dtype="float64",
+    ).reshape(len(teams), len(columns))
+
+
+def ewma_features(
+    score: np.ndarray,
+    opp_score: np.ndarray,
+    elo: np.ndarray,
+    row_start: np.ndarray,
+    segment_teams: list[str],
+    wanted: frozenset,
+    carried: np.ndarray | None = None,
+    initial_ewma: dict[str, dict[str, float]] | None = None,
+) -> dict:
+    """
+    Pre-game EWMA columns of a (team, date)-sorted frame. Carried
+    (replayed) rows are skipped and the state starts from
+    initial_ewma instead.
+    """
+    columns = tuple(c for c in EWMA_COLUMNS if c in wanted)
+    values = observation_matrix(
+        score, opp_score, next_game_delta(elo, row_start), columns=columns, skip=carried
+    )
+    initial = None if carried is None else initial_matrix(segment_teams, initial_ewma, columns)
+    pre, _ = ewma_sweep(values, row_start, columns=columns, initial=initial)
+    return {c: pre[:, i].astype("float32") for i, c in enumerate(columns)}
+
+
+@feature_step("ewma", inputs=("score", "opp_score", "elo"), outputs=EWMA_COLUMNS)
+def _ewma_step(df, ctx, wanted):
+    row_start = ctx.segments.row_start
+    starts = np.unique(row_start)
+    return ewma_features(
+        pd.to_numeric(df["score"]).to_numpy(dtype="float64", na_value=np.nan),
+        pd.to_numeric(df["opp_score"]).to_numpy(dtype="float64", na_value=np.nan),
+        df["elo"].to_numpy(dtype="float64"),
+        row_start,
+        [str(t) for t in df["team"].to_numpy()[starts]],
+        wanted,
+        carried=ctx.carried,
+        initial_ewma=ctx.initial_ewma,
+    )
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Feature Cache
+# File: src/features/feature_cache.py
+# Author: Sadiq
+#
+# Description:
+#     Content-addressed cache of built feature frames.
+#
+#     Key = sha256(input long rows + requested columns +
+#                  feature-code version)
+#
+#     Two tiers, both LRU:
+#         - memory: the last few frames of this process
+#         - disk:   parquet files under FEATURE_CACHE_DIR,
+#                   bounded by total bytes, read memory-mapped
+#
+#     Any change to the input rows or to the source of a module
+#     that contributes a feature step produces a new key, so
+#     entries never need explicit invalidation.
+# ============================================================
+
+import hashlib
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+import pyarrow.parquet as pq
+from loguru import logger
+
+from src.config.paths import FEATURE_CACHE_DIR
+from src.features import feature_pipeline
+from src.features.feature_versions import CORE_FEATURE_MODULES, source_version, step_modules
+
+FEATURE_CACHE_MAX_BYTES = 2 * 1024 ** 3
+FEATURE_CACHE_MEMORY_ENTRIES = 4
+
+
+@lru_cache(maxsize=None)
+def feature_code_version() -> str:
+    """
+    Hash of the source of the pipeline and of every module that
+    registers a feature step.
+    """
+    modules = {feature_pipeline.__name__} | step_modules() | set(CORE_FEATURE_MODULES)
+    modules |= {
+        "src.features.columnar_engine",
+        "src.features.feature_validation",
+        "src.features.feature_schema",
+    }
+    return source_version(modules)
+
+
+def feature_cache_key(long_df: pd.DataFrame, columns: Iterable[str] | None = None) -> str:
+    """Cache key for building `columns` (None = full set) from long_df."""
+    digest = hashlib.sha256()
+    digest.update(feature_code_version().encode())
+    digest.update(repr(None if columns is None else list(columns)).encode())
+    digest.update(repr([(c, str(t)) for c, t in long_df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(long_df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class FeatureCache:
+    """
+    Two-tier LRU cache of feature frames keyed by feature_cache_key.
+    Frames handed out are copies; callers may modify them freely.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = FEATURE_CACHE_DIR,
+        max_bytes: int = FEATURE_CACHE_MAX_BYTES,
+        memory_entries: int = FEATURE_CACHE_MEMORY_ENTRIES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, pd.DataFrame] = OrderedDict()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    # ------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------
+    def get(self, key: str) -> pd.DataFrame | None:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            logger.debug(f"[FeatureCache] Memory hit {key[:12]}")
+            return self._memory[key].copy()
+
+        path = self._path(key)
+        if path.exists():
+            df = pq.read_table(path, memory_map=True).to_pandas()
+            os.utime(path)  # mark as recently used
+            self._remember(key, df)
+            self.stats.disk_hits += 1
+            logger.debug(f"[FeatureCache] Disk hit {key[:12]}")
+            return df.copy()
+
+        self.stats.misses += 1
+        return None
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        self._remember(key, df.copy())
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        temp_path = path.with_suffix(".tmp")
+        df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+
+        self._evict_disk()
+
+    def clear(self) -> None:
+        self._memory.clear()
+        for path in self.cache_dir.glob("*.parquet"):
+            path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------
+    def _remember(self, key: str, df: pd.DataFrame) -> None:
+        self._memory[key] = df
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        entries = []
+        for path in self.cache_dir.glob("*.parquet"):
+            st = path.stat()
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._memory.pop(path.stem, None)
+            total -= size
+            self.stats.evictions += 1
+            logger.debug(f"[FeatureCache] Evicted {path.name}")
+
+
+_default_cache: FeatureCache | None = None
+
+
+def default_feature_cache() -> FeatureCache:
+    """Process-wide cache shared by FeatureBuilder instances."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = FeatureCache()
+    return _default_cache
@@ -11,114 +11,558 @@
 #     Produces model‑ready rows validated by FeatureRow.
 # ============================================================
 
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 from loguru import logger
 
-from src.config.paths import FEATURES_SNAPSHOT
+from src.config.paths import LONG_SNAPSHOT
+
+from src.features.columnar_engine import (
+    FEATURE_ENGINES,
+    run_columnar_plan,
+    scan_columns,
+    scan_long_frame,
+    to_frame,
+)
 from src.features.feature_schema import FeatureRow
+from src.features.feature_store import FeatureStore, season_input_hashes
+from src.features.feature_validation import validate_feature_frame
+from src.features.feature_versions import feature_module_versions, stale_columns
+from src.features.frame_layout import MemoryReport, compact_feature_frame
+from src.features.profiling import FeatureProfile, profile_stage
+from src.features.registry import (
+    FEATURE_MAX_WORKERS,
+    plan_features,
+    prepare_base_frame,
+    run_plan,
+    season_labels,
+)
+from src.features.team_state import (
+    TeamState,
+    build_team_state,
+    season_start_states,
+    state_context_frame,
+)
+from src.ingestion.long_snapshot_store import long_snapshot_exists
+
+# Feature modules (Pipeline A) — importing registers their steps
+from src.features import (  # noqa: F401
+    elo,
+    elo_rolling,
+    ewma,
+    rolling,
+    form,
+    rest,
+    sos,
+    opponent_adjusted,
+    margin_features,
+    win_streak,
+)
 
-# Feature modules (Pipeline A)
-from src.features.elo import add_elo_features
-from src.features.elo_rolling import add_elo_rolling_features
-from src.features.rolling import add_rolling_features
-from src.features.form import add_form_features
-from src.features.rest import add_rest_features
-from src.features.sos import add_sos_features
-from src.features.opponent_adjusted import add_opponent_adjusted_features
-from src.features.margin_features import add_margin_features
-from src.features.win_streak import add_win_streak
+# Always returned with partial (column-pruned) builds
+IDENTITY_COLUMNS = ["game_id", "team", "opponent", "season", "date", "is_home"]
 
 
 # ------------------------------------------------------------
-# Row-level Pydantic validation
+# Schema validation (columnar, driven by FeatureRow)
 # ------------------------------------------------------------
 def _validate_feature_rows(df: pd.DataFrame) -> pd.DataFrame:
-    validated = []
-
-    for idx, row in df.iterrows():
-        try:
-            model = FeatureRow(**row.to_dict())
-            validated.append(model.model_dump())
-        except Exception as e:
-            logger.error(f"❌ Feature validation error at row {idx}: {e}")
-            logger.error(f"Row contents: {row.to_dict()}")
-            raise
-
-    return pd.DataFrame(validated)
+    return validate_feature_frame(df)
 
 
 # ------------------------------------------------------------
 # Main pipeline
 # ------------------------------------------------------------
-def build_features(long_df: pd.DataFrame, persist: bool = False) -> pd.DataFrame:
+def build_features(
+    long_df: pd.DataFrame,
+    persist: bool = False,
+    columns: Iterable[str] | None = None,
+    max_workers: int = FEATURE_MAX_WORKERS,
+    states: dict[str, TeamState] | None = None,
+    processes: int = 1,
+    memory_report: MemoryReport | None = None,
+    engine: str = "pandas",
+    profile: FeatureProfile | None = None,
+) -> pd.DataFrame:
+    """
+    Build features from canonical long-format rows.
+
+    columns:
+        None builds, validates (and optionally persists) the full
+        FeatureRow matrix. A column list runs only the steps needed
+        for those columns and returns them with IDENTITY_COLUMNS,
+        unvalidated (e.g. FEATURE_MAP["moneyline"]). Both use the
+        compact layout of frame_layout.
+    max_workers:
+        Threads for independent steps of the same DAG level.
+    states:
+        Per-team state as of just before long_df (warm start). Window
+        features and Elo continue from it instead of from scratch.
+    processes:
+        > 1 shards the rows by season across a process pool (see
+        _build_season_shards). Output is identical to a serial build.
+    memory_report:
+        Optional MemoryReport filled with bytes per row at each stage.
+    engine:
+        "pandas" runs the registered steps on one shared frame;
+        "columnar" runs the same plan on Arrow / numpy columns
+        (columnar_engine). Output is identical.
+    profile:
+        Optional FeatureProfile filled with wall / CPU time, peak RSS
+        growth, rows and bytes of every step and stage (base frame,
+        each feature step, validation, persist). Write it with
+        profile.write() to track builds over time.
+    """
+    if engine not in FEATURE_ENGINES:
+        raise ValueError(f"Unknown feature engine '{engine}'. Expected one of {FEATURE_ENGINES}.")
+
+    full = columns is None
+    if persist and not full:
+        raise ValueError("persist=True requires the full feature set (columns=None).")
+
+    requested = list(FeatureRow.model_fields) if full else list(columns)
     logger.info(f"🚀 Building features for {len(long_df)} team-game rows...")
 
-    df = long_df.copy()
+    if memory_report is not None:
+        memory_report.record("input", long_df)
 
-    # --------------------------------------------------------
-    # Ensure datetime + season
-    # --------------------------------------------------------
-    df["date"] = pd.to_datetime(df["date"])
-    df["season"] = (
-        df["date"].dt.year.astype(str)
-        + "-"
-        + (df["date"].dt.year + 1).astype(str)
-    )
+    started = time.perf_counter()
+    with profile.session() if profile is not None else nullcontext():
+        if processes > 1 and states is None:
+            with profile_stage(profile, "season shards", rows_in=len(long_df)) as timer:
+                df = _build_season_shards(long_df, columns, max_workers, processes, engine)
+                timer.done(df)
+        elif engine == "columnar":
+            df = _compute_features_columnar(long_df, requested, full, states, memory_report, profile)
+        else:
+            df = _compute_features(long_df, requested, full, max_workers, states, memory_report, profile)
 
-    # --------------------------------------------------------
-    # 1. Base Elo
-    # --------------------------------------------------------
-    logger.info("📌 Step 1: Base Elo features")
-    df = add_elo_features(df)
+        # --------------------------------------------------------
+        # 4. Persist snapshot
+        # --------------------------------------------------------
+        if persist:
+            store = FeatureStore()
+            with profile_stage(profile, "persist", rows_in=len(df)) as timer:
+                _write_full_snapshot(store, df, long_df)
+                timer.done(df)
+            logger.success(f"💾 Features persisted → {store.root}")
 
-    # --------------------------------------------------------
-    # 2. Basic rolling stats
-    # --------------------------------------------------------
-    logger.info("📌 Step 2: Basic rolling features")
-    df = add_rolling_features(df)
+    if profile is not None:
+        profile.meta.update(
+            rows=len(long_df),
+            engine=engine,
+            columns="full" if full else len(requested),
+            processes=processes,
+            warm_start=states is not None,
+            wall_s=time.perf_counter() - started,
+        )
+
+    if memory_report is not None:
+        memory_report.record("output", df)
+
+    if not full:
+        return df
+
+    logger.success(f"🎉 Feature pipeline complete! Final shape: {df.shape}")
+    return df
 
-    # Rename win_rolling_10 → team_win_pct_last10
-    df.rename(columns={"win_rolling_10": "team_win_pct_last10"}, inplace=True)
 
+def _compute_features(
+    long_df: pd.DataFrame,
+    requested: list[str],
+    full: bool,
+    max_workers: int,
+    states: dict[str, TeamState] | None,
+    memory_report: MemoryReport | None = None,
+    profile: FeatureProfile | None = None,
+) -> pd.DataFrame:
     # --------------------------------------------------------
-    # 3. Win streak
+    # 1. Base frame: datetime + season, one (team, date) sort,
+    #    shared team segments + opponent mirror index
     # --------------------------------------------------------
-    df = add_win_streak(df)
+    with profile_stage(profile, "base frame", rows_in=len(long_df)) as timer:
+        if states is None:
+            df, ctx = prepare_base_frame(long_df)
+        else:
+            df, ctx = prepare_base_frame(
+                long_df,
+                carry_in=state_context_frame(states),
+                initial_elo={t: st.elo for t, st in states.items()},
+                initial_ewma={t: st.ewma for t, st in states.items()},
+            )
+        timer.done(df)
+
+    if memory_report is not None:
+        memory_report.record("base frame", df)
 
     # --------------------------------------------------------
-    # 4. Advanced rolling (Elo + margin)
+    # 2. Plan + run the feature DAG
     # --------------------------------------------------------
-    logger.info("📌 Step 3: Advanced rolling features")
-    df = add_elo_rolling_features(df)
-    df = add_margin_features(df)
+    plan = plan_features(requested)
+    for i, level in enumerate(plan.levels):
+        logger.info(f"📌 Level {i + 1}: {', '.join(s.name for s in level)}")
+
+    df = run_plan(df, ctx, plan, max_workers=max_workers, profile=profile)
+    if ctx.carried is not None:
+        df = df[~ctx.carried].reset_index(drop=True)
+
+    if memory_report is not None:
+        memory_report.record("features", df)
+
+    if not full:
+        keep = IDENTITY_COLUMNS + [c for c in requested if c not in IDENTITY_COLUMNS]
+        df = compact_feature_frame(df[keep].copy())
+        logger.success(f"🎉 Partial feature build complete! Shape: {df.shape}")
+        return df
 
     # --------------------------------------------------------
-    # 5. Contextual features
+    # 3. Schema validation
     # --------------------------------------------------------
-    logger.info("📌 Step 4: Contextual features")
-    df = add_rest_features(df)
-    df = add_form_features(df)
-    df = add_sos_features(df)
+    return _validate_profiled(df, profile)
+
+
+def _validate_profiled(df: pd.DataFrame, profile: FeatureProfile | None) -> pd.DataFrame:
+    logger.info("📌 Validating feature schema...")
+    with profile_stage(profile, "validation", rows_in=len(df)) as timer:
+        out = _validate_feature_rows(df)
+        timer.done(out)
+    return out
+
+
+def _compute_features_columnar(
+    long_df: pd.DataFrame,
+    requested: list[str],
+    full: bool,
+    states: dict[str, TeamState] | None,
+    memory_report: MemoryReport | None = None,
+    profile: FeatureProfile | None = None,
+) -> pd.DataFrame:
+    plan = plan_features(requested)
+    keep = requested if full else IDENTITY_COLUMNS + [c for c in requested if c not in IDENTITY_COLUMNS]
 
     # --------------------------------------------------------
-    # 6. Opponent-adjusted features
+    # 1. Scan: projected base columns, one fused sort
     # --------------------------------------------------------
-    logger.info("📌 Step 5: Opponent-adjusted features")
-    df = add_opponent_adjusted_features(df)
+    with profile_stage(profile, "scan", rows_in=len(long_df)) as timer:
+        if states is None:
+            batch = scan_long_frame(long_df, scan_columns(plan, keep))
+        else:
+            batch = scan_long_frame(
+                long_df,
+                scan_columns(plan, keep),
+                carry_in=state_context_frame(states),
+                initial_elo={t: st.elo for t, st in states.items()},
+                initial_ewma={t: st.ewma for t, st in states.items()},
+            )
+        timer.done(batch.columns)
 
     # --------------------------------------------------------
-    # 7. Schema validation
+    # 2. Run the plan on columns
     # --------------------------------------------------------
-    logger.info("📌 Step 6: Validating feature schema...")
-    df = _validate_feature_rows(df)
+    for i, level in enumerate(plan.levels):
+        logger.info(f"📌 Level {i + 1} (columnar): {', '.join(s.name for s in level)}")
+    run_columnar_plan(batch, plan, keep, profile=profile)
+
+    df = to_frame(batch, keep)
+    if memory_report is not None:
+        memory_report.record("features", df)
+
+    if not full:
+        df = compact_feature_frame(df)
+        logger.success(f"🎉 Partial feature build complete! Shape: {df.shape}")
+        return df
 
     # --------------------------------------------------------
-    # 8. Persist snapshot
+    # 3. Schema validation
     # --------------------------------------------------------
-    if persist:
-        FEATURES_SNAPSHOT.parent.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(FEATURES_SNAPSHOT, index=False)
-        logger.success(f"💾 Features persisted → {FEATURES_SNAPSHOT}")
+    return _validate_profiled(df, profile)
 
-    logger.success(f"🎉 Feature pipeline complete! Final shape: {df.shape}")
-    return df
\ No newline at end of file
+
+# ------------------------------------------------------------
+# Season-sharded execution
+# ------------------------------------------------------------
+def _build_shard(args: tuple) -> pd.DataFrame:
+    rows, columns, max_workers, states, engine = args
+    return build_features(rows, columns=columns, max_workers=max_workers, states=states, engine=engine)
+
+
+def _build_season_shards(
+    long_df: pd.DataFrame,
+    columns: Iterable[str] | None,
+    max_workers: int,
+    processes: int,
+    engine: str = "pandas",
+) -> pd.DataFrame:
+    """
+    Build contiguous blocks of seasons in a process pool (one block
+    per process).
+
+    A sequential pre-pass (season_start_states: one Elo sweep plus
+    vectorized slicing) produces every team's state at the start of
+    each season: Elo rating, trailing score/win/Elo windows, last game
+    date and win streak. Each block is then a warm-started build from
+    the state at its first season, and the blocks are stitched back
+    into (team, date) order.
+
+    Like every state-based build, this assumes earlier seasons hold
+    completed games only.
+    """
+    input_seasons = season_labels(long_df["date"])
+    seasons = sorted(input_seasons.unique())
+    columns = None if columns is None else list(columns)
+
+    if len(seasons) < 2:
+        return _build_shard((long_df, columns, max_workers, None, engine))
+
+    starts = season_start_states(long_df)
+    blocks = [b.tolist() for b in np.array_split(np.asarray(seasons), min(processes, len(seasons)))]
+    shards = [
+        (long_df[input_seasons.isin(block)], columns, max_workers, starts[block[0]] if i else None, engine)
+        for i, block in enumerate(blocks)
+    ]
+
+    logger.info(f"🧩 Building {len(seasons)} seasons in {len(shards)} shards...")
+    with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+        parts = list(pool.map(_build_shard, shards))
+
+    # Shards carry their own dictionaries; restore the shared layout
+    df = compact_feature_frame(pd.concat(parts, ignore_index=True))
+    return df.sort_values(["team", "date"], kind="mergesort").reset_index(drop=True)
+
+
+# ------------------------------------------------------------
+# Streaming (chunked) execution
+# ------------------------------------------------------------
+CHUNK_MODES = {"season": "Y", "month": "M"}
+
+
+def _chunk_label(period: pd.Period, chunks_by: str) -> str:
+    if chunks_by == "season":
+        return f"{period.year}-{period.year + 1}"
+    return period.strftime("%Y-%m")
+
+
+def _date_scalar(ts: pd.Timestamp, field_type: pa.DataType) -> pa.Scalar:
+    if pa.types.is_date(field_type):
+        return pa.scalar(ts.date(), type=field_type)
+    return pa.scalar(ts.to_pydatetime(), type=field_type)
+
+
+def iter_features(
+    source: Path = LONG_SNAPSHOT,
+    chunks_by: str = "season",
+    columns: Iterable[str] | None = None,
+    max_workers: int = FEATURE_MAX_WORKERS,
+    engine: str = "pandas",
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    Stream features from a long-format parquet snapshot (file or
+    directory) chunk by chunk, in date order:
+
+        for label, features in iter_features(chunks_by="month"):
+            ...
+
+    Only the date column is read up front; each chunk is then a
+    date-range scan pushed down to parquet, built warm-started from
+    the per-team state of the chunks before it, and dropped once
+    yielded. Memory is bounded by the largest chunk plus team state,
+    whatever the length of the history. The concatenated chunks
+    equal build_features on the whole snapshot.
+
+    chunks_by:
+        "season" (calendar-year season labels, as in season_labels)
+        or "month" ("YYYY-MM").
+    columns:
+        As in build_features (None = full validated FeatureRow set).
+
+    Like every state-based build, this assumes earlier chunks hold
+    completed games only.
+    """
+    if chunks_by not in CHUNK_MODES:
+        raise ValueError(f"Unknown chunks_by '{chunks_by}'. Expected one of {list(CHUNK_MODES)}.")
+
+    if Path(source) == LONG_SNAPSHOT:
+        long_snapshot_exists()  # splits a legacy single-file snapshot first
+
+    dataset = ds.dataset(source, format="parquet", partitioning="hive")
+    date_type = dataset.schema.field("date").type
+    dates = pd.to_datetime(dataset.to_table(columns=["date"]).column("date").to_pandas())
+    periods = sorted(dates.dt.to_period(CHUNK_MODES[chunks_by]).unique())
+    del dates
+
+    columns = None if columns is None else list(columns)
+    states: dict[str, TeamState] = {}
+
+    for period in periods:
+        label = _chunk_label(period, chunks_by)
+        lo = _date_scalar(period.start_time, date_type)
+        hi = _date_scalar((period + 1).start_time, date_type)
+        rows = dataset.to_table(filter=(ds.field("date") >= lo) & (ds.field("date") < hi)).to_pandas()
+
+        logger.info(f"🌊 [iter_features] {chunks_by}={label}: {len(rows)} rows")
+        features = build_features(
+            rows,
+            columns=columns,
+            max_workers=max_workers,
+            states=states or None,
+            engine=engine,
+        )
+        states = build_team_state(rows, initial=states)
+        yield label, features
+
+
+# ------------------------------------------------------------
+# Season-partitioned snapshot
+# ------------------------------------------------------------
+SPLICE_KEY = ("game_id", "team")
+
+
+def _write_full_snapshot(
+    store: FeatureStore,
+    features: pd.DataFrame,
+    long_df: pd.DataFrame,
+) -> None:
+    """Rewrite every season partition from a full feature build."""
+    hashes = season_input_hashes(long_df)
+    input_seasons = season_labels(long_df["date"])
+
+    manifest = store.load_manifest()
+    manifest["columns"] = list(FeatureRow.model_fields)
+    manifest["module_versions"] = feature_module_versions()
+
+    for season in sorted(set(manifest["seasons"]) - set(hashes)):
+        store.drop_partition(season, manifest)
+
+    states: dict[str, TeamState] = {}
+    for season in sorted(hashes):
+        states = build_team_state(long_df[input_seasons == season], initial=states)
+        rows = features[features["season"] == season].reset_index(drop=True)
+        store.write_partition(season, rows, states, hashes[season], manifest)
+
+    store.save_manifest(manifest)
+
+
+def _splice_columns(
+    store: FeatureStore,
+    long_df: pd.DataFrame,
+    seasons: list[str],
+    columns: list[str],
+    hashes: dict[str, str],
+    manifest: dict,
+) -> None:
+    """
+    Recompute `columns` for the given leading seasons (a partial
+    build: only the steps producing them run) and replace them in
+    the stored partitions. Every other column is kept as stored.
+    End-of-season team state is rebuilt alongside, since it may
+    come from a changed module (e.g. Elo).
+    """
+    input_seasons = season_labels(long_df["date"])
+    in_scope = input_seasons.isin(seasons)
+    rows = long_df[in_scope]
+    row_seasons = input_seasons[in_scope]
+
+    fresh = build_features(rows, columns=columns)
+    fresh.index = pd.MultiIndex.from_arrays([fresh[c].astype(str) for c in SPLICE_KEY])
+
+    states: dict[str, TeamState] = {}
+    for season in seasons:
+        states = build_team_state(rows[row_seasons == season], initial=states)
+
+        stored = store.read(seasons=[season])
+        key = pd.MultiIndex.from_arrays([stored[c].astype(str) for c in SPLICE_KEY])
+        spliced = stored.drop(columns=[c for c in columns if c in stored.columns])
+        for col in columns:
+            spliced[col] = fresh[col].reindex(key).to_numpy()
+
+        store.write_partition(season, validate_feature_frame(spliced), states, hashes[season], manifest)
+
+
+def refresh_feature_snapshot(
+    long_df: pd.DataFrame,
+    store: FeatureStore | None = None,
+) -> list[str]:
+    """
+    Bring the season-partitioned snapshot in line with long_df and
+    the current feature code.
+
+    Seasons whose input hash is unchanged keep their rows. Since
+    Elo, rolling windows, rest days and streaks carry across seasons,
+    the earliest changed season and every season after it are
+    rebuilt, starting from the team state stored with the previous
+    partition.
+
+    Code changes are applied column-wise: the manifest records the
+    version of every feature module (feature_versions), and columns
+    whose producing module changed, new FeatureRow columns, and
+    everything downstream of them are recomputed and spliced into
+    the untouched seasons without rewriting other columns' values.
+
+    Falls back to a full build when there is no usable previous
+    partition or the snapshot cannot be patched column-wise (no
+    recorded versions, or a new column no feature step produces).
+
+    Returns:
+        Seasons that were (re)written.
+    """
+    store = store or FeatureStore()
+    hashes = season_input_hashes(long_df)
+    manifest = store.load_manifest()
+    stored = manifest["seasons"]
+    versions = feature_module_versions()
+
+    changed = [s for s in hashes if stored.get(s, {}).get("input_hash") != hashes[s]]
+    removed = [s for s in stored if s not in hashes]
+    stale = stale_columns(manifest.get("module_versions"), manifest["columns"], versions)
+
+    if not changed and not removed and stale == set():
+        logger.info("✅ [FeatureStore] All season partitions are up to date.")
+        return []
+
+    start = min(changed + removed, default=None)
+    rebuild = [s for s in sorted(hashes) if start is not None and s >= start]
+    previous = [s for s in sorted(hashes) if start is None or s < start]
+
+    unusable = rebuild and (not previous or not store.state_store(previous[-1]).exists())
+    if stale is None or unusable:
+        logger.info("🔁 [FeatureStore] Full rebuild of all season partitions.")
+        features = build_features(long_df)
+        _write_full_snapshot(store, features, long_df)
+        return sorted(hashes)
+
+    spliced: list[str] = []
+    if stale and previous:
+        columns = [c for c in FeatureRow.model_fields if c in stale]
+        logger.info(f"🧬 [FeatureStore] Recomputing {columns} for {previous}")
+        _splice_columns(store, long_df, previous, columns, hashes, manifest)
+        spliced = previous
+
+    if rebuild:
+        logger.info(
+            f"🔁 [FeatureStore] Rebuilding {rebuild} from state of season={previous[-1]}"
+        )
+
+        states = store.state_store(previous[-1]).load()
+        input_seasons = season_labels(long_df["date"])
+
+        for season in removed:
+            store.drop_partition(season, manifest)
+
+        for season in rebuild:
+            season_rows = long_df[input_seasons == season]
+            rows = build_features(season_rows, states=states)
+            states = build_team_state(season_rows, initial=states)
+            store.write_partition(season, rows, states, hashes[season], manifest)
+
+    manifest["columns"] = list(FeatureRow.model_fields)
+    manifest["module_versions"] = versions
+    store.save_manifest(manifest)
+    return spliced + rebuild
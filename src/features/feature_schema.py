@@ -16,6 +16,28 @@
 from pydantic import BaseModel, field_validator
 import pandas as pd
 
+# ------------------------------------------------------------
+# Field groups + bounds (shared by FeatureRow and the columnar
+# validator in feature_validation.py)
+# ------------------------------------------------------------
+IDENTIFIER_FIELDS = ("game_id", "team", "opponent", "season")
+BINARY_FIELDS = ("is_home", "is_b2b", "win")
+WIN_RATE_FIELDS = (
+    "win_rolling_5",
+    "win_rolling_20",
+    "team_win_pct_last10",
+    "opp_win_pct_last10",
+    "ewma_win_rate_hl5",
+    "ewma_win_rate_hl10",
+    "ewma_win_rate_hl20",
+)
+ELO_FIELDS = ("elo", "opp_elo", "elo_roll5", "elo_roll10")
+
+WIN_RATE_RANGE = (0.0, 1.0)
+ELO_RANGE = (500, 3000)
+REST_DAYS_MIN = 0
+SOS_RANGE = (-200, 200)
+
 
 class FeatureRow(BaseModel):
     # --------------------------------------------------------
@@ -79,39 +101,57 @@ class FeatureRow(BaseModel):
     team_win_pct_last10: Optional[float]
     opp_win_pct_last10: Optional[float]
 
+    # --------------------------------------------------------
+    # Exponentially weighted form (ewma.py)
+    # --------------------------------------------------------
+    ewma_points_for_hl5: Optional[float]
+    ewma_points_for_hl10: Optional[float]
+    ewma_points_for_hl20: Optional[float]
+
+    ewma_points_against_hl5: Optional[float]
+    ewma_points_against_hl10: Optional[float]
+    ewma_points_against_hl20: Optional[float]
+
+    ewma_margin_hl5: Optional[float]
+    ewma_margin_hl10: Optional[float]
+    ewma_margin_hl20: Optional[float]
+
+    ewma_win_rate_hl5: Optional[float]
+    ewma_win_rate_hl10: Optional[float]
+    ewma_win_rate_hl20: Optional[float]
+
+    ewma_elo_delta_hl5: Optional[float]
+    ewma_elo_delta_hl10: Optional[float]
+    ewma_elo_delta_hl20: Optional[float]
+
     # --------------------------------------------------------
     # Validators
     # --------------------------------------------------------
-    @field_validator("game_id", "team", "opponent", "season")
+    @field_validator(*IDENTIFIER_FIELDS)
     def validate_non_empty(cls, v):
         if not v or str(v).strip() == "":
             raise ValueError("Identifier fields must be non-empty")
         return v
 
-    @field_validator("is_home", "is_b2b", "win")
+    @field_validator(*BINARY_FIELDS)
     def validate_binary(cls, v):
         if v not in (0, 1):
             raise ValueError(f"Expected binary 0/1, got {v}")
         return v
 
-    @field_validator(
-        "win_rolling_5",
-        "win_rolling_20",
-        "team_win_pct_last10",
-        "opp_win_pct_last10",
-    )
+    @field_validator(*WIN_RATE_FIELDS)
     def validate_win_rate(cls, v):
         if v is None or pd.isna(v):
             return v
-        if not (0.0 <= v <= 1.0):
+        if not (WIN_RATE_RANGE[0] <= v <= WIN_RATE_RANGE[1]):
             raise ValueError(f"Win rate must be in [0,1], got {v}")
         return v
 
-    @field_validator("elo", "opp_elo", "elo_roll5", "elo_roll10")
+    @field_validator(*ELO_FIELDS)
     def validate_elo(cls, v):
         if v is None or pd.isna(v):
             return v
-        if not (500 <= v <= 3000):
+        if not (ELO_RANGE[0] <= v <= ELO_RANGE[1]):
             raise ValueError(f"ELO value out of expected range: {v}")
         return v
 
@@ -119,7 +159,7 @@ def validate_elo(cls, v):
     def validate_rest_days(cls, v):
         if v is None or pd.isna(v):
             return v
-        if v < 0:
+        if v < REST_DAYS_MIN:
             raise ValueError(f"rest_days cannot be negative, got {v}")
         return v
 
@@ -127,6 +167,6 @@ def validate_rest_days(cls, v):
     def validate_sos(cls, v):
         if v is None or pd.isna(v):
             return v
-        if not (-200 <= v <= 200):
+        if not (SOS_RANGE[0] <= v <= SOS_RANGE[1]):
             raise ValueError(f"SOS value out of expected range: {v}")
         return v
\ No newline at end of file
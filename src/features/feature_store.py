@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Feature Store
+# File: src/features/feature_store.py
+# Author: Sadiq
+#
+# Description:
+#     Season-partitioned feature snapshot:
+#
+#         FEATURES_SNAPSHOT/
+#             _manifest.json
+#             season=2023-2024/part-0.parquet
+#             season=2023-2024/_team_state.parquet
+#             ...
+#
+#     The manifest records, per season, a hash of the input
+#     long rows that produced the partition. Each partition also
+#     keeps the per-team state (Elo, ring buffers, streak) as of
+#     the end of that season, so a later season can be rebuilt
+#     from its predecessor without replaying full history.
+#
+#     Files starting with "_" are ignored by parquet readers,
+#     so the directory reads as a plain Hive dataset.
+# ============================================================
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+import pyarrow.dataset as ds
+from loguru import logger
+
+from src.config.paths import FEATURES_SNAPSHOT
+from src.features.feature_schema import FeatureRow
+from src.features.frame_layout import compact_feature_frame
+from src.features.registry import season_labels
+from src.features.team_state import TeamState, TeamStateStore
+
+MANIFEST_NAME = "_manifest.json"
+PARTITION_FILE = "part-0.parquet"
+PARTITION_STATE_FILE = "_team_state.parquet"
+
+# Input columns that determine a season's features
+HASH_COLUMNS = ("game_id", "date", "team", "opponent", "is_home", "score", "opp_score", "win")
+
+
+def season_input_hashes(long_df: pd.DataFrame) -> dict[str, str]:
+    """
+    {season: sha256 of that season's input rows}. Row order does
+    not matter; rows are hashed in (game_id, team) order.
+    """
+    cols = [c for c in HASH_COLUMNS if c in long_df.columns]
+    df = long_df[cols].copy()
+    df["date"] = pd.to_datetime(df["date"])
+    df["season"] = season_labels(df["date"])
+    df = df.sort_values(["game_id", "team"], kind="mergesort")
+
+    hashes = {}
+    for season, g in df.groupby("season", sort=True):
+        row_hashes = pd.util.hash_pandas_object(g[cols], index=False).to_numpy()
+        hashes[season] = hashlib.sha256(row_hashes.tobytes()).hexdigest()
+    return hashes
+
+
+class FeatureStore:
+    """
+    Reader/writer for the season-partitioned feature dataset.
+    """
+
+    def __init__(self, root: Path = FEATURES_SNAPSHOT):
+        self.root = Path(root)
+        self.manifest_path = self.root / MANIFEST_NAME
+
+    # ------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------
+    def partition_dir(self, season: str) -> Path:
+        return self.root / f"season={season}"
+
+    def state_store(self, season: str) -> TeamStateStore:
+        return TeamStateStore(self.partition_dir(season) / PARTITION_STATE_FILE)
+
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    # ------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------
+    def load_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {"columns": [], "seasons": {}}
+        return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    def save_manifest(self, manifest: dict) -> None:
+        manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(temp_path, self.manifest_path)
+
+    def seasons(self) -> list[str]:
+        return sorted(self.load_manifest()["seasons"])
+
+    # ------------------------------------------------------------
+    # Partitions
+    # ------------------------------------------------------------
+    def write_partition(
+        self,
+        season: str,
+        features: pd.DataFrame,
+        states: dict[str, TeamState],
+        input_hash: str,
+        manifest: dict,
+    ) -> None:
+        """
+        Atomically replace one season partition and its end-of-season
+        team state, and record it in `manifest` (not saved here).
+        """
+        part_dir = self.partition_dir(season)
+        part_dir.mkdir(parents=True, exist_ok=True)
+
+        path = part_dir / PARTITION_FILE
+        temp_path = path.with_suffix(".tmp")
+        features.drop(columns=["season"]).to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+
+        self.state_store(season).save(states)
+
+        manifest["seasons"][season] = {
+            "rows": int(len(features)),
+            "input_hash": input_hash,
+            "path": f"{part_dir.name}/{PARTITION_FILE}",
+            "built_at": datetime.now(timezone.utc).isoformat(),
+        }
+        logger.info(f"💾 [FeatureStore] season={season}: {len(features)} rows")
+
+    def drop_partition(self, season: str, manifest: dict) -> None:
+        shutil.rmtree(self.partition_dir(season), ignore_errors=True)
+        manifest["seasons"].pop(season, None)
+        logger.info(f"🗑️ [FeatureStore] Dropped season={season}")
+
+    # ------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------
+    def read(
+        self,
+        seasons: Iterable[str] | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Read the dataset, pushing season and column selection down
+        to the parquet scan. Rows come back in (season, team, date)
+        order in the compact layout (frame_layout).
+        """
+        if not self.exists():
+            raise FileNotFoundError(f"No feature snapshot at {self.root}")
+
+        dataset = ds.dataset(self.root, format="parquet", partitioning="hive")
+
+        scan_columns = None
+        if columns is not None:
+            scan_columns = list(dict.fromkeys(["season", *columns]))
+
+        flt = None
+        if seasons is not None:
+            flt = ds.field("season").isin([str(s) for s in seasons])
+
+        table = dataset.to_table(columns=scan_columns, filter=flt)
+        df = table.to_pandas()
+        df["season"] = df["season"].astype(str)
+        compact_feature_frame(df)
+
+        order = list(FeatureRow.model_fields) if columns is None else scan_columns
+        df = df[[c for c in order if c in df.columns]]
+        sort_by = [c for c in ("season", "team", "date") if c in df.columns]
+        return df.sort_values(sort_by, kind="mergesort").reset_index(drop=True)
+
+
+def load_feature_snapshot(
+    seasons: Iterable[str] | None = None,
+    columns: Iterable[str] | None = None,
+    root: Path = FEATURES_SNAPSHOT,
+) -> pd.DataFrame:
+    """Convenience reader for the canonical feature snapshot."""
+    return FeatureStore(root).read(seasons=seasons, columns=columns)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Columnar Feature Validation
+# File: src/features/feature_validation.py
+# Author: Sadiq
+#
+# Description:
+#     Whole-column equivalent of validating every row through
+#     FeatureRow. Types and nullability come from the FeatureRow
+#     field annotations; value constraints come from the shared
+#     field groups in feature_schema.py. All violations are
+#     collected in one pass and reported with their row indices.
+# ============================================================
+
+from datetime import datetime
+from typing import get_args
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.features.feature_schema import (
+    FeatureRow,
+    IDENTIFIER_FIELDS,
+    BINARY_FIELDS,
+    WIN_RATE_FIELDS,
+    ELO_FIELDS,
+    WIN_RATE_RANGE,
+    ELO_RANGE,
+    REST_DAYS_MIN,
+    SOS_RANGE,
+)
+from src.features.frame_layout import compact_feature_frame
+
+MAX_REPORTED_INDICES = 20
+
+
+class FeatureValidationError(ValueError):
+    """Raised when feature rows violate the FeatureRow schema."""
+
+    def __init__(self, violations: dict[str, pd.Index]):
+        self.violations = violations
+        lines = [
+            f"{check}: {len(idx)} rows (e.g. {list(idx[:MAX_REPORTED_INDICES])})"
+            for check, idx in violations.items()
+        ]
+        super().__init__("Feature validation failed:\n  " + "\n  ".join(lines))
+
+
+def _field_specs() -> list[tuple[str, type, bool]]:
+    """(name, base type, nullable) for every FeatureRow field."""
+    specs = []
+    for name, info in FeatureRow.model_fields.items():
+        args = get_args(info.annotation)
+        nullable = type(None) in args
+        base = next((a for a in args if a is not type(None)), info.annotation)
+        specs.append((name, base, nullable))
+    return specs
+
+
+def _numeric(s: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(values as float64, null mask, non-numeric mask)."""
+    values = pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    null = s.isna().to_numpy()
+    return values, null, np.isnan(values) & ~null
+
+
+def _per_row(s: pd.Series, mask: np.ndarray) -> np.ndarray:
+    """Map a mask over a categorical's dictionary back to rows."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        return np.where(codes >= 0, mask[np.maximum(codes, 0)], False)
+    return mask
+
+
+def _outside(values: np.ndarray, lo: float | None, hi: float | None) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        mask = np.zeros(len(values), dtype=bool)
+        if lo is not None:
+            mask |= values < lo
+        if hi is not None:
+            mask |= values > hi
+    return mask
+
+
+# ------------------------------------------------------------
+# Checks
+# ------------------------------------------------------------
+def find_feature_violations(df: pd.DataFrame) -> dict[str, pd.Index]:
+    """
+    Run every FeatureRow rule as a column check.
+
+    Returns:
+        {check label: index labels of offending rows}. Empty if valid.
+    """
+    violations: dict[str, pd.Index] = {}
+
+    def flag(label: str, mask: np.ndarray) -> None:
+        if mask.any():
+            violations[label] = df.index[mask]
+
+    specs = _field_specs()
+    missing = [name for name, _, _ in specs if name not in df.columns]
+    if missing:
+        violations[f"missing columns {missing}"] = df.index
+        return violations
+
+    numeric: dict[str, np.ndarray] = {}
+
+    # --------------------------------------------------------
+    # Types + nullability
+    # --------------------------------------------------------
+    for name, base, nullable in specs:
+        s = df[name]
+
+        if base is str:
+            null = s.isna().to_numpy()
+            # Categorical identifiers are checked through their dictionary
+            values = s.cat.categories.to_series() if isinstance(s.dtype, pd.CategoricalDtype) else s
+            if not pd.api.types.is_string_dtype(values):
+                bad = ~values.map(lambda v: isinstance(v, str)).to_numpy()
+                flag(f"{name}: expected str", ~null & _per_row(s, bad))
+            if name in IDENTIFIER_FIELDS:
+                empty = values.astype(str).str.strip().eq("").to_numpy()
+                flag(f"{name}: empty identifier", ~null & _per_row(s, empty))
+
+        elif base is datetime:
+            null = s.isna().to_numpy()
+            if not pd.api.types.is_datetime64_any_dtype(s):
+                parsed = pd.to_datetime(s, errors="coerce")
+                flag(f"{name}: expected datetime", parsed.isna().to_numpy() & ~null)
+
+        else:
+            values, null, bad_type = _numeric(s)
+            numeric[name] = values
+            flag(f"{name}: expected {base.__name__}", bad_type)
+            if base is int:
+                with np.errstate(invalid="ignore"):
+                    fractional = ~null & ~bad_type & (np.floor(values) != values)
+                flag(f"{name}: expected int", fractional)
+
+        if not nullable:
+            flag(f"{name}: null not allowed", null)
+
+    # --------------------------------------------------------
+    # Value constraints
+    # --------------------------------------------------------
+    for name in BINARY_FIELDS:
+        values = numeric[name]
+        flag(f"{name}: expected binary 0/1", ~np.isnan(values) & ~np.isin(values, (0, 1)))
+
+    for name in WIN_RATE_FIELDS:
+        flag(f"{name}: win rate outside {list(WIN_RATE_RANGE)}", _outside(numeric[name], *WIN_RATE_RANGE))
+
+    for name in ELO_FIELDS:
+        flag(f"{name}: ELO outside {list(ELO_RANGE)}", _outside(numeric[name], *ELO_RANGE))
+
+    flag("rest_days: negative", _outside(numeric["rest_days"], REST_DAYS_MIN, None))
+    flag(f"sos: outside {list(SOS_RANGE)}", _outside(numeric["sos"], *SOS_RANGE))
+
+    return violations
+
+
+# ------------------------------------------------------------
+# Public API
+# ------------------------------------------------------------
+def validate_feature_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Validate a feature frame against FeatureRow and return the
+    schema columns in canonical order, in the compact layout of
+    frame_layout (categorical identifiers, int8/int16 ints,
+    float32 floats).
+
+    Raises:
+        FeatureValidationError listing every failed check.
+    """
+    violations = find_feature_violations(df)
+    if violations:
+        for check, idx in violations.items():
+            logger.error(f"❌ Feature validation: {check} — {len(idx)} rows, e.g. {list(idx[:5])}")
+        raise FeatureValidationError(violations)
+
+    out = df[[name for name, _, _ in _field_specs()]].copy()
+    compact_feature_frame(out)
+
+    return out.reset_index(drop=True)
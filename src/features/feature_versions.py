@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Feature Module Versions
+# File: src/features/feature_versions.py
+# Author: Sadiq
+#
+# Description:
+#     Code / config versions of the feature modules, used to
+#     decide which snapshot columns are stale.
+#
+#     A module's version is a hash of its source, so a change to
+#     its logic or to a constant it defines (e.g. SOS_FILL in
+#     sos.py) gives it a new version. Every module that registers
+#     a feature step is versioned on its own; the shared
+#     execution modules (CORE_FEATURE_MODULES) are versioned
+#     together as "core", and a core change affects every step.
+#
+#     stale_columns() turns two version maps into the FeatureRow
+#     columns that must be recomputed: outputs of changed
+#     modules plus every column downstream of them in the DAG.
+# ============================================================
+
+import hashlib
+import inspect
+import sys
+from typing import Iterable
+
+from src.features.feature_schema import FeatureRow
+from src.features.registry import FEATURE_REGISTRY, FeatureStep
+
+CORE_VERSION_KEY = "core"
+
+# Shared execution code every step runs through
+CORE_FEATURE_MODULES = (
+    "src.features.registry",
+    "src.features.rolling_engine",
+    "src.features.mirror",
+    "src.features.frame_layout",
+)
+
+
+def source_version(module_names: Iterable[str]) -> str:
+    """Short sha256 of the source of the given (imported) modules."""
+    digest = hashlib.sha256()
+    for name in sorted(module_names):
+        digest.update(name.encode())
+        digest.update(inspect.getsource(sys.modules[name]).encode())
+    return digest.hexdigest()[:16]
+
+
+def step_modules() -> set[str]:
+    """Modules that register at least one feature step."""
+    return {step.func.__module__ for step in FEATURE_REGISTRY.values()}
+
+
+def feature_module_versions() -> dict[str, str]:
+    """{module: version} for every step module, plus the core version."""
+    versions = {name: source_version([name]) for name in sorted(step_modules())}
+    versions[CORE_VERSION_KEY] = source_version(CORE_FEATURE_MODULES)
+    return versions
+
+
+def _steps_of(module: str) -> list[FeatureStep]:
+    return [s for s in FEATURE_REGISTRY.values() if s.func.__module__ == module]
+
+
+def downstream_columns(columns: Iterable[str]) -> set[str]:
+    """columns plus every step output that (transitively) reads them."""
+    stale = set(columns)
+    grew = True
+    while grew:
+        grew = False
+        for step in FEATURE_REGISTRY.values():
+            if stale.isdisjoint(step.inputs) or stale.issuperset(step.outputs):
+                continue
+            stale.update(step.outputs)
+            grew = True
+    return stale
+
+
+def stale_columns(
+    stored_versions: dict[str, str] | None,
+    stored_columns: Iterable[str],
+    versions: dict[str, str] | None = None,
+) -> set[str] | None:
+    """
+    FeatureRow columns of a snapshot that must be recomputed with
+    the current code: outputs of modules whose version changed (or
+    are new), FeatureRow columns the snapshot does not have yet,
+    and everything downstream of them.
+
+    Returns None when the snapshot cannot be patched column-wise:
+    it records no versions, holds columns FeatureRow no longer has,
+    or a missing column is not produced by any feature step.
+    """
+    schema = set(FeatureRow.model_fields)
+    if not stored_versions or not set(stored_columns) <= schema:
+        return None
+
+    versions = versions or feature_module_versions()
+    stale: set[str] = set()
+
+    if stored_versions.get(CORE_VERSION_KEY) != versions[CORE_VERSION_KEY]:
+        for step in FEATURE_REGISTRY.values():
+            stale.update(step.outputs)
+    else:
+        for module, version in versions.items():
+            if module != CORE_VERSION_KEY and stored_versions.get(module) != version:
+                for step in _steps_of(module):
+                    stale.update(step.outputs)
+
+    produced = {c for s in FEATURE_REGISTRY.values() for c in s.outputs}
+    added = schema - set(stored_columns)
+    if not added <= produced:
+        return None
+
+    return downstream_columns(stale | added) & schema
@@ -13,6 +13,14 @@
 
 import pandas as pd
 
+from src.features.registry import feature_step
+from src.features.rolling_engine import RollingSpec, add_rolling, compute_rolling, sort_team_frame
+
+# Rolling average margin over last 3 games (excluding current game)
+FORM_SPECS = [
+    RollingSpec("form_last3", "margin", 3, dtype=None),
+]
+
 
 def add_form_features(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -35,16 +43,15 @@ def add_form_features(df: pd.DataFrame) -> pd.DataFrame:
     # Ensure datetime
     out["date"] = pd.to_datetime(out["date"])
 
-    # Sort for rolling operations
-    out = out.sort_values(["team", "date"]).reset_index(drop=True)
+    # Sort for rolling operations (no-op if already sorted)
+    out = sort_team_frame(out)
 
     # Compute score differential
     out["score_diff"] = out["score"] - out["opp_score"]
 
-    # Rolling average margin over last 3 games (excluding current game)
-    out["form_last3"] = (
-        out.groupby("team")["score_diff"]
-        .transform(lambda s: s.shift(1).rolling(3, min_periods=1).mean())
-    )
+    return add_rolling(out, FORM_SPECS)
+
 
-    return out
+@feature_step("form", inputs=("margin",), outputs=tuple(s.name for s in FORM_SPECS))
+def _form_step(df, ctx, wanted):
+    return compute_rolling(df, [s for s in FORM_SPECS if s.name in wanted], ctx.segments)
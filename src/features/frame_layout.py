@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Compact Frame Layout
+# File: src/features/frame_layout.py
+# Author: Sadiq
+#
+# Description:
+#     Memory-compact dtypes for long and feature frames:
+#         - team / opponent: categorical over one shared team
+#           dictionary (sorted, so codes sort like the names)
+#         - season: ordered categorical over a contiguous range
+#           of season labels (comparisons + max still work)
+#         - int fields: int8 (binary) / int16
+#         - float features: float32
+#
+#     Dictionaries depend only on the teams and latest season
+#     present, so frames built from the same rows always share
+#     categories and compare / concatenate cleanly.
+#
+#     MemoryReport records bytes per row at pipeline stages.
+# ============================================================
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import get_args
+
+import pandas as pd
+from loguru import logger
+
+from src.features.feature_schema import BINARY_FIELDS, FeatureRow
+from src.utils.team_names import NBA_TRICODES
+
+FIRST_SEASON_YEAR = 1946
+
+TEAM_COLUMNS = ("team", "opponent")
+
+# Int columns of the long input that may be narrowed before features run
+LONG_INT_COLUMNS = ("is_home", "win", "score", "opp_score", "total_points")
+
+
+# ------------------------------------------------------------
+# Dictionaries
+# ------------------------------------------------------------
+def _distinct(s: pd.Series):
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return s.cat.remove_unused_categories().cat.categories
+    return s.dropna().unique()
+
+
+def team_dtype(*columns: pd.Series) -> pd.CategoricalDtype:
+    """Canonical tricodes plus any other names present, sorted."""
+    names = set(NBA_TRICODES)
+    for col in columns:
+        names.update(str(v) for v in _distinct(col))
+    return pd.CategoricalDtype(sorted(names))
+
+
+def season_dtype(season: pd.Series) -> pd.CategoricalDtype:
+    """Ordered season labels from FIRST_SEASON_YEAR to the latest present."""
+    present = {str(v) for v in _distinct(season)}
+    years = [int(v[:4]) for v in present if v[:4].isdigit()]
+    first = min([FIRST_SEASON_YEAR, *years])
+    last = max(years, default=first)
+    labels = {f"{y}-{y + 1}" for y in range(first, last + 1)} | present
+    return pd.CategoricalDtype(sorted(labels), ordered=True)
+
+
+def _small_int(s: pd.Series, binary: bool, nullable: bool = False) -> pd.Series:
+    if not pd.api.types.is_numeric_dtype(s):
+        return s
+    dtype = "int8" if binary else "int16"
+    if s.isna().any():
+        return s.astype(dtype.capitalize()) if nullable else s
+    return s.astype(dtype)
+
+
+def _compact_identifiers(df: pd.DataFrame) -> None:
+    teams = [c for c in TEAM_COLUMNS if c in df.columns]
+    if teams:
+        dtype = team_dtype(*(df[c] for c in teams))
+        for c in teams:
+            if df[c].dtype != dtype:
+                df[c] = df[c].astype(dtype)
+
+    if "season" in df.columns:
+        dtype = season_dtype(df["season"])
+        if df["season"].dtype != dtype:
+            df["season"] = df["season"].astype(dtype)
+
+
+# ------------------------------------------------------------
+# Public API
+# ------------------------------------------------------------
+def compact_long_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compact identifiers and null-free int columns of a long frame
+    (in place). Float columns are left untouched.
+    """
+    _compact_identifiers(df)
+    for c in LONG_INT_COLUMNS:
+        if c in df.columns:
+            df[c] = _small_int(df[c], binary=c in BINARY_FIELDS)
+    return df
+
+
+def compact_feature_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply the compact layout to the FeatureRow columns present in
+    df (in place): identifiers categorical, ints narrowed, floats
+    float32. Columns outside FeatureRow are left as they are.
+    """
+    _compact_identifiers(df)
+
+    for name, info in FeatureRow.model_fields.items():
+        if name not in df.columns:
+            continue
+        args = get_args(info.annotation)
+        base = next((a for a in args if a is not type(None)), info.annotation)
+
+        if base is int:
+            df[name] = _small_int(df[name], binary=name in BINARY_FIELDS, nullable=True)
+        elif base is float and df[name].dtype != "float32":
+            df[name] = df[name].astype("float32")
+        elif base is datetime and not pd.api.types.is_datetime64_any_dtype(df[name]):
+            df[name] = pd.to_datetime(df[name])
+
+    return df
+
+
+# ------------------------------------------------------------
+# Memory report
+# ------------------------------------------------------------
+@dataclass
+class StageMemory:
+    stage: str
+    rows: int
+    columns: int
+    bytes: int
+
+    @property
+    def bytes_per_row(self) -> float:
+        return self.bytes / self.rows if self.rows else 0.0
+
+
+@dataclass
+class MemoryReport:
+    """Deep memory usage of the frames passing through a pipeline."""
+
+    stages: list[StageMemory] = field(default_factory=list)
+
+    def record(self, stage: str, df: pd.DataFrame) -> None:
+        entry = StageMemory(
+            stage=stage,
+            rows=len(df),
+            columns=df.shape[1],
+            bytes=int(df.memory_usage(deep=True).sum()),
+        )
+        self.stages.append(entry)
+        logger.info(
+            f"🧮 [Memory] {stage}: {entry.bytes / 1e6:.1f} MB, "
+            f"{entry.bytes_per_row:.1f} B/row ({entry.rows} rows × {entry.columns} cols)"
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                {
+                    "stage": s.stage,
+                    "rows": s.rows,
+                    "columns": s.columns,
+                    "bytes": s.bytes,
+                    "bytes_per_row": round(s.bytes_per_row, 1),
+                }
+                for s in self.stages
+            ]
+        )
@@ -15,6 +15,14 @@
 
 import pandas as pd
 
+from src.features.registry import feature_step
+from src.features.rolling_engine import RollingSpec, add_rolling, compute_rolling, sort_team_frame
+
+MARGIN_SPECS = [
+    RollingSpec("margin_rolling_5", "margin", 5),
+    RollingSpec("margin_rolling_10", "margin", 10),
+]
+
 
 def add_margin_features(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -37,27 +45,25 @@ def add_margin_features(df: pd.DataFrame) -> pd.DataFrame:
     # Ensure datetime
     out["date"] = pd.to_datetime(out["date"])
 
-    # Sort for rolling operations
-    out = out.sort_values(["team", "date"]).reset_index(drop=True)
+    # Sort for rolling operations (no-op if already sorted)
+    out = sort_team_frame(out)
 
     # Base margin (schema expects 'margin', not 'score_diff')
     out["margin"] = (out["score"] - out["opp_score"]).astype("float32")
 
     # Rolling margin (last 5 and 10 games, leakage-safe)
-    out["margin_rolling_5"] = (
-        out.groupby("team")["margin"]
-        .shift(1)
-        .rolling(5, min_periods=1)
-        .mean()
-        .astype("float32")
-    )
-
-    out["margin_rolling_10"] = (
-        out.groupby("team")["margin"]
-        .shift(1)
-        .rolling(10, min_periods=1)
-        .mean()
-        .astype("float32")
-    )
-
-    return out
+    return add_rolling(out, MARGIN_SPECS)
+
+
+@feature_step("margin", inputs=("score", "opp_score"), outputs=("margin",))
+def _margin_step(df, ctx, wanted):
+    return {"margin": (df["score"] - df["opp_score"]).astype("float32").to_numpy()}
+
+
+@feature_step(
+    "margin_rolling",
+    inputs=("margin",),
+    outputs=tuple(s.name for s in MARGIN_SPECS),
+)
+def _margin_rolling_step(df, ctx, wanted):
+    return compute_rolling(df, [s for s in MARGIN_SPECS if s.name in wanted], ctx.segments)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Opponent Mirror Index
+# File: src/features/mirror.py
+# Author: Sadiq
+#
+# Description:
+#     Maps each team-game row to its opponent's row (same
+#     game_id, team/opponent swapped) as a positional int array.
+#     Built once per row order; every opp_* feature is then an
+#     O(n) array gather instead of a (game_id, opponent) merge.
+# ============================================================
+
+import numpy as np
+import pandas as pd
+
+
+def build_mirror_index(df: pd.DataFrame) -> np.ndarray:
+    """
+    Positional index of each row's opponent row. Rows without a
+    clean mirror (incomplete or asymmetric games) get -1.
+
+    The index is only valid for the row order it was built on.
+    """
+    return mirror_index(df["game_id"], df["team"].to_numpy(), df["opponent"].to_numpy())
+
+
+def mirror_index(game_id, team: np.ndarray, opp: np.ndarray) -> np.ndarray:
+    """
+    build_mirror_index over plain arrays: game ids (any hashable
+    values) and team / opponent keys in one shared encoding.
+    """
+    n = len(team)
+    mirror = np.full(n, -1, dtype=np.int64)
+    if n == 0:
+        return mirror
+
+    game_codes, _ = pd.factorize(game_id)
+    order = np.argsort(game_codes, kind="stable")
+    sorted_codes = game_codes[order]
+
+    # Games with exactly two rows: positions (a, b) are adjacent in `order`
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    sizes = np.diff(np.r_[starts, n])
+    pair_starts = starts[sizes == 2]
+    a = order[pair_starts]
+    b = order[pair_starts + 1]
+
+    ok = (team[a] == opp[b]) & (team[b] == opp[a])
+
+    mirror[a[ok]] = b[ok]
+    mirror[b[ok]] = a[ok]
+    return mirror
+
+
+def gather_opponent(values: np.ndarray, mirror: np.ndarray, fill=np.nan) -> np.ndarray:
+    """
+    Opponent's value for every row: values[mirror], `fill` where
+    the row has no mirror.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iub" and np.isnan(fill):
+        values = values.astype("float64")
+
+    out = values[np.maximum(mirror, 0)]
+    return np.where(mirror >= 0, out, fill).astype(values.dtype, copy=False)
+
+
+def add_opponent_columns(
+    df: pd.DataFrame,
+    columns: dict[str, str],
+    mirror: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Add opponent copies of columns in place: {source: opp_name}.
+    Sources missing from df are skipped. Returns df.
+    """
+    for source, target in columns.items():
+        if source in df.columns:
+            df[target] = gather_opponent(df[source].to_numpy(), mirror)
+    return df
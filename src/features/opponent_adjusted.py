@@ -1,6 +1,11 @@
 from __future__ import annotations
+
+import numpy as np
 import pandas as pd
 
+from src.features.mirror import add_opponent_columns, build_mirror_index, gather_opponent
+from src.features.registry import feature_step
+
 # ============================================================
 # 🏀 NBA Analytics
 # Module: Opponent-Adjusted Features
@@ -8,72 +13,45 @@
 # Author: Sadiq
 #
 # Description:
-#     Adds opponent-adjusted rolling statistics by aligning
-#     opponent metrics using game_id + opponent.
+#     Adds opponent-adjusted rolling statistics by gathering
+#     opponent metrics through the mirror row index.
 # ============================================================
 
+# Source column → opponent feature
+OPPONENT_COLUMNS = {
+    "margin_rolling_5": "opp_margin_rolling_5",
+    "margin_rolling_10": "opp_margin_rolling_10",
+    "team_win_pct_last10": "opp_win_pct_last10",
+}
+
 
-def add_opponent_adjusted_features(df: pd.DataFrame) -> pd.DataFrame:
+def add_opponent_adjusted_features(
+    df: pd.DataFrame,
+    mirror: np.ndarray | None = None,
+) -> pd.DataFrame:
     """
     Adds opponent-adjusted rolling features:
         • opp_margin_rolling_5
         • opp_margin_rolling_10
         • opp_win_pct_last10
 
-    Uses game_id + opponent to align the opponent’s rolling stats.
+    Uses the mirror row index (game_id + opponent) to align the
+    opponent’s rolling stats. Source columns not yet computed are
+    skipped.
     """
     out = df.copy()
 
-    # --------------------------------------------------------
-    # Opponent margin rolling (5 & 10 games)
-    # --------------------------------------------------------
-    for w in [5, 10]:
-        margin_col = f"margin_rolling_{w}"
-        opp_col = f"opp_margin_rolling_{w}"
-
-        if margin_col not in out.columns:
-            continue  # skip if rolling margin not computed yet
-
-        opp_lookup = (
-            out[["game_id", "team", margin_col]]
-            .rename(columns={"team": "opponent", margin_col: opp_col})
-        )
-
-        out = out.merge(
-            opp_lookup,
-            on=["game_id", "opponent"],
-            how="left",
-            suffixes=("", "_dup"),
-        )
+    if mirror is None:
+        mirror = build_mirror_index(out)
 
-        # Remove duplicate columns created by merge
-        dup_cols = [c for c in out.columns if c.endswith("_dup")]
-        if dup_cols:
-            out.drop(columns=dup_cols, inplace=True)
+    return add_opponent_columns(out, OPPONENT_COLUMNS, mirror)
 
-    # --------------------------------------------------------
-    # Opponent win% last 10 games
-    # --------------------------------------------------------
-    if "team_win_pct_last10" in out.columns:
-        opp_win_lookup = (
-            out[["game_id", "team", "team_win_pct_last10"]]
-            .rename(
-                columns={
-                    "team": "opponent",
-                    "team_win_pct_last10": "opp_win_pct_last10",
-                }
-            )
-        )
 
-        out = out.merge(
-            opp_win_lookup,
-            on=["game_id", "opponent"],
-            how="left",
-            suffixes=("", "_dup"),
-        )
+def _register_opponent_step(source: str, target: str) -> None:
+    @feature_step(f"opponent:{target}", inputs=(source, "game_id", "team", "opponent"), outputs=(target,))
+    def _step(df, ctx, wanted):
+        return {target: gather_opponent(df[source].to_numpy(), ctx.mirror)}
 
-        dup_cols = [c for c in out.columns if c.endswith("_dup")]
-        if dup_cols:
-            out.drop(columns=dup_cols, inplace=True)
 
-    return out
\ No newline at end of file
+for _source, _target in OPPONENT_COLUMNS.items():
+    _register_opponent_step(_source, _target)
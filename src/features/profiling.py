@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Feature Build Profiling
+# File: src/features/profiling.py
+# Author: Sadiq
+#
+# Description:
+#     Per-step timing and memory instrumentation for
+#     build_features. Every feature step (Elo, rolling, streak,
+#     rest, form, SOS, opponent-adjusted, ...) and every
+#     pipeline stage (base frame, validation, persist) records:
+#         - wall time and CPU time (of the thread running it)
+#         - peak RSS growth of the process
+#         - rows in / rows out and bytes of the produced columns
+#         - optionally, peak bytes allocated (tracemalloc)
+#
+#     Steps of one DAG level run concurrently, so RSS and
+#     allocation figures of those steps overlap.
+#
+#     Profiles are appended as JSON lines to FEATURE_PROFILE_LOG
+#     so build regressions can be tracked over time.
+# ============================================================
+
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.config.paths import FEATURE_PROFILE_LOG
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _peak_rss_bytes() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def output_size(result) -> tuple[int, int]:
+    """(rows, bytes) of a step result: a frame or {column: array}."""
+    if isinstance(result, pd.DataFrame):
+        return len(result), int(result.memory_usage(deep=True).sum())
+    if isinstance(result, dict) and result:
+        arrays = [np.asarray(v) for v in result.values()]
+        return len(arrays[0]), int(sum(a.nbytes for a in arrays))
+    return 0, 0
+
+
+@dataclass
+class StepProfile:
+    step: str
+    wall_s: float
+    cpu_s: float
+    peak_rss_delta_bytes: int
+    rows_in: int
+    rows_out: int
+    bytes_out: int
+    alloc_peak_bytes: int | None = None
+
+
+class _StepTimer:
+    """Handle yielded by FeatureProfile.step; call done() with the result."""
+
+    def __init__(self):
+        self.rows_out = 0
+        self.bytes_out = 0
+
+    def done(self, result) -> None:
+        self.rows_out, self.bytes_out = output_size(result)
+
+
+@dataclass
+class FeatureProfile:
+    """
+    Structured per-step report of one feature build.
+
+    trace_allocations:
+        Also record peak allocated bytes per step via tracemalloc
+        (slower; off by default).
+    """
+
+    trace_allocations: bool = False
+    steps: list[StepProfile] = field(default_factory=list)
+    meta: dict = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @contextmanager
+    def step(self, name: str, rows_in: int):
+        timer = _StepTimer()
+        tracing = self.trace_allocations and tracemalloc.is_tracing()
+        if tracing:
+            alloc_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        rss_start = _peak_rss_bytes()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+
+        yield timer
+
+        entry = StepProfile(
+            step=name,
+            wall_s=time.perf_counter() - wall_start,
+            cpu_s=time.thread_time() - cpu_start,
+            peak_rss_delta_bytes=_peak_rss_bytes() - rss_start,
+            rows_in=rows_in,
+            rows_out=timer.rows_out,
+            bytes_out=timer.bytes_out,
+            alloc_peak_bytes=(
+                max(tracemalloc.get_traced_memory()[1] - alloc_start, 0) if tracing else None
+            ),
+        )
+        with self._lock:
+            self.steps.append(entry)
+        logger.debug(
+            f"⏱️ [Profile] {name}: {entry.wall_s * 1000:.1f} ms wall, "
+            f"{entry.cpu_s * 1000:.1f} ms cpu, {entry.rows_in}→{entry.rows_out} rows"
+        )
+
+    @contextmanager
+    def session(self):
+        """Enable tracemalloc for the build when trace_allocations is set."""
+        started = self.trace_allocations and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            yield self
+        finally:
+            if started:
+                tracemalloc.stop()
+
+    # ------------------------------------------------------------
+    # Report
+    # ------------------------------------------------------------
+    def to_frame(self) -> pd.DataFrame:
+        columns = list(StepProfile.__dataclass_fields__)
+        return pd.DataFrame([asdict(s) for s in self.steps], columns=columns)
+
+    def to_dict(self) -> dict:
+        return {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            **self.meta,
+            "steps": [asdict(s) for s in self.steps],
+        }
+
+    def log_summary(self) -> None:
+        for s in sorted(self.steps, key=lambda s: s.wall_s, reverse=True):
+            logger.info(
+                f"⏱️ {s.step:<32} {s.wall_s * 1000:9.1f} ms wall {s.cpu_s * 1000:9.1f} ms cpu "
+                f"{s.peak_rss_delta_bytes / 1e6:7.1f} MB rss+ {s.bytes_out / 1e6:7.1f} MB out"
+            )
+
+    def write(self, path: Path = FEATURE_PROFILE_LOG) -> Path:
+        """Append this profile as one JSON line."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(self.to_dict()) + "\n")
+        logger.info(f"📝 [Profile] Appended feature build profile → {path}")
+        return path
+
+
+@contextmanager
+def profile_stage(profile: FeatureProfile | None, name: str, rows_in: int):
+    """profile.step when profiling, otherwise a no-op timer."""
+    if profile is None:
+        yield _StepTimer()
+        return
+    with profile.step(name, rows_in) as timer:
+        yield timer
+
+
+def read_profile_log(path: Path = FEATURE_PROFILE_LOG) -> pd.DataFrame:
+    """
+    All recorded profiles as one row per (build, step), with the
+    build's metadata repeated on each row.
+    """
+    path = Path(path)
+    if not path.exists():
+        return pd.DataFrame()
+
+    rows = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        steps = record.pop("steps", [])
+        rows.extend({**record, **s} for s in steps)
+
+    df = pd.DataFrame(rows)
+    if "recorded_at" in df.columns:
+        df["recorded_at"] = pd.to_datetime(df["recorded_at"])
+    return df
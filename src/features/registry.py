@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Feature Registry
+# File: src/features/registry.py
+# Author: Sadiq
+#
+# Description:
+#     Registry of feature steps. Every feature module declares
+#     the columns it reads and the columns it produces; the
+#     planner resolves a requested column set into a DAG of
+#     steps, prunes everything not needed, and runs steps of
+#     the same level concurrently.
+#
+#     Steps are pure: they read the shared (team, date)-sorted
+#     frame and return {column: array}. The executor assigns
+#     the results once every step of a level has finished.
+# ============================================================
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.features.frame_layout import compact_long_frame
+from src.features.mirror import build_mirror_index
+from src.features.profiling import FeatureProfile, profile_stage
+from src.features.rolling_engine import TeamSegments, sort_team_frame
+
+# Columns expected on the input long frame (or added by the base stage)
+BASE_COLUMNS = (
+    "game_id",
+    "team",
+    "opponent",
+    "date",
+    "season",
+    "is_home",
+    "score",
+    "opp_score",
+    "win",
+    "total_points",
+)
+
+FEATURE_MAX_WORKERS = 4
+
+
+@dataclass
+class FeatureContext:
+    """Per-run structures shared by every step."""
+
+    segments: TeamSegments
+    mirror: np.ndarray
+    input_position: np.ndarray   # row position in the original input
+
+    # Warm start from carried-in team state (see prepare_base_frame)
+    carried: np.ndarray | None = None        # True for replayed state rows
+    carried_elo: np.ndarray | None = None    # their stored pre-game Elo
+    initial_elo: dict[str, float] | None = None
+    initial_ewma: dict[str, dict[str, float]] | None = None
+
+
+@dataclass(frozen=True)
+class FeatureStep:
+    name: str
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    func: Callable[[pd.DataFrame, FeatureContext, frozenset], dict] = field(compare=False)
+
+    def run(self, df: pd.DataFrame, ctx: FeatureContext, wanted: Iterable[str]) -> dict:
+        return self.func(df, ctx, frozenset(wanted))
+
+
+FEATURE_REGISTRY: dict[str, FeatureStep] = {}
+_PRODUCERS: dict[str, str] = {}
+
+
+def feature_step(name: str, inputs: Iterable[str], outputs: Iterable[str]):
+    """
+    Decorator registering a step function:
+        func(df, ctx, wanted_outputs) -> {column: array}
+    """
+    def decorator(func):
+        step = FeatureStep(name, tuple(inputs), tuple(outputs), func)
+
+        for col in step.outputs:
+            owner = _PRODUCERS.get(col)
+            if owner is not None and owner != name:
+                raise ValueError(f"Column '{col}' already produced by step '{owner}'")
+
+        FEATURE_REGISTRY[name] = step
+        for col in step.outputs:
+            _PRODUCERS[col] = name
+        return func
+
+    return decorator
+
+
+def producer_of(column: str) -> FeatureStep | None:
+    name = _PRODUCERS.get(column)
+    return FEATURE_REGISTRY[name] if name else None
+
+
+# ------------------------------------------------------------
+# Planning
+# ------------------------------------------------------------
+@dataclass
+class FeaturePlan:
+    levels: list[list[FeatureStep]]
+    wanted: dict[str, set[str]]        # step name → outputs to compute
+    columns: list[str]
+
+    @property
+    def steps(self) -> list[FeatureStep]:
+        return [s for level in self.levels for s in level]
+
+
+def plan_features(columns: Iterable[str]) -> FeaturePlan:
+    """
+    Resolve requested columns into levels of steps. A step's level
+    is one past the deepest step producing any of its inputs, so
+    steps within a level are independent.
+    """
+    columns = list(dict.fromkeys(columns))
+    wanted: dict[str, set[str]] = {}
+    depth: dict[str, int] = {}
+
+    def visit(col: str, trail: tuple[str, ...]) -> int:
+        step = producer_of(col)
+        if step is None:
+            if col not in BASE_COLUMNS:
+                raise ValueError(f"No feature step produces column '{col}'")
+            return -1
+        if step.name in trail:
+            raise ValueError(f"Feature dependency cycle: {' → '.join(trail + (step.name,))}")
+
+        wanted.setdefault(step.name, set()).add(col)
+        if step.name not in depth:
+            depth[step.name] = 1 + max(
+                (visit(c, trail + (step.name,)) for c in step.inputs), default=-1
+            )
+        return depth[step.name]
+
+    for col in columns:
+        visit(col, ())
+
+    n_levels = max(depth.values(), default=-1) + 1
+    levels: list[list[FeatureStep]] = [[] for _ in range(n_levels)]
+    for name, d in depth.items():
+        levels[d].append(FEATURE_REGISTRY[name])
+
+    return FeaturePlan(levels=levels, wanted=wanted, columns=columns)
+
+
+# ------------------------------------------------------------
+# Execution
+# ------------------------------------------------------------
+def season_labels(dates: pd.Series) -> pd.Series:
+    """Season label per row ("YYYY-YYYY+1" from the calendar year)."""
+    year = pd.to_datetime(dates).dt.year
+    labels = {y: f"{y}-{y + 1}" for y in year.dropna().unique().tolist()}
+    return year.map(labels).astype("str")
+
+
+def prepare_base_frame(
+    long_df: pd.DataFrame,
+    carry_in: pd.DataFrame | None = None,
+    initial_elo: dict[str, float] | None = None,
+    initial_ewma: dict[str, dict[str, float]] | None = None,
+) -> tuple[pd.DataFrame, FeatureContext]:
+    """
+    Copy the input once, normalize date + season, switch to the
+    compact layout (frame_layout), sort by (team, date) and build
+    the shared segment + mirror indexes.
+
+    carry_in:
+        Optional replayed history (team_state.state_context_frame)
+        placed in front of long_df so window features continue from
+        it. Those rows are flagged in ctx.carried and must be dropped
+        after the plan has run. Elo then starts from initial_elo and
+        EWMA form from initial_ewma.
+    """
+    df = long_df.copy()
+    if carry_in is not None:
+        df = pd.concat([carry_in.assign(_carried=True), df.assign(_carried=False)], ignore_index=True)
+    df["_input_position"] = np.arange(len(df))
+
+    df["date"] = pd.to_datetime(df["date"])
+    df["season"] = season_labels(df["date"])
+    compact_long_frame(df)
+
+    df = sort_team_frame(df)
+    input_position = df.pop("_input_position").to_numpy()
+
+    ctx = FeatureContext(
+        segments=TeamSegments.from_frame(df),
+        mirror=build_mirror_index(df),
+        input_position=input_position,
+    )
+
+    if carry_in is not None:
+        ctx.carried = df.pop("_carried").to_numpy(dtype=bool)
+        ctx.carried_elo = df.pop("elo").to_numpy(dtype="float64")
+        ctx.initial_elo = initial_elo or {}
+        ctx.initial_ewma = initial_ewma or {}
+
+    return df, ctx
+
+
+def run_plan(
+    df: pd.DataFrame,
+    ctx: FeatureContext,
+    plan: FeaturePlan,
+    max_workers: int = FEATURE_MAX_WORKERS,
+    profile: FeatureProfile | None = None,
+) -> pd.DataFrame:
+    """
+    Execute a plan level by level; steps of a level run in a
+    thread pool when max_workers > 1. Adds columns to df in place.
+    Each step is timed into `profile` when given.
+    """
+    def run(step: FeatureStep) -> dict:
+        with profile_stage(profile, step.name, rows_in=len(df)) as timer:
+            produced = step.run(df, ctx, plan.wanted[step.name])
+            timer.done(produced)
+        return produced
+
+    for i, level in enumerate(plan.levels):
+        logger.debug(f"[Features] Level {i}: {[s.name for s in level]}")
+
+        if max_workers > 1 and len(level) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(level))) as pool:
+                results = list(pool.map(run, level))
+        else:
+            results = [run(s) for s in level]
+
+        for produced in results:
+            for col, values in produced.items():
+                df[col] = values
+
+    return df
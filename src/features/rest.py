@@ -14,6 +14,12 @@
 
 import pandas as pd
 
+from src.features.registry import feature_step
+from src.features.rolling_engine import sort_team_frame
+
+# Rest assigned to a team's first game (no previous game date)
+DEFAULT_REST_DAYS = 10
+
 
 def add_rest_features(df: pd.DataFrame) -> pd.DataFrame:
     out = df.copy()
@@ -27,22 +33,34 @@ def add_rest_features(df: pd.DataFrame) -> pd.DataFrame:
     # Ensure datetime
     out["date"] = pd.to_datetime(out["date"])
 
-    # Sort for rolling operations
-    out = out.sort_values(["team", "date"]).reset_index(drop=True)
+    # Sort for rolling operations (no-op if already sorted)
+    out = sort_team_frame(out)
+
+    out["rest_days"], out["is_b2b"] = _rest_columns(out)
+    return out
 
+
+def _rest_columns(out: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """rest_days + is_b2b for a (team, date)-sorted frame."""
     # Previous game date
-    out["prev_date"] = out.groupby("team")["date"].shift(1)
+    prev_date = out.groupby("team")["date"].shift(1)
 
     # Days since previous game
     # First game of season gets rest_days = 10 (safe default)
-    out["rest_days"] = (
-        (out["date"] - out["prev_date"]).dt.days
-        .fillna(10)
+    rest_days = (
+        (out["date"] - prev_date).dt.days
+        .fillna(DEFAULT_REST_DAYS)
         .astype(int)
     )
 
     # Back-to-back indicator
     # True B2B = rest_days == 1
-    out["is_b2b"] = (out["rest_days"] == 1).astype(int)
+    is_b2b = (rest_days == 1).astype(int)
+
+    return rest_days, is_b2b
+
 
-    return out.drop(columns=["prev_date"])
+@feature_step("rest", inputs=("team", "date"), outputs=("rest_days", "is_b2b"))
+def _rest_step(df, ctx, wanted):
+    rest_days, is_b2b = _rest_columns(df)
+    return {"rest_days": rest_days.to_numpy(), "is_b2b": is_b2b.to_numpy()}
@@ -12,10 +12,37 @@
 #     window sizes (5, 10, 20 games).
 # ============================================================
 
+from dataclasses import replace
+
 import pandas as pd
 
+from src.features.margin_features import MARGIN_SPECS
+from src.features.registry import feature_step
+from src.features.rolling_engine import RollingSpec, add_rolling, compute_rolling, sort_team_frame
+
 WINDOWS = [5, 10, 20]
 
+ROLLING_SPECS = [
+    spec
+    for w in WINDOWS
+    for spec in (
+        RollingSpec(f"points_for_rolling_{w}", "score", w),
+        RollingSpec(f"points_against_rolling_{w}", "opp_score", w),
+        RollingSpec(f"margin_rolling_{w}", "margin", w),
+        RollingSpec(f"win_rolling_{w}", "win_flag", w),
+    )
+]
+
+# Pipeline names (schema column → rolling output)
+ROLLING_RENAMES = {"win_rolling_10": "team_win_pct_last10"}
+
+# Registered specs: margin_rolling_5/10 are owned by margin_features
+_STEP_SPECS = [
+    replace(s, name=ROLLING_RENAMES.get(s.name, s.name))
+    for s in ROLLING_SPECS
+    if s.name not in {m.name for m in MARGIN_SPECS}
+]
+
 
 def add_rolling_features(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -38,53 +65,19 @@ def add_rolling_features(df: pd.DataFrame) -> pd.DataFrame:
     # Ensure datetime
     out["date"] = pd.to_datetime(out["date"])
 
-    # Sort for rolling operations
-    out = out.sort_values(["team", "date"]).reset_index(drop=True)
+    # Sort for rolling operations (no-op if already sorted)
+    out = sort_team_frame(out)
 
-    # Pre-calculate indicators
+    # Base margin (win flag is derived by the rolling engine)
     out["margin"] = (out["score"] - out["opp_score"]).astype("float32")
-    out["win_flag"] = (out["score"] > out["opp_score"]).astype("float32")
-
-    grouped = out.groupby("team")
-
-    for w in WINDOWS:
-        # Rolling points for
-        out[f"points_for_rolling_{w}"] = (
-            grouped["score"]
-            .shift(1)
-            .rolling(w, min_periods=1)
-            .mean()
-            .astype("float32")
-        )
-
-        # Rolling points against
-        out[f"points_against_rolling_{w}"] = (
-            grouped["opp_score"]
-            .shift(1)
-            .rolling(w, min_periods=1)
-            .mean()
-            .astype("float32")
-        )
-
-        # Rolling margin
-        out[f"margin_rolling_{w}"] = (
-            grouped["margin"]
-            .shift(1)
-            .rolling(w, min_periods=1)
-            .mean()
-            .astype("float32")
-        )
-
-        # Rolling win rate
-        out[f"win_rolling_{w}"] = (
-            grouped["win_flag"]
-            .shift(1)
-            .rolling(w, min_periods=1)
-            .mean()
-            .astype("float32")
-        )
-
-    # Clean up temporary columns
-    out = out.drop(columns=["win_flag"])
-
-    return out
+
+    return add_rolling(out, ROLLING_SPECS)
+
+
+@feature_step(
+    "rolling",
+    inputs=("score", "opp_score", "margin"),
+    outputs=tuple(s.name for s in _STEP_SPECS),
+)
+def _rolling_step(df, ctx, wanted):
+    return compute_rolling(df, [s for s in _STEP_SPECS if s.name in wanted], ctx.segments)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Rolling Engine
+# File: src/features/rolling_engine.py
+# Author: Sadiq
+#
+# Description:
+#     Shared leakage-safe rolling kernel for team-game rows.
+#     The frame is sorted by (team, date) once, team segment
+#     offsets are built once, and every requested
+#     (column, window, stat) is computed from one windowed
+#     pass per source column over contiguous arrays.
+#
+#     Semantics (per team, current game excluded):
+#         shift(1) → rolling(window, min_periods=1) → stat
+#     Windows never cross team boundaries.
+#
+#     Each row's window is summed from its own values in a fixed
+#     order (most recent game first), so results do not depend on
+#     how much history precedes the row in the frame. Season
+#     shards and warm-started builds are bit-identical to a full
+#     build.
+# ============================================================
+
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+ROLLING_STATS = ("mean", "sum", "count")
+
+# Inputs that can be requested without materializing a column first
+DERIVED_INPUTS = {
+    "margin": lambda df: df["score"] - df["opp_score"],
+    "win_flag": lambda df: (df["score"] > df["opp_score"]).astype("float32"),
+}
+
+
+@dataclass(frozen=True)
+class RollingSpec:
+    name: str                     # output column
+    column: str                   # source column (or DERIVED_INPUTS key)
+    window: int
+    stat: str = "mean"
+    dtype: str | None = "float32"  # None keeps float64
+
+
+class TeamSegments:
+    """
+    Team segment layout of a (team, date)-sorted frame.
+
+    row_start[i] is the position of the first row of row i's team.
+    """
+
+    def __init__(self, row_start: np.ndarray):
+        self.row_start = row_start
+        self.n = len(row_start)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "TeamSegments":
+        return cls.from_keys(_team_keys(df["team"]))
+
+    @classmethod
+    def from_keys(cls, team: np.ndarray) -> "TeamSegments":
+        """Segments of a team key array that is already grouped by team."""
+        n = len(team)
+        if n == 0:
+            return cls(np.empty(0, dtype=np.int64))
+
+        starts = np.flatnonzero(np.r_[True, team[1:] != team[:-1]])
+        sizes = np.diff(np.r_[starts, n])
+        return cls(np.repeat(starts, sizes))
+
+    def shifted_rolling(
+        self,
+        values: np.ndarray,
+        windows: Iterable[int],
+        stat: str = "mean",
+    ) -> dict[int, np.ndarray]:
+        """
+        Rolling stat over the previous `window` rows of the same team
+        for several windows at once (NaNs are skipped, like pandas).
+        """
+        windows = set(windows)
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+
+        total = np.zeros(self.n)
+        count = np.zeros(self.n, dtype=np.int64)
+        rows = np.arange(self.n)
+
+        out = {}
+        for lag in range(1, max(windows, default=0) + 1):
+            src = rows - lag
+            inside = src >= self.row_start
+            src = np.maximum(src, 0)
+            total += np.where(inside, filled[src], 0.0)
+            count += inside & valid[src]
+
+            if lag not in windows:
+                continue
+            if stat == "count":
+                out[lag] = count.astype("float64")
+            elif stat == "sum":
+                out[lag] = np.where(count > 0, total, np.nan)
+            else:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    out[lag] = np.where(count > 0, total / count, np.nan)
+        return out
+
+
+# ------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------
+def _team_keys(team: pd.Series) -> np.ndarray:
+    # Codes of a sorted categorical order like the names themselves
+    if isinstance(team.dtype, pd.CategoricalDtype) and team.cat.categories.is_monotonic_increasing:
+        return team.cat.codes.to_numpy()
+    return team.to_numpy()
+
+
+def is_team_sorted(df: pd.DataFrame) -> bool:
+    if len(df) < 2:
+        return True
+    team = _team_keys(df["team"])
+    date = df["date"].to_numpy()
+    same = team[1:] == team[:-1]
+    return bool(((team[1:] > team[:-1]) | (same & (date[1:] >= date[:-1]))).all())
+
+
+def sort_team_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df ordered by (team, date) with a fresh RangeIndex.
+    Already-sorted frames are returned without re-sorting.
+    """
+    if is_team_sorted(df):
+        if isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1:
+            return df
+        return df.reset_index(drop=True)
+    return df.sort_values(["team", "date"], kind="mergesort").reset_index(drop=True)
+
+
+def _input_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    if column in df.columns:
+        series = df[column]
+    elif column in DERIVED_INPUTS:
+        series = DERIVED_INPUTS[column](df)
+    else:
+        raise ValueError(f"Rolling input column not found: '{column}'")
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+
+# ------------------------------------------------------------
+# Public API
+# ------------------------------------------------------------
+def compute_rolling(
+    df: pd.DataFrame,
+    specs: Iterable[RollingSpec],
+    segments: TeamSegments | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Compute every spec on a (team, date)-sorted frame.
+    Specs sharing a source column reuse one windowed pass.
+    Duplicate output names keep the first spec.
+    """
+    segments = segments or TeamSegments.from_frame(df)
+    return rolling_from_values(lambda column: _input_values(df, column), specs, segments)
+
+
+def rolling_from_values(
+    values_of: Callable[[str], np.ndarray],
+    specs: Iterable[RollingSpec],
+    segments: TeamSegments,
+) -> dict[str, np.ndarray]:
+    """
+    compute_rolling over any column source: values_of(column) returns
+    the float64 source values in segment order.
+    """
+    unique: dict[str, RollingSpec] = {}
+    for spec in specs:
+        if spec.stat not in ROLLING_STATS:
+            raise ValueError(f"Unknown rolling stat '{spec.stat}'. Expected one of {ROLLING_STATS}.")
+        unique.setdefault(spec.name, spec)
+
+    by_source: dict[tuple[str, str], list[RollingSpec]] = {}
+    for spec in unique.values():
+        by_source.setdefault((spec.column, spec.stat), []).append(spec)
+
+    results: dict[str, np.ndarray] = {}
+    for (column, stat), group in by_source.items():
+        values = values_of(column)
+        rolled = segments.shifted_rolling(values, {s.window for s in group}, stat)
+        for spec in group:
+            arr = rolled[spec.window]
+            results[spec.name] = arr.astype(spec.dtype) if spec.dtype else arr
+
+    return results
+
+
+def add_rolling(
+    df: pd.DataFrame,
+    specs: Iterable[RollingSpec],
+    segments: TeamSegments | None = None,
+) -> pd.DataFrame:
+    """
+    Add rolling columns to a frame (in place) and return it.
+    The frame is sorted by (team, date) first if needed.
+    """
+    if segments is None:
+        df = sort_team_frame(df)
+
+    for name, values in compute_rolling(df, specs, segments).items():
+        df[name] = values
+    return df
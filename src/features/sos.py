@@ -11,9 +11,21 @@
 #     performance (rolling points allowed).
 # ============================================================
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
+from src.features.mirror import build_mirror_index, gather_opponent
+from src.features.registry import feature_step
+from src.features.rolling_engine import RollingSpec, add_rolling, compute_rolling, sort_team_frame
+
+# Neutral league-average points allowed, used before history exists
+SOS_FILL = 112.0
+
+SOS_SPECS = [
+    RollingSpec("opp_points_allowed_roll10", "opp_score", 10),
+]
+
 
 def add_sos_features(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -22,7 +34,7 @@ def add_sos_features(df: pd.DataFrame) -> pd.DataFrame:
     Calculation:
     1. Compute each team's rolling points allowed (opp_score) over last 10 games.
     2. Shift by 1 to ensure leakage-safe pre-game knowledge.
-    3. Map opponent's defensive profile into each row using game_id.
+    3. Map opponent's defensive profile into each row (mirror index).
     """
     out = df.copy()
 
@@ -35,35 +47,41 @@ def add_sos_features(df: pd.DataFrame) -> pd.DataFrame:
     # Ensure datetime
     out["date"] = pd.to_datetime(out["date"])
 
-    # Sort for rolling operations
-    out = out.sort_values(["team", "date"]).reset_index(drop=True)
+    # Sort for rolling operations (no-op if already sorted)
+    out = sort_team_frame(out)
 
     # 1. Rolling defensive profile (points allowed)
-    out["opp_points_allowed_roll10"] = (
-        out.groupby("team")["opp_score"]
-        .shift(1)
-        .rolling(10, min_periods=1)
-        .mean()
-        .astype("float32")
-    )
-
-    # 2. Build lookup table for opponent's defensive profile
-    sos_lookup = (
-        out[["game_id", "team", "opp_points_allowed_roll10"]]
-        .rename(columns={
-            "team": "opponent",
-            "opp_points_allowed_roll10": "sos"
-        })
-    )
-
-    # 3. Merge opponent SOS into each row
-    out = out.merge(sos_lookup, on=["game_id", "opponent"], how="left")
+    out = add_rolling(out, SOS_SPECS)
+
+    return attach_sos_features(out)
+
+
+def attach_sos_features(out: pd.DataFrame, mirror: np.ndarray | None = None) -> pd.DataFrame:
+    """
+    Map each opponent's rolling points allowed into `sos` (in place).
+    Requires opp_points_allowed_roll10 (see SOS_SPECS).
+
+    mirror:
+        Opponent row index for out's row order (built if omitted).
+    """
+    if mirror is None:
+        mirror = build_mirror_index(out)
+
+    # 2-3. Opponent's defensive profile via the mirror index
+    sos = gather_opponent(out["opp_points_allowed_roll10"].to_numpy(), mirror)
 
     # Fill early-season NaNs with neutral league average
-    out["sos"] = out["sos"].fillna(112.0).astype("float32")
+    out["sos"] = np.where(np.isnan(sos), SOS_FILL, sos).astype("float32")
 
     # Drop intermediate column
-    out = out.drop(columns=["opp_points_allowed_roll10"])
+    del out["opp_points_allowed_roll10"]
 
     logger.debug("Added SOS (defensive difficulty) features.")
     return out
+
+
+@feature_step("sos", inputs=("game_id", "team", "opponent", "opp_score"), outputs=("sos",))
+def _sos_step(df, ctx, wanted):
+    allowed = compute_rolling(df, SOS_SPECS, ctx.segments)["opp_points_allowed_roll10"]
+    sos = gather_opponent(allowed, ctx.mirror)
+    return {"sos": np.where(np.isnan(sos), SOS_FILL, sos).astype("float32")}
@@ -0,0 +1,606 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Team Feature State
+# File: src/features/team_state.py
+# Author: Sadiq
+#
+# Description:
+#     Persisted per-team state that is sufficient to produce
+#     the next game's feature row without rebuilding history:
+#         - last N points for / against and wins (ring buffers)
+#         - last N pre-game Elo ratings
+#         - current Elo rating, last game date, win streak
+#         - exponentially weighted form (one float per stat and
+#           half-life, see ewma.py)
+#     N is the largest rolling window in WINDOWS.
+#
+#     Only completed games (both scores present) advance state.
+# ============================================================
+
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.config.paths import TEAM_STATE_PATH
+from src.features.elo import ELO_INITIAL, _apply_elo_array
+from src.features.ewma import (
+    EWMA_COLUMNS,
+    ewma_sweep,
+    game_observation,
+    initial_matrix,
+    next_game_delta,
+    observation_matrix,
+    update_ewma_state,
+)
+from src.features.registry import season_labels
+from src.features.rest import DEFAULT_REST_DAYS
+from src.features.rolling import WINDOWS
+from src.features.rolling_engine import TeamSegments
+from src.features.sos import SOS_FILL
+
+STATE_WINDOW = max(WINDOWS)
+
+
+@dataclass
+class TeamState:
+    team: str
+    elo: float = ELO_INITIAL
+    last_date: pd.Timestamp | None = None
+    streak: int = 0
+    scores: deque = field(default_factory=lambda: deque(maxlen=STATE_WINDOW))
+    opp_scores: deque = field(default_factory=lambda: deque(maxlen=STATE_WINDOW))
+    wins: deque = field(default_factory=lambda: deque(maxlen=STATE_WINDOW))
+    elos: deque = field(default_factory=lambda: deque(maxlen=STATE_WINDOW))
+    ewma: dict = field(default_factory=dict)      # EWMA column → current value
+
+    # ------------------------------------------------------------
+    # Window helpers (most recent values are on the right)
+    # ------------------------------------------------------------
+    @staticmethod
+    def _mean(values: deque, w: int) -> float:
+        if not values:
+            return np.nan
+        tail = list(values)[-w:]
+        return sum(tail) / len(tail)
+
+    def points_for(self, w: int) -> float:
+        return self._mean(self.scores, w)
+
+    def points_against(self, w: int) -> float:
+        return self._mean(self.opp_scores, w)
+
+    def margin(self, w: int) -> float:
+        if not self.scores:
+            return np.nan
+        s = list(self.scores)[-w:]
+        o = list(self.opp_scores)[-w:]
+        return sum(a - b for a, b in zip(s, o)) / len(s)
+
+    def win_rate(self, w: int) -> float:
+        return self._mean(self.wins, w)
+
+    def elo_roll(self, w: int) -> float:
+        return self._mean(self.elos, w)
+
+    def ewma_value(self, column: str) -> float:
+        return self.ewma.get(column, np.nan)
+
+    def rest_days(self, day: pd.Timestamp) -> int:
+        if self.last_date is None:
+            return DEFAULT_REST_DAYS
+        return int((day - self.last_date).days)
+
+    # ------------------------------------------------------------
+    # Update
+    # ------------------------------------------------------------
+    def push(self, day, score, opp_score, win, pre_elo, post_elo) -> None:
+        self.scores.append(float(score))
+        self.opp_scores.append(float(opp_score))
+        self.wins.append(1.0 if score > opp_score else 0.0)
+        self.elos.append(float(pre_elo))
+        update_ewma_state(self.ewma, game_observation(score, opp_score, post_elo - pre_elo))
+        self.streak = self.streak + 1 if win == 1 else 0
+        self.last_date = day
+        self.elo = float(post_elo)
+
+
+class TeamStateStore:
+    """
+    Parquet-backed store of TeamState objects (one row per team,
+    ring buffers stored as list columns, EWMA state as one float
+    column each). Files written before EWMA state existed load
+    with empty EWMA state.
+    """
+
+    def __init__(self, path: Path = TEAM_STATE_PATH):
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> dict[str, TeamState]:
+        if not self.path.exists():
+            return {}
+
+        df = pd.read_parquet(self.path)
+        ewma_cols = [c for c in EWMA_COLUMNS if c in df.columns]
+        states = {}
+        for row in df.itertuples(index=False):
+            states[row.team] = TeamState(
+                team=row.team,
+                elo=float(row.elo),
+                last_date=None if pd.isna(row.last_date) else pd.Timestamp(row.last_date),
+                streak=int(row.streak),
+                scores=deque(row.scores, maxlen=STATE_WINDOW),
+                opp_scores=deque(row.opp_scores, maxlen=STATE_WINDOW),
+                wins=deque(row.wins, maxlen=STATE_WINDOW),
+                elos=deque(row.elos, maxlen=STATE_WINDOW),
+                ewma={c: float(getattr(row, c)) for c in ewma_cols},
+            )
+        return states
+
+    def save(self, states: dict[str, TeamState]) -> None:
+        df = pd.DataFrame(
+            {
+                "team": [s.team for s in states.values()],
+                "elo": [s.elo for s in states.values()],
+                "last_date": pd.to_datetime([s.last_date for s in states.values()]),
+                "streak": [s.streak for s in states.values()],
+                "scores": [list(s.scores) for s in states.values()],
+                "opp_scores": [list(s.opp_scores) for s in states.values()],
+                "wins": [list(s.wins) for s in states.values()],
+                "elos": [list(s.elos) for s in states.values()],
+                **{c: [s.ewma_value(c) for s in states.values()] for c in EWMA_COLUMNS},
+            }
+        )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp.parquet")
+        df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, self.path)
+
+        logger.debug(f"[TeamState] Stored state for {len(df)} teams → {self.path.name}")
+
+
+# ------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------
+def _played(df: pd.DataFrame) -> pd.Series:
+    return df["score"].notna() & df["opp_score"].notna()
+
+
+def _win_values(df: pd.DataFrame) -> pd.Series:
+    if "win" in df.columns:
+        return df["win"]
+    return (df["score"] > df["opp_score"]).astype(int)
+
+
+def _ewma_after_games(
+    df: pd.DataFrame,
+    final_ratings: dict[str, float],
+    initial: dict[str, TeamState] | None = None,
+) -> tuple[np.ndarray, list[str], np.ndarray]:
+    """
+    EWMA state after every row of a (team, date)-sorted frame of
+    completed games with pre-game `elo`, continuing from the
+    initial states' EWMA.
+
+    Returns (post state per row, team per segment, segment starts).
+    """
+    team_arr = df["team"].to_numpy()
+    row_start = TeamSegments.from_keys(team_arr).row_start
+    starts = np.unique(row_start)
+    teams = [str(t) for t in team_arr[starts]]
+
+    elo = df["elo"].to_numpy(dtype="float64")
+    final = np.array([final_ratings.get(str(t), np.nan) for t in team_arr], dtype="float64")
+    values = observation_matrix(
+        df["score"].to_numpy(dtype="float64"),
+        df["opp_score"].to_numpy(dtype="float64"),
+        next_game_delta(elo, row_start, final=final),
+    )
+    start = None
+    if initial:
+        start = initial_matrix(teams, {t: st.ewma for t, st in initial.items()})
+    _, post = ewma_sweep(values, row_start, initial=start)
+    return post, teams, starts
+
+
+# ------------------------------------------------------------
+# Full-history rebuild
+# ------------------------------------------------------------
+def build_team_state(
+    long_df: pd.DataFrame,
+    initial: dict[str, TeamState] | None = None,
+) -> dict[str, TeamState]:
+    """
+    Build per-team state from long history in one pass (Elo via the
+    array engine, buffers via groupby tail).
+
+    initial:
+        Optional state as of just before long_df (e.g. the end of the
+        previous season). It is copied, not modified.
+    """
+    initial = initial or {}
+    run = _apply_elo_array(long_df, initial={t: s.elo for t, s in initial.items()})
+    ratings = run.final_ratings()
+
+    df = long_df[["team", "date", "score", "opp_score"]].copy()
+    df["date"] = pd.to_datetime(df["date"]).dt.normalize()
+    df["win"] = _win_values(long_df).to_numpy()
+    df["elo"] = run.elo
+    df = df[_played(df)].sort_values(["team", "date"], kind="mergesort")
+
+    states = {team: _copy_state(st) for team, st in initial.items()}
+    for team, elo in ratings.items():
+        states.setdefault(team, TeamState(team=team)).elo = elo
+
+    if len(df):
+        post, teams, starts = _ewma_after_games(df, ratings, initial)
+        ends = np.r_[starts[1:], len(df)] - 1
+        for team, row in zip(teams, post[ends].tolist()):
+            states[team].ewma = dict(zip(EWMA_COLUMNS, row))
+
+    for team, g in df.groupby("team", sort=False):
+        st = states[team]
+        tail = g.tail(STATE_WINDOW)
+        st.scores.extend(tail["score"].astype(float).tolist())
+        st.opp_scores.extend(tail["opp_score"].astype(float).tolist())
+        st.wins.extend((tail["score"] > tail["opp_score"]).astype(float).tolist())
+        st.elos.extend(tail["elo"].astype(float).tolist())
+        st.last_date = g["date"].iloc[-1]
+
+        # Trailing run of wins (continues the carried streak if unbroken)
+        wins = g["win"].to_numpy()
+        not_win = np.flatnonzero(wins != 1)
+        if len(not_win):
+            st.streak = int(len(wins) - (not_win[-1] + 1))
+        else:
+            st.streak += len(wins)
+
+    return states
+
+
+def season_start_states(long_df: pd.DataFrame) -> dict[str, dict[str, TeamState]]:
+    """
+    Per-team state at the start of every season in long_df, from a
+    single Elo pass over the full history:
+
+        {season: {team: TeamState as of the season's first game date}}
+
+    Ratings come from the end-of-day rating vectors; buffers, last
+    date and streak from one (team, date)-sorted frame of completed
+    games sliced at each season boundary.
+    """
+    run = _apply_elo_array(long_df, track_days=True)
+    teams = run.teams.tolist()
+    day_ends = pd.DatetimeIndex(run.day_ends)
+
+    df = long_df[["team", "date", "score", "opp_score"]].copy()
+    df["date"] = pd.to_datetime(df["date"]).dt.normalize()
+    df["season"] = season_labels(df["date"])
+    df["win"] = _win_values(long_df).to_numpy()
+    df["elo"] = run.elo
+    first_day = df.groupby("season")["date"].min().sort_index()
+
+    df = df[_played(df)].sort_values(["team", "date"], kind="mergesort").reset_index(drop=True)
+
+    # Win streak after each game: consecutive wins ending at the row
+    pos = np.arange(len(df))
+    team_arr = df["team"].to_numpy()
+    win = (df["win"] == 1).to_numpy()
+    team_start = np.r_[True, team_arr[1:] != team_arr[:-1]] if len(df) else np.zeros(0, dtype=bool)
+    run_start = np.maximum.accumulate(np.where(~win, pos + 1, np.where(team_start, pos, 0)))
+    streak_after = pos + 1 - run_start
+
+    segments = {team: (g.index[0], g.index[-1] + 1) for team, g in df.groupby("team", sort=False)}
+    dates = df["date"].to_numpy()
+    scores = df["score"].astype(float).to_numpy()
+    opp_scores = df["opp_score"].astype(float).to_numpy()
+    wins = (df["score"] > df["opp_score"]).astype(float).to_numpy()
+    elos = df["elo"].astype(float).to_numpy()
+    ewma_post = _ewma_after_games(df, run.final_ratings())[0] if len(df) else None
+
+    out: dict[str, dict[str, TeamState]] = {}
+    for season, day in first_day.items():
+        prior_days = day_ends.searchsorted(day)
+        ratings = run.day_ratings[prior_days - 1] if prior_days else None
+
+        states = {}
+        for t, team in enumerate(teams):
+            st = TeamState(team=team, elo=ELO_INITIAL if ratings is None else float(ratings[t]))
+            lo, hi = segments.get(team, (0, 0))
+            end = lo + int(np.searchsorted(dates[lo:hi], np.datetime64(day)))
+            if end > lo:
+                start = max(lo, end - STATE_WINDOW)
+                st.scores.extend(scores[start:end].tolist())
+                st.opp_scores.extend(opp_scores[start:end].tolist())
+                st.wins.extend(wins[start:end].tolist())
+                st.elos.extend(elos[start:end].tolist())
+                st.last_date = pd.Timestamp(dates[end - 1])
+                st.streak = int(streak_after[end - 1])
+                st.ewma = dict(zip(EWMA_COLUMNS, ewma_post[end - 1].tolist()))
+            states[team] = st
+        out[season] = states
+
+    return out
+
+
+def _copy_state(st: TeamState) -> TeamState:
+    return TeamState(
+        team=st.team,
+        elo=st.elo,
+        last_date=st.last_date,
+        streak=st.streak,
+        scores=deque(st.scores, maxlen=STATE_WINDOW),
+        opp_scores=deque(st.opp_scores, maxlen=STATE_WINDOW),
+        wins=deque(st.wins, maxlen=STATE_WINDOW),
+        elos=deque(st.elos, maxlen=STATE_WINDOW),
+        ewma=dict(st.ewma),
+    )
+
+
+def state_context_frame(states: dict[str, TeamState]) -> pd.DataFrame:
+    """
+    Replay per-team state as pseudo team-game rows (the buffered
+    games, oldest first) so window features of later rows can be
+    computed by the regular pipeline. A streak longer than the
+    buffer is padded with result-less wins in front of it; those
+    rows sit outside every rolling window.
+
+    Pseudo rows have unique game ids (no opponent row) and carry
+    their stored pre-game Elo in `elo`.
+    """
+    records = []
+    for team, st in states.items():
+        if st.last_date is None:
+            continue
+
+        wins = list(st.wins)
+        trailing = len(wins) - next(
+            (i + 1 for i in range(len(wins) - 1, -1, -1) if wins[i] != 1.0), 0
+        )
+        pad = st.streak - trailing if trailing == len(wins) else 0
+
+        games = [(np.nan, np.nan, 1, np.nan)] * max(pad, 0) + [
+            (sc, osc, int(w == 1.0), elo)
+            for sc, osc, w, elo in zip(st.scores, st.opp_scores, wins, st.elos)
+        ]
+        for i, (sc, osc, win, elo) in enumerate(games):
+            records.append(
+                {
+                    "game_id": f"carry:{team}:{i}",
+                    "date": st.last_date,
+                    "team": team,
+                    "opponent": "",
+                    "is_home": 0,
+                    "score": sc,
+                    "opp_score": osc,
+                    "win": win,
+                    "total_points": sc + osc,
+                    "elo": elo,
+                }
+            )
+
+    return pd.DataFrame.from_records(
+        records,
+        columns=["game_id", "date", "team", "opponent", "is_home",
+                 "score", "opp_score", "win", "total_points", "elo"],
+    )
+
+
+# ------------------------------------------------------------
+# Incremental feature rows
+# ------------------------------------------------------------
+def _pregame_features(st: TeamState, opp: TeamState, rest_days: int) -> dict:
+    """Window / form / opponent features of one row from team state."""
+    rec = {}
+    for w in WINDOWS:
+        rec[f"points_for_rolling_{w}"] = st.points_for(w)
+        rec[f"points_against_rolling_{w}"] = st.points_against(w)
+        rec[f"margin_rolling_{w}"] = st.margin(w)
+        rec[f"win_rolling_{w}"] = st.win_rate(w)
+
+    rec["team_win_pct_last10"] = rec.pop("win_rolling_10")
+    rec["win_streak"] = st.streak
+    rec["elo_roll5"] = st.elo_roll(5)
+    rec["elo_roll10"] = st.elo_roll(10)
+    rec["rest_days"] = rest_days
+    rec["is_b2b"] = int(rest_days == 1)
+    rec["form_last3"] = st.margin(3)
+    rec.update({c: st.ewma_value(c) for c in EWMA_COLUMNS})
+
+    sos = opp.points_against(10)
+    rec["sos"] = SOS_FILL if np.isnan(sos) else sos
+    rec["opp_margin_rolling_5"] = opp.margin(5)
+    rec["opp_margin_rolling_10"] = opp.margin(10)
+    rec["opp_win_pct_last10"] = opp.win_rate(10)
+    return rec
+
+
+def _records_frame(records: list[dict]) -> pd.DataFrame:
+    out = pd.DataFrame.from_records(records)
+    out["season"] = (
+        out["date"].dt.year.astype(str) + "-" + (out["date"].dt.year + 1).astype(str)
+    )
+
+    float32_cols = [
+        c for c in out.columns
+        if c.startswith(("points_for_rolling_", "points_against_rolling_", "margin_rolling_", "win_rolling_"))
+    ] + [
+        "team_win_pct_last10", "elo_roll5", "elo_roll10", "sos",
+        "opp_margin_rolling_5", "opp_margin_rolling_10", "opp_win_pct_last10",
+        *EWMA_COLUMNS,
+    ]
+    out[float32_cols] = out[float32_cols].astype("float32")
+
+    return out.sort_values(["team", "date"]).reset_index(drop=True)
+
+
+def compute_incremental_features(
+    new_rows: pd.DataFrame,
+    states: dict[str, TeamState],
+) -> pd.DataFrame:
+    """
+    Produce pre-game feature rows for new team-games from per-team
+    state, then advance the state (in place) with completed games.
+
+    Rows are processed date by date so a team's later new games see
+    its earlier new games. Rows at or before a team's last stored
+    game date are ignored as already applied.
+    """
+    df = new_rows.copy()
+    df["date"] = pd.to_datetime(df["date"]).dt.normalize()
+
+    last = df["team"].map(lambda t: states[t].last_date if t in states else None)
+    applied = pd.to_datetime(last).notna() & (df["date"] <= pd.to_datetime(last))
+    if applied.any():
+        logger.warning(f"[TeamState] Skipping {int(applied.sum())} rows already in state.")
+        df = df[~applied]
+
+    if df.empty:
+        return pd.DataFrame()
+
+    df = df.sort_values("date", kind="mergesort").reset_index(drop=True)
+
+    run = _apply_elo_array(
+        df,
+        initial={t: s.elo for t, s in states.items()},
+        track_days=True,
+    )
+    team_code = {t: i for i, t in enumerate(run.teams.tolist())}
+    day_index = {d: i for i, d in enumerate(pd.DatetimeIndex(run.day_ends))}
+
+    played = _played(df).tolist()
+    wins = _win_values(df).tolist()
+    records: list[dict] = []
+
+    for day, idx in df.groupby("date", sort=True).indices.items():
+        day = pd.Timestamp(day)
+
+        # 1. Pre-game features from state as of the previous date
+        for i in idx:
+            row = df.iloc[i]
+            st = states.setdefault(row["team"], TeamState(team=row["team"]))
+            opp = states.setdefault(row["opponent"], TeamState(team=row["opponent"]))
+
+            rec = row.to_dict()
+            rec["elo"] = run.elo[i]
+            rec["opp_elo"] = run.opp_elo[i]
+            rec["margin"] = row["score"] - row["opp_score"]
+            rec.update(_pregame_features(st, opp, st.rest_days(day)))
+            records.append(rec)
+
+        # 2. Advance state with completed games
+        post = run.day_ratings[day_index[day]]
+        for i in idx:
+            if not played[i]:
+                continue
+            row = df.iloc[i]
+            states[row["team"]].push(
+                day,
+                row["score"],
+                row["opp_score"],
+                wins[i],
+                run.elo[i],
+                post[team_code[row["team"]]],
+            )
+
+    return _records_frame(records)
+
+
+def rows_behind_state(rows: pd.DataFrame, states: dict[str, TeamState]) -> bool:
+    """
+    True when a completed game in rows predates its team's last
+    stored game: history changed behind the state (backfill,
+    repair), so it cannot be advanced incrementally.
+    """
+    if rows.empty or not states:
+        return False
+    df = rows[_played(rows)]
+    last = pd.to_datetime(df["team"].map(lambda t: states[t].last_date if t in states else None))
+    return bool((pd.to_datetime(df["date"]).dt.normalize() < last).any())
+
+
+# ------------------------------------------------------------
+# Scheduled (unplayed) games
+# ------------------------------------------------------------
+SCHEDULE_COLUMNS = ("game_id", "date", "team", "opponent", "is_home")
+OUTCOME_COLUMNS = ("score", "opp_score", "win", "margin", "total_points")
+
+
+def latest_state_date(states: dict[str, TeamState]) -> pd.Timestamp | None:
+    """Most recent game date folded into any team's state."""
+    dates = [st.last_date for st in states.values() if st.last_date is not None]
+    return max(dates) if dates else None
+
+
+def compute_schedule_features(
+    schedule_rows: pd.DataFrame,
+    states: dict[str, TeamState],
+    as_of: pd.Timestamp,
+) -> pd.DataFrame:
+    """
+    Pre-game feature rows for scheduled games, read straight from
+    per-team state (O(1) per row; state is not modified).
+
+    Only identity columns of schedule_rows are used, so results of
+    games that have since been played cannot leak in; outcome
+    columns come back empty. State must hold nothing dated on or
+    after as_of, and every game must be on or after as_of.
+
+    No game in the schedule has a result yet, so Elo, windows and
+    streaks are the state's for every game; rest days count from
+    the team's previous game, scheduled or played.
+    """
+    as_of = pd.Timestamp(as_of).normalize()
+
+    missing = [c for c in SCHEDULE_COLUMNS if c not in schedule_rows.columns]
+    if missing:
+        raise ValueError(f"Schedule rows missing required columns: {missing}")
+
+    latest = latest_state_date(states)
+    if latest is not None and latest >= as_of:
+        raise ValueError(
+            f"Team state includes games through {latest.date()}, not before as_of={as_of.date()}."
+        )
+
+    df = schedule_rows[list(SCHEDULE_COLUMNS)].copy()
+    df["date"] = pd.to_datetime(df["date"]).dt.normalize()
+    if (df["date"] < as_of).any():
+        raise ValueError(f"Schedule contains games before as_of={as_of.date()}.")
+
+    if df.empty:
+        return pd.DataFrame()
+
+    unknown = sorted(set(df["team"]) - set(states))
+    if unknown:
+        logger.warning(f"[TeamState] No state for {unknown}; using cold-start features.")
+
+    df = df.sort_values("date", kind="mergesort").reset_index(drop=True)
+    previous = {team: st.last_date for team, st in states.items()}
+    records: list[dict] = []
+
+    for row in df.itertuples(index=False):
+        st = states.get(row.team) or TeamState(team=row.team)
+        opp = states.get(row.opponent) or TeamState(team=row.opponent)
+
+        last = previous.get(row.team)
+        rest_days = DEFAULT_REST_DAYS if last is None else int((row.date - last).days)
+        previous[row.team] = row.date
+
+        rec = row._asdict()
+        rec.update(dict.fromkeys(OUTCOME_COLUMNS, np.nan))
+        rec["elo"] = st.elo
+        rec["opp_elo"] = opp.elo
+        rec.update(_pregame_features(st, opp, rest_days))
+        records.append(rec)
+
+    return _records_frame(records)
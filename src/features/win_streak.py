@@ -1,11 +1,22 @@
 from __future__ import annotations
 import pandas as pd
 
+from src.features.registry import feature_step
+from src.features.rolling_engine import sort_team_frame
+
+
 def add_win_streak(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.sort_values(["team", "date"]).copy()
+    out = sort_team_frame(df).copy()
+    out["win_streak"] = _win_streak(out)
+    return out
 
+
+def _win_streak(out: pd.DataFrame) -> pd.Series:
     shifted = out.groupby("team")["win"].shift(1)
     streak_groups = (shifted != 1).cumsum()
-    out["win_streak"] = shifted.groupby(streak_groups).cumcount()
+    return shifted.groupby(streak_groups).cumcount()
+
 
-    return out
\ No newline at end of file
+@feature_step("win_streak", inputs=("team", "date", "win"), outputs=("win_streak",))
+def _win_streak_step(df, ctx, wanted):
+    return {"win_streak": _win_streak(df).to_numpy()}
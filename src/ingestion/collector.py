@@ -7,27 +7,20 @@
 # Author: Sadiq
 # ============================================================
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 import pandas as pd
-import requests
 from loguru import logger
-import time
+
+from src.ingestion.http_client import HEADERS, default_http_client  # noqa: F401
+from src.ingestion.response_cache import default_response_cache
 
 NBA_SCOREBOARD_URL = "https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_{}.json"
 NBA_SCOREBOARD_URL_LEGACY = "https://data.nba.net/prod/v1/{}/scoreboard.json"
 
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Referer": "https://www.nba.com/",
-    "Origin": "https://www.nba.com",
-    "Accept": "*/*",
-    "Connection": "keep-alive",
-}
+# Concurrent scoreboard downloads during multi-date ingestion
+INGEST_MAX_WORKERS = 8
 
 
 def _format_date(d: date) -> str:
@@ -37,58 +30,35 @@ def _format_date(d: date) -> str:
 def _safe_request(url: str, retries: int = 5, timeout: int = 10) -> Optional[dict]:
     """
     Robust GET request with retry logic, SSL fallback for legacy endpoints,
-    and safe JSON parsing.
+    and safe JSON parsing (pooled session, shared rate limiter).
+    """
+    return default_http_client().get_json(url, retries=retries, timeout=timeout)
+
+
+def _cached_request(url: str, day: date, force: bool = False) -> Optional[dict]:
     """
-    is_legacy = "data.nba.net" in url
-
-    for attempt in range(1, retries + 1):
-        try:
-            resp = requests.get(
-                url,
-                headers=HEADERS,
-                timeout=timeout,
-                verify=not is_legacy,  # disable SSL only for legacy
-            )
-
-            if resp.status_code == 200:
-                return resp.json()
-
-            if resp.status_code in (403, 429):
-                wait = (attempt * 2) + 5
-                logger.warning(
-                    f"[Collector] Blocked ({resp.status_code}) for {url}. "
-                    f"Retrying in {wait}s..."
-                )
-                time.sleep(wait)
-                continue
-
-            logger.warning(
-                f"[Collector] Unexpected status {resp.status_code} for {url}"
-            )
-
-        except requests.exceptions.SSLError as e:
-            logger.error(f"[Collector] SSL error for {url}: {e}")
-            if not is_legacy:
-                return None  # only bypass SSL for legacy
-
-        except Exception as e:
-            logger.warning(f"[Collector] Attempt {attempt} failed for {url}: {e}")
-
-    logger.error(f"[Collector] Exhausted retries for {url}")
-    return None
-
-
-def fetch_scoreboard_for_date(day: date) -> pd.DataFrame:
+    _safe_request through the on-disk scoreboard cache: finished
+    dates never hit the network again, live dates are revalidated
+    after a short TTL. force=True always downloads (and re-caches).
+    """
+    client = default_http_client()
+    return default_response_cache().fetch_json(
+        url, day, lambda u, headers: client.conditional_get(u, headers=headers), force=force
+    )
+
+
+def fetch_scoreboard_for_date(day: date, force: bool = False) -> pd.DataFrame:
     """
     Fetch ScoreboardV3, fallback to legacy if needed.
+    force=True bypasses the response cache.
     """
     logger.info(f"[Collector] Fetching ScoreboardV3 for {day}...")
     day_str = _format_date(day)
     url = NBA_SCOREBOARD_URL.format(day_str)
 
-    data = _safe_request(url)
+    data = _cached_request(url, day, force)
     if data is None:
-        return _fetch_legacy_scoreboard(day)
+        return _fetch_legacy_scoreboard(day, force)
 
     try:
         games = data.get("scoreboard", {}).get("games", [])
@@ -102,10 +72,10 @@ def fetch_scoreboard_for_date(day: date) -> pd.DataFrame:
 
     except Exception as e:
         logger.error(f"[Collector] Failed to parse V3 scoreboard: {e}")
-        return _fetch_legacy_scoreboard(day)
+        return _fetch_legacy_scoreboard(day, force)
 
 
-def _fetch_legacy_scoreboard(day: date) -> pd.DataFrame:
+def _fetch_legacy_scoreboard(day: date, force: bool = False) -> pd.DataFrame:
     """
     Fetch legacy scoreboard as fallback.
     """
@@ -114,7 +84,7 @@ def _fetch_legacy_scoreboard(day: date) -> pd.DataFrame:
 
     logger.warning(f"[Collector] Falling back to legacy scoreboard for {day}")
 
-    data = _safe_request(url)
+    data = _cached_request(url, day, force)
     if data is None:
         logger.error(f"[Collector] Legacy scoreboard also failed for {day}")
         return pd.DataFrame({"schema_version": ["scoreboard_legacy"]})
@@ -131,3 +101,55 @@ def _fetch_legacy_scoreboard(day: date) -> pd.DataFrame:
     except Exception as e:
         logger.error(f"[Collector] Failed to parse legacy scoreboard: {e}")
         return pd.DataFrame({"schema_version": ["scoreboard_legacy"]})
+
+
+def _fetch_or_none(day: date, force: bool = False) -> Optional[pd.DataFrame]:
+    try:
+        return fetch_scoreboard_for_date(day, force=force)
+    except Exception as e:
+        logger.error(f"[Collector] Failed to fetch {day}: {e}")
+        return None
+
+
+def iter_scoreboards(
+    dates: Iterable[date],
+    max_workers: int = INGEST_MAX_WORKERS,
+    force: bool = False,
+) -> Iterator[tuple[date, pd.DataFrame]]:
+    """
+    Yield (day, raw scoreboard) for every date.
+
+    max_workers > 1 downloads in a thread pool (paced by the shared
+    rate limiter) and yields in completion order, at most
+    2 × max_workers dates ahead of the consumer, so callers can
+    normalize one date while others are still downloading.
+    max_workers=1 fetches lazily in date order in the calling thread.
+    Dates whose fetch raised are logged and skipped.
+    force=True bypasses the response cache for every date.
+    """
+    dates = list(dates)
+    if max_workers <= 1 or len(dates) <= 1:
+        for day in dates:
+            raw = _fetch_or_none(day, force)
+            if raw is not None:
+                yield day, raw
+        return
+
+    pending = iter(dates)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scoreboard") as pool:
+        in_flight = {}
+        for day in pending:
+            in_flight[pool.submit(_fetch_or_none, day, force)] = day
+            if len(in_flight) >= 2 * max_workers:
+                break
+
+        while in_flight:
+            done = next(as_completed(in_flight))
+            day = in_flight.pop(done)
+
+            nxt = next(pending, None)
+            if nxt is not None:
+                in_flight[pool.submit(_fetch_or_none, nxt, force)] = nxt
+
+            if done.result() is not None:
+                yield day, done.result()
@@ -10,16 +10,56 @@
 #     Uses the canonical season schedule snapshot to fill in
 #     missing team-game rows when ScoreboardV3 fails to return
 #     a game (rare but possible).
+#
+#     The snapshot is served by the date-indexed ScheduleService
+#     (read once, reloaded when the file changes), and fallback
+#     rows are built column-wise for all missing games at once.
 # ============================================================
 
 from datetime import date
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from src.config.paths import DAILY_SCHEDULE_SNAPSHOT as SCHEDULE_SNAPSHOT
 from src.ingestion.fallback.base import FallbackSource
-from src.ingestion.normalizer.team_names import to_tricode
 from src.ingestion.normalizer.season import infer_season_label
+from src.ingestion.schedule_service import ScheduleService, schedule_service, tricodes
+
+
+def schedule_fallback_rows(games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Canonical home + away rows (no scores, status "scheduled")
+    for scheduled games, in game order with home before away.
+    Uses the service's home_tricode / away_tricode when present.
+    """
+    n = len(games)
+    game_ids = games["game_id"].astype(str).to_numpy(dtype=object)
+    dates = pd.to_datetime(games["date"]).dt.date.to_numpy()
+    if "home_tricode" in games.columns:
+        home = games["home_tricode"].to_numpy(dtype=object)
+        away = games["away_tricode"].to_numpy(dtype=object)
+    else:
+        home = tricodes(games["home_team"])
+        away = tricodes(games["away_team"])
+    seasons = {d: infer_season_label(d) for d in set(dates)}
+
+    return pd.DataFrame(
+        {
+            "game_id": np.repeat(game_ids, 2),
+            "date": np.repeat(dates, 2),
+            "team": np.column_stack([home, away]).ravel(),
+            "opponent": np.column_stack([away, home]).ravel(),
+            "is_home": np.tile([1, 0], n),
+            "score": pd.array([pd.NA] * (2 * n), dtype="Int16"),
+            "opponent_score": pd.array([pd.NA] * (2 * n), dtype="Int16"),
+            "season": np.repeat([seasons[d] for d in dates], 2),
+            "status": "scheduled",
+            "schema_version": "fallback_schedule",
+        }
+    )
 
 
 class SeasonScheduleFallback(FallbackSource):
@@ -27,6 +67,19 @@ class SeasonScheduleFallback(FallbackSource):
     Fallback using the canonical season schedule snapshot.
     """
 
+    def __init__(self, path: Path = SCHEDULE_SNAPSHOT):
+        self.path = Path(path)
+
+    @property
+    def schedule(self) -> ScheduleService:
+        return schedule_service(self.path)
+
+    def _missing_games(self, day: date, df: pd.DataFrame) -> pd.DataFrame:
+        sched_day = self.schedule.games_on(pd.Timestamp(day).date())
+        if sched_day.empty or "game_id" not in df.columns:
+            return sched_day
+        return sched_day[~sched_day["game_id"].isin(df["game_id"].astype(str))]
+
     def can_fill(self, day: date, df: pd.DataFrame) -> bool:
         """
         True if:
@@ -34,27 +87,15 @@ def can_fill(self, day: date, df: pd.DataFrame) -> bool:
           - snapshot contains games for this date
           - df is missing some of those games
         """
-        if not SCHEDULE_SNAPSHOT.exists():
+        if not self.schedule.exists():
             return False
-
-        sched = pd.read_parquet(SCHEDULE_SNAPSHOT)
-        sched_day = sched[sched["date"] == pd.to_datetime(day).date()]
-
-        if sched_day.empty:
-            return False
-
-        missing_ids = set(sched_day["game_id"]) - set(df["game_id"])
-        return len(missing_ids) > 0
+        return not self._missing_games(day, df).empty
 
     def fill(self, day: date, df: pd.DataFrame) -> pd.DataFrame:
         """
         Fill missing games using the season schedule snapshot.
         """
-        sched = pd.read_parquet(SCHEDULE_SNAPSHOT)
-        sched_day = sched[sched["date"] == pd.to_datetime(day).date()]
-
-        existing_ids = set(df["game_id"])
-        missing = sched_day[~sched_day["game_id"].isin(existing_ids)]
+        missing = self._missing_games(day, df)
 
         if missing.empty:
             return df
@@ -64,39 +105,7 @@ def fill(self, day: date, df: pd.DataFrame) -> pd.DataFrame:
             f"from season schedule snapshot."
         )
 
-        fallback_rows = []
-        for _, row in missing.iterrows():
-            game_id = str(row["game_id"])
-            date_val = pd.to_datetime(row["date"]).date()
-            season = infer_season_label(date_val)
-
-            home = {
-                "game_id": game_id,
-                "date": date_val,
-                "team": to_tricode(row["home_team"]),
-                "opponent": to_tricode(row["away_team"]),
-                "is_home": 1,
-                "score": pd.NA,
-                "opponent_score": pd.NA,
-                "season": season,
-                "status": "scheduled",
-                "schema_version": "fallback_schedule",
-            }
-
-            away = {
-                "game_id": game_id,
-                "date": date_val,
-                "team": to_tricode(row["away_team"]),
-                "opponent": to_tricode(row["home_team"]),
-                "is_home": 0,
-                "score": pd.NA,
-                "opponent_score": pd.NA,
-                "season": season,
-                "status": "scheduled",
-                "schema_version": "fallback_schedule",
-            }
-
-            fallback_rows.extend([home, away])
-
-        fallback_df = pd.DataFrame(fallback_rows)
-        return pd.concat([df, fallback_df], ignore_index=True)
\ No newline at end of file
+        rows = schedule_fallback_rows(missing)
+        if df.empty and set(df.columns) <= set(rows.columns):
+            return rows
+        return pd.concat([df, rows], ignore_index=True)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Ingestion HTTP Client
+# File: src/ingestion/http_client.py
+# Author: Sadiq
+#
+# Description:
+#     Pooled keep-alive HTTP client for the scoreboard
+#     endpoints. One requests.Session (connection pool sized
+#     for the ingestion workers) is shared by every thread;
+#     each request takes a slot from the shared RateLimiter.
+#
+#     403 / 429 responses back off the whole host (honouring
+#     Retry-After when sent) instead of sleeping one loop, so
+#     other hosts and other work keep moving.
+# ============================================================
+
+import threading
+from typing import Optional
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from src.ingestion.rate_limiter import RateLimiter
+from src.ingestion.response_cache import FetchResult
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Referer": "https://www.nba.com/",
+    "Origin": "https://www.nba.com",
+    "Accept": "*/*",
+    "Connection": "keep-alive",
+}
+
+HTTP_POOL_SIZE = 16
+
+# Hosts whose certificates are not verified (legacy endpoint)
+UNVERIFIED_HOSTS = ("data.nba.net",)
+
+
+def _blocked_wait(resp: requests.Response, attempt: int) -> float:
+    retry_after = resp.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return (attempt * 2) + 5
+
+
+class HttpClient:
+    """Thread-safe JSON GETs over one pooled, rate-limited session."""
+
+    def __init__(
+        self,
+        limiter: RateLimiter | None = None,
+        pool_size: int = HTTP_POOL_SIZE,
+        headers: dict | None = None,
+    ):
+        self.limiter = limiter or RateLimiter()
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS if headers is None else headers)
+
+        adapter = HTTPAdapter(pool_connections=len(UNVERIFIED_HOSTS) + 2, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        url: str,
+        retries: int = 5,
+        timeout: int = 10,
+        headers: dict[str, str] | None = None,
+    ) -> Optional[requests.Response]:
+        """
+        GET with retries; the 200 or 304 response, or None once
+        retries are exhausted. SSL verification is skipped only for
+        the legacy endpoint.
+        """
+        is_legacy = any(host in url for host in UNVERIFIED_HOSTS)
+
+        for attempt in range(1, retries + 1):
+            try:
+                with self.limiter.slot(url):
+                    resp = self.session.get(url, headers=headers, timeout=timeout, verify=not is_legacy)
+
+                if resp.status_code in (200, 304):
+                    return resp
+
+                if resp.status_code in (403, 429):
+                    wait = _blocked_wait(resp, attempt)
+                    logger.warning(
+                        f"[HttpClient] Blocked ({resp.status_code}) for {url}. "
+                        f"Retrying in {wait}s..."
+                    )
+                    self.limiter.backoff(url, wait)
+                    continue
+
+                logger.warning(f"[HttpClient] Unexpected status {resp.status_code} for {url}")
+
+            except requests.exceptions.SSLError as e:
+                logger.error(f"[HttpClient] SSL error for {url}: {e}")
+                if not is_legacy:
+                    return None  # only bypass SSL for legacy
+
+            except Exception as e:
+                logger.warning(f"[HttpClient] Attempt {attempt} failed for {url}: {e}")
+
+        logger.error(f"[HttpClient] Exhausted retries for {url}")
+        return None
+
+    def get_json(self, url: str, retries: int = 5, timeout: int = 10) -> Optional[dict]:
+        """Unconditional GET with safe JSON parsing; None on failure."""
+        result = self.conditional_get(url, retries=retries, timeout=timeout)
+        return None if result is None else result.body
+
+    def conditional_get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        retries: int = 5,
+        timeout: int = 10,
+    ) -> Optional[FetchResult]:
+        """
+        GET with conditional headers (If-None-Match / If-Modified-Since).
+        Returns the parsed 200 body with its validators, a body-less
+        304 result, or None on failure.
+        """
+        resp = self.request(url, retries=retries, timeout=timeout, headers=headers)
+        if resp is None:
+            return None
+        if resp.status_code == 304:
+            return FetchResult(status=304)
+
+        try:
+            body = resp.json()
+        except ValueError as e:
+            logger.error(f"[HttpClient] Invalid JSON from {url}: {e}")
+            return None
+        return FetchResult(
+            status=200,
+            body=body,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_default_client: HttpClient | None = None
+_default_lock = threading.Lock()
+
+
+def default_http_client() -> HttpClient:
+    """Process-wide client shared by the collector and all ingestion workers."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Long Snapshot Store
+# File: src/ingestion/long_snapshot_store.py
+# Author: Sadiq
+#
+# Description:
+#     Date-partitioned canonical long snapshot:
+#
+#         LONG_SNAPSHOT/
+#             _manifest.json
+#             2023-24/2023-10-24.parquet
+#             2023-24/2023-10-25.parquet
+#             ...
+#
+#     One parquet file per game date, grouped by season. Ingesting
+#     a date rewrites only that date's file (tmp file + os.replace)
+#     and its manifest entry, then verifies the write from the
+#     parquet footer (row count, columns) — no data pages are read
+#     back. Write cost depends on the size of the day, not of the
+#     history.
+#
+#     The manifest doubles as a date / game index: per date, the
+#     row range of every game_id within the date's file and game
+#     counts per status. Existence checks, missing-date detection,
+#     game lookups and single-date reads use the index alone (the
+#     parsed manifest is cached per process until the file
+#     changes).
+#
+#     Directory names carry no "key=value", and "_" / "." files
+#     are ignored by parquet readers, so pd.read_parquet and
+#     pyarrow datasets read LONG_SNAPSHOT as a plain dataset
+#     in date order.
+# ============================================================
+
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
+
+from src.config.paths import LEGACY_LONG_SNAPSHOT, LONG_SNAPSHOT
+from src.ingestion.normalizer.season import infer_season_label
+
+MANIFEST_NAME = "_manifest.json"
+
+# Bumped when the per-date index entries change shape
+INDEX_VERSION = 1
+
+# A row's identity; a later ingest of the same key replaces it
+ROW_KEY = ["game_id", "team"]
+ROW_ORDER = ["date", "game_id", "team"]
+
+
+def _as_date(value) -> date:
+    return pd.Timestamp(value).date()
+
+
+def _day_index(rows: pd.DataFrame) -> dict:
+    """
+    {"games": {game_id: [start, stop]}, "status": {status: games}}
+    for one date's rows, sorted so each game's rows are contiguous.
+    """
+    if rows.empty:
+        return {"games": {}, "status": {}}
+
+    game_ids = rows["game_id"].astype(str).to_numpy()
+    starts = np.flatnonzero(np.r_[True, game_ids[1:] != game_ids[:-1]])
+    stops = np.r_[starts[1:], len(game_ids)]
+    games = {game_ids[a]: [int(a), int(b)] for a, b in zip(starts, stops)}
+
+    status = {}
+    if "status" in rows.columns:
+        values, counts = np.unique(rows["status"].to_numpy()[starts].astype(str), return_counts=True)
+        status = {str(k): int(v) for k, v in zip(values, counts)}
+    return {"games": games, "status": status}
+
+
+def _row_order(rows: pd.DataFrame) -> np.ndarray:
+    """Positions that put rows in (date, game_id, team) order."""
+    keys = [rows[c].astype(str).to_numpy() for c in reversed(ROW_ORDER[1:])]
+    return np.lexsort([*keys, pd.to_datetime(rows["date"]).to_numpy()])
+
+
+# Parsed manifests by path, valid while (mtime, size) is unchanged
+_INDEX_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+class LongSnapshotStore:
+    """
+    Reader/writer for the date-partitioned long snapshot.
+    """
+
+    def __init__(self, root: Path = LONG_SNAPSHOT, legacy: Path | None = LEGACY_LONG_SNAPSHOT):
+        self.root = Path(root)
+        self.manifest_path = self.root / MANIFEST_NAME
+        self.legacy = None if legacy is None else Path(legacy)
+
+    # ------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------
+    @staticmethod
+    def relative_path(day: date) -> str:
+        return f"{infer_season_label(day)}/{day.isoformat()}.parquet"
+
+    def partition_path(self, day: date) -> Path:
+        return self.root / self.relative_path(day)
+
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    # ------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------
+    def load_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {"columns": [], "days": {}}
+        return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    def save_manifest(self, manifest: dict) -> None:
+        manifest["index_version"] = INDEX_VERSION
+        manifest["rows"] = sum(entry["rows"] for entry in manifest["days"].values())
+        manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_suffix(".tmp")
+        # Compact: the index grows with history and is rewritten on every ingest
+        temp_path.write_text(json.dumps(manifest, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, self.manifest_path)
+
+    def index(self) -> dict:
+        """
+        The manifest for read-only lookups: cached until the file
+        changes, and indexed first if written before the index
+        existed. Do not mutate.
+        """
+        self.migrate_legacy()
+        try:
+            st = self.manifest_path.stat()
+        except FileNotFoundError:
+            return {"columns": [], "days": {}}
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _INDEX_CACHE.get(self.manifest_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        manifest = self.load_manifest()
+        if manifest.get("index_version") != INDEX_VERSION:
+            self._reindex(manifest)
+            self.save_manifest(manifest)
+            return self.index()
+
+        _INDEX_CACHE[self.manifest_path] = (key, manifest)
+        return manifest
+
+    def _reindex(self, manifest: dict) -> None:
+        logger.info(f"[LongSnapshot] Indexing {len(manifest['days'])} date partitions")
+        for entry in manifest["days"].values():
+            rows = pd.read_parquet(self.root / entry["path"], columns=["game_id", "status"])
+            entry.update(_day_index(rows))
+
+    # ------------------------------------------------------------
+    # Index lookups (no data pages read)
+    # ------------------------------------------------------------
+    def days(self) -> list[date]:
+        return sorted(date.fromisoformat(d) for d in self.index()["days"])
+
+    def has_date(self, day: date) -> bool:
+        return day.isoformat() in self.index()["days"]
+
+    def missing_dates(self, start: date, end: date) -> list[date]:
+        """Dates in [start, end] with no stored rows."""
+        stored = self.index()["days"]
+        span = (end - start).days + 1
+        days = (start + timedelta(days=i) for i in range(max(span, 0)))
+        return [d for d in days if d.isoformat() not in stored]
+
+    def games_on(self, day: date) -> list[str]:
+        entry = self.index()["days"].get(day.isoformat())
+        return [] if entry is None else list(entry["games"])
+
+    def status_counts(self, day: date) -> dict[str, int]:
+        """{status: games} for a date ({} when it has no rows)."""
+        entry = self.index()["days"].get(day.isoformat())
+        return {} if entry is None else dict(entry["status"])
+
+    def locate_game(self, game_id: str) -> tuple[date, int, int] | None:
+        """(date, first row, end row) of a game within its date's file."""
+        for day, entry in self.index()["days"].items():
+            span = entry["games"].get(str(game_id))
+            if span is not None:
+                return date.fromisoformat(day), span[0], span[1]
+        return None
+
+    # ------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------
+    def _write_day(self, day: date, rows: pd.DataFrame, manifest: dict) -> None:
+        """Atomically replace one date's file, verify it, record it in `manifest`."""
+        path = self.partition_path(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = path.with_name(f".{path.name}.tmp")
+        rows.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+
+        # Verification from the footer only
+        meta = pq.read_metadata(path)
+        if meta.num_rows != len(rows):
+            raise ValueError(
+                f"Verification Failed: {path.name} has {meta.num_rows} rows, expected {len(rows)}."
+            )
+        if list(meta.schema.to_arrow_schema().names) != list(rows.columns):
+            raise ValueError(f"Verification Failed: {path.name} columns differ from the written rows.")
+
+        manifest["days"][day.isoformat()] = {
+            "rows": int(len(rows)),
+            "path": self.relative_path(day),
+            "written_at": datetime.now(timezone.utc).isoformat(),
+            **_day_index(rows),
+        }
+
+    def write_days(self, new_rows: pd.DataFrame) -> dict[date, int]:
+        """
+        Merge new_rows into the snapshot, one date partition at a
+        time. Rows already stored for a date are kept unless
+        new_rows has the same (game_id, team), in which case the new
+        row wins (a later fetch has the later score / status).
+
+        Returns:
+            {date: rows now stored for that date}
+        """
+        if new_rows.empty:
+            return {}
+
+        self.migrate_legacy()
+        manifest = self.load_manifest()
+        manifest["columns"] = list(new_rows.columns)
+        if manifest["days"] and manifest.get("index_version") != INDEX_VERSION:
+            self._reindex(manifest)
+
+        days = new_rows["date"].map(_as_date)
+        written: dict[date, int] = {}
+        for day, rows in new_rows.groupby(days, sort=True):
+            stored = manifest["days"].get(day.isoformat())
+            if stored is not None:
+                rows = pd.concat([pd.read_parquet(self.root / stored["path"]), rows], ignore_index=True)
+            rows = rows.drop_duplicates(subset=ROW_KEY, keep="last")
+            rows = rows.iloc[_row_order(rows)].reset_index(drop=True)
+            self._write_day(day, rows, manifest)
+            written[day] = len(rows)
+
+        self.save_manifest(manifest)
+        logger.success(
+            f"[LongSnapshot] Updated {len(written)} date partitions → {self.root.name} "
+            f"(Total rows: {manifest['rows']}, New rows: {len(new_rows)})"
+        )
+        return written
+
+    def rewrite(self, rows: pd.DataFrame) -> dict[date, int]:
+        """
+        Replace the whole snapshot with `rows` (full rebuilds and
+        conversions). Partitions of dates not in `rows` are removed.
+        """
+        manifest = {"columns": list(rows.columns), "days": {}}
+        for path in self.root.glob("*/*.parquet"):
+            path.unlink()
+
+        # Dedupe and sort once; each date is then a contiguous slice
+        rows = rows.drop_duplicates(subset=ROW_KEY)
+        rows = rows.iloc[_row_order(rows)].reset_index(drop=True)
+        days = pd.to_datetime(rows["date"]).dt.date.to_numpy()
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]]) if len(days) else []
+        stops = np.r_[starts[1:], len(days)] if len(days) else []
+
+        written: dict[date, int] = {}
+        for a, b in zip(starts, stops):
+            self._write_day(days[a], rows.iloc[a:b].reset_index(drop=True), manifest)
+            written[days[a]] = int(b - a)
+
+        self.save_manifest(manifest)
+        logger.success(f"[LongSnapshot] Rewrote {self.root.name}: {len(written)} dates, {manifest['rows']} rows")
+        return written
+
+    def migrate_legacy(self) -> bool:
+        """
+        Split a single-file snapshot (the previous layout) into date
+        partitions, once. The legacy file is left in place.
+        """
+        if self.exists() or self.legacy is None or not self.legacy.exists():
+            return False
+
+        legacy = pd.read_parquet(self.legacy)
+        logger.info(f"[LongSnapshot] Migrating {self.legacy.name} ({len(legacy)} rows) to date partitions")
+        self.rewrite(legacy)
+        return True
+
+    # ------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------
+    def read_day(
+        self,
+        day: date,
+        game_ids: Iterable[str] | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        One date's rows (optionally only some games), located via
+        the index; empty when the date has no rows.
+        """
+        columns = None if columns is None else list(columns)
+        entry = self.index()["days"].get(day.isoformat())
+        if entry is None:
+            return pd.DataFrame(columns=columns or self.index()["columns"])
+
+        table = pq.read_table(self.root / entry["path"], columns=columns)
+        if game_ids is not None:
+            spans = [entry["games"][g] for g in map(str, game_ids) if g in entry["games"]]
+            rows = [np.arange(a, b) for a, b in sorted(spans)]
+            table = table.take(np.concatenate(rows) if rows else np.empty(0, dtype=np.int64))
+        return table.to_pandas()
+
+    def read(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Rows with start <= date <= end (either bound optional), in
+        (date, game_id, team) order. Only the files of dates in
+        range are opened.
+        """
+        manifest = self.index()
+        entries = sorted(manifest["days"].items())
+        paths = [
+            str(self.root / entry["path"])
+            for day, entry in entries
+            if (start is None or day >= start.isoformat()) and (end is None or day <= end.isoformat())
+        ]
+        columns = None if columns is None else list(columns)
+
+        if not paths:
+            return pd.DataFrame(columns=columns or manifest["columns"])
+        return ds.dataset(paths, format="parquet").to_table(columns=columns).to_pandas()
+
+
+def load_long_snapshot(
+    start: date | None = None,
+    end: date | None = None,
+    columns: Iterable[str] | None = None,
+    root: Path = LONG_SNAPSHOT,
+) -> pd.DataFrame:
+    """Convenience reader for the canonical long snapshot."""
+    return LongSnapshotStore(root).read(start=start, end=end, columns=columns)
+
+
+def long_snapshot_exists(root: Path = LONG_SNAPSHOT, legacy: Path | None = LEGACY_LONG_SNAPSHOT) -> bool:
+    """
+    True when the canonical long snapshot exists. A legacy
+    single-file snapshot is migrated first, so existence checks
+    behave the same on installs that have not ingested since.
+    """
+    store = LongSnapshotStore(root, legacy=legacy)
+    store.migrate_legacy()
+    return store.exists()
@@ -7,60 +7,94 @@
 # Author: Sadiq
 #
 # Description:
-#     Automatically detects and backfills missing dates in the
-#     canonical long-format snapshot. Integrates with the
-#     orchestrator and validator to ensure safe recovery.
+#     Backfills the canonical long-format snapshot from a
+#     schedule-aware plan (backfill_planner): only dates with
+#     scheduled games but no rows, missing games or unfinished
+#     scores are fetched — off-days and the offseason are not.
+#
+#     The plan is logged and written to BACKFILL_PLAN_REPORT
+#     before anything is fetched; dates are then ingested in
+#     concurrent batches, each validated and written to its
+#     date partitions before the next starts. Planned dates are
+#     fetched with force=True: their cached scoreboards (possibly
+#     marked immutable) are what left them incomplete. The
+#     persisted team feature state is brought up to date at the
+#     end.
 # ============================================================
 
 from datetime import date
 import pandas as pd
 from loguru import logger
 
-from src.config.paths import LONG_SNAPSHOT
-from src.ingestion.maintenance.missing_dates import detect_missing_dates
+from src.features.builder import FeatureBuilder
+from src.ingestion.collector import INGEST_MAX_WORKERS
+from src.ingestion.long_snapshot_store import LongSnapshotStore
+from src.ingestion.maintenance.backfill_planner import (
+    BACKFILL_BATCH_DAYS,
+    log_plan,
+    plan_backfill,
+    write_plan_report,
+)
 from src.ingestion.orchestrator import ingest_dates
 from src.ingestion.validator.team_game_validator import validate_team_game_df
 
 
-def auto_backfill(start: date, end: date) -> pd.DataFrame:
+def auto_backfill(
+    start: date,
+    end: date,
+    dry_run: bool = False,
+    max_workers: int = INGEST_MAX_WORKERS,
+    batch_days: int = BACKFILL_BATCH_DAYS,
+) -> pd.DataFrame:
     """
-    Detect and backfill missing dates between [start, end].
+    Plan and backfill [start, end].
+
+    dry_run:
+        Only produce (log + write) the plan.
 
     Returns:
         DataFrame of newly ingested rows.
     """
-    logger.info(f"[Backfill] Checking for missing dates between {start} and {end}")
+    logger.info(f"[Backfill] Planning backfill between {start} and {end}")
 
-    missing = detect_missing_dates(start, end)
-    if not missing:
-        logger.success("[Backfill] No missing dates detected.")
-        return pd.DataFrame()
+    store = LongSnapshotStore()
+    plan = plan_backfill(start, end, store=store)
+    log_plan(plan)
+    report = write_plan_report(plan)
+    logger.info(f"[Backfill] Plan written → {report}")
 
-    logger.warning(f"[Backfill] Missing {len(missing)} dates: {missing}")
+    if plan.empty:
+        logger.success("[Backfill] Nothing to backfill.")
+        return pd.DataFrame()
 
-    # Ingest missing dates
-    new_rows = ingest_dates(missing)
-    if new_rows.empty:
-        logger.error("[Backfill] No rows ingested during backfill.")
+    if dry_run:
+        logger.info(f"[Backfill] Dry run: {len(plan.items)} dates planned, nothing fetched.")
         return pd.DataFrame()
 
-    # Validate the newly ingested rows
-    validate_team_game_df(new_rows, raise_on_error=True)
+    ingested = []
+    for batch in plan.batches(batch_days):
+        # Planned dates are incomplete: their cached boards must not be reused
+        new_rows = ingest_dates(batch, max_workers=max_workers, force=True)
+        if new_rows.empty:
+            logger.error(f"[Backfill] No rows ingested for {batch[0]} → {batch[-1]}.")
+            continue
+
+        # Validate, then write only these dates' partitions
+        validate_team_game_df(new_rows, raise_on_error=True)
+        store.write_days(new_rows)
+        ingested.append(new_rows)
 
-    # Append to snapshot
-    if LONG_SNAPSHOT.exists():
-        existing = pd.read_parquet(LONG_SNAPSHOT)
-        combined = pd.concat([existing, new_rows], ignore_index=True)
-    else:
-        combined = new_rows
+    if not ingested:
+        logger.error("[Backfill] No rows ingested during backfill.")
+        return pd.DataFrame()
 
-    combined = combined.drop_duplicates(subset=["game_id", "team"]).sort_values(
-        ["date", "game_id", "team"]
-    )
+    new_rows = pd.concat(ingested, ignore_index=True)
 
-    combined.to_parquet(LONG_SNAPSHOT, index=False)
-    logger.success(
-        f"[Backfill] Backfill complete. Snapshot now has {len(combined)} rows."
-    )
+    # Once for the whole backfill: past dates usually mean a rebuild
+    try:
+        FeatureBuilder(use_cache=False).advance_state(new_rows)
+    except Exception as e:
+        logger.warning(f"[Backfill] Team state not updated: {e}")
 
-    return new_rows
\ No newline at end of file
+    logger.success(f"[Backfill] Backfill complete. Wrote {len(new_rows)} rows.")
+    return new_rows
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Backfill Planner
+# File: src/ingestion/maintenance/backfill_planner.py
+# Author: Sadiq
+#
+# Description:
+#     Schedule-aware backfill planning. Instead of treating every
+#     calendar day without rows as missing (All-Star break,
+#     offseason, ...), compares the long snapshot's date / game
+#     index with the schedule snapshots and plans only dates
+#     that really need fetching:
+#         - no_rows:        scheduled games, nothing stored
+#         - missing_games:  fewer games stored than scheduled
+#         - missing_scores: stored games not final yet
+#
+#     Only past dates are planned (today's games may still be
+#     in progress). Without any schedule snapshot the planner
+#     falls back to calendar gaps and says so in the plan.
+#
+#     Planning reads the schedules (ScheduleService) and the
+#     snapshot index only — no snapshot data pages.
+# ============================================================
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+from loguru import logger
+
+from src.config.paths import BACKFILL_PLAN_REPORT, DAILY_SCHEDULE_SNAPSHOT, SEASON_SCHEDULE_PATH
+from src.ingestion.long_snapshot_store import LongSnapshotStore
+from src.ingestion.schedule_service import schedule_service
+
+SCHEDULE_SOURCES = (SEASON_SCHEDULE_PATH, DAILY_SCHEDULE_SNAPSHOT)
+
+# Dates per concurrent ingest batch (rows are written after each)
+BACKFILL_BATCH_DAYS = 30
+
+# Identifies a scheduled game across sources with different game_id schemes
+MATCHUP_KEY = ("date", "home_tricode", "away_tricode")
+
+REASONS = ("no_rows", "missing_games", "missing_scores", "calendar_gap")
+
+
+def is_final_status(status: str) -> bool:
+    """Scoreboard statuses of finished games ("Final", "final/ot", "3")."""
+    text = str(status).strip().lower()
+    return text.startswith("final") or text == "3"
+
+
+@dataclass
+class BackfillItem:
+    day: date
+    reason: str
+    scheduled_games: int
+    stored_games: int
+    unfinished_games: int = 0
+
+
+@dataclass
+class BackfillPlan:
+    start: date
+    end: date
+    items: list[BackfillItem] = field(default_factory=list)
+    scheduled_dates: int = 0
+    off_days: int = 0                   # calendar days without scheduled games
+    complete_dates: int = 0
+    schedule_sources: list[str] = field(default_factory=list)
+
+    @property
+    def dates(self) -> list[date]:
+        return [item.day for item in self.items]
+
+    @property
+    def empty(self) -> bool:
+        return not self.items
+
+    def batches(self, size: int = BACKFILL_BATCH_DAYS) -> list[list[date]]:
+        if size < 1:
+            raise ValueError(f"Batch size must be >= 1, got {size}")
+        dates = self.dates
+        return [dates[i:i + size] for i in range(0, len(dates), size)]
+
+    def summary(self) -> dict:
+        counts = {reason: 0 for reason in REASONS}
+        for item in self.items:
+            counts[item.reason] += 1
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "dates_to_fetch": len(self.items),
+            "by_reason": {k: v for k, v in counts.items() if v},
+            "scheduled_dates": self.scheduled_dates,
+            "complete_dates": self.complete_dates,
+            "off_days_skipped": self.off_days,
+            "schedule_sources": self.schedule_sources,
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [asdict(item) for item in self.items],
+            columns=["day", "reason", "scheduled_games", "stored_games", "unfinished_games"],
+        )
+
+
+def _scheduled_games(start: date, end: date, sources: Iterable[Path]) -> tuple[dict[date, int], list[str]]:
+    """
+    {date: scheduled games} over every available schedule. Sources
+    use different game_id schemes (synthetic vs NBA ids), so games
+    are matched on (date, home, away) tricodes; per matchup the
+    largest count in any one source is kept.
+    """
+    counts, used = [], []
+    for path in sources:
+        service = schedule_service(path)
+        if not service.exists():
+            continue
+        games = service.games_between(start, end)
+        counts.append(games.groupby(list(MATCHUP_KEY)).size())
+        used.append(Path(path).name)
+
+    if not counts:
+        return {}, used
+
+    per_matchup = pd.concat(counts, axis=1).max(axis=1)
+    per_day = per_matchup.groupby(level="date").sum()
+    return {ts.date(): int(n) for ts, n in per_day.items() if n}, used
+
+
+def plan_backfill(
+    start: date,
+    end: date,
+    store: LongSnapshotStore | None = None,
+    schedules: Iterable[Path] = SCHEDULE_SOURCES,
+    today: date | None = None,
+) -> BackfillPlan:
+    """
+    Dates in [start, end] (and before today) whose stored rows
+    fall short of the schedule. See the module description for
+    the reasons a date is planned.
+    """
+    if start > end:
+        raise ValueError(f"start {start} is after end {end}")
+
+    store = store or LongSnapshotStore()
+    today = today or date.today()
+    last = min(end, today - timedelta(days=1))
+    plan = BackfillPlan(start=start, end=end)
+    if last < start:
+        return plan
+
+    scheduled, plan.schedule_sources = _scheduled_games(start, last, schedules)
+    calendar_days = (last - start).days + 1
+
+    if not plan.schedule_sources:
+        logger.warning("[BackfillPlanner] No schedule snapshot available — planning calendar gaps.")
+        for day in store.missing_dates(start, last):
+            plan.items.append(BackfillItem(day, "calendar_gap", 0, 0))
+        plan.complete_dates = calendar_days - len(plan.items)
+        return plan
+
+    index = store.index()["days"]
+    plan.scheduled_dates = len(scheduled)
+    plan.off_days = calendar_days - len(scheduled)
+
+    for day in sorted(scheduled):
+        entry = index.get(day.isoformat())
+        stored = 0 if entry is None else len(entry["games"])
+        unfinished = 0
+        if entry is not None:
+            unfinished = sum(n for status, n in entry["status"].items() if not is_final_status(status))
+
+        if stored == 0:
+            reason = "no_rows"
+        elif stored < scheduled[day]:
+            reason = "missing_games"
+        elif unfinished:
+            reason = "missing_scores"
+        else:
+            plan.complete_dates += 1
+            continue
+        plan.items.append(BackfillItem(day, reason, scheduled[day], stored, unfinished))
+
+    return plan
+
+
+def write_plan_report(plan: BackfillPlan, path: Path = BACKFILL_PLAN_REPORT) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "planned_at": datetime.now(timezone.utc).isoformat(),
+        "summary": plan.summary(),
+        "items": [{**asdict(item), "day": item.day.isoformat()} for item in plan.items],
+    }
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(temp_path, path)
+    return path
+
+
+def log_plan(plan: BackfillPlan) -> None:
+    summary = plan.summary()
+    logger.info(
+        f"🗓️ [BackfillPlanner] {summary['start']} → {summary['end']}: "
+        f"{summary['dates_to_fetch']} dates to fetch {summary['by_reason']}, "
+        f"{summary['complete_dates']} complete, {summary['off_days_skipped']} off-days skipped "
+        f"(schedules: {summary['schedule_sources'] or 'none'})"
+    )
@@ -12,10 +12,9 @@
 #     inconsistent seasons, and other ingestion anomalies.
 # ============================================================
 
-import pandas as pd
 from loguru import logger
 
-from src.config.paths import LONG_SNAPSHOT
+from src.ingestion.long_snapshot_store import LongSnapshotStore, load_long_snapshot, long_snapshot_exists
 from src.ingestion.normalizer.canonicalizer import CANONICAL_COLUMNS
 from src.ingestion.validator.checks import (
     find_incomplete_games,
@@ -28,18 +27,19 @@ def inspect_long_snapshot() -> None:
     """
     Print diagnostics about the long-format snapshot.
     """
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         logger.error("[Inspector] LONG_SNAPSHOT does not exist.")
         return
 
-    df = pd.read_parquet(LONG_SNAPSHOT)
+    df = load_long_snapshot()
     logger.info(f"[Inspector] Loaded {len(df)} rows from LONG_SNAPSHOT.")
 
     # ------------------------------------------------------------
     # Basic stats
     # ------------------------------------------------------------
-    logger.info(f"[Inspector] Unique dates: {df['date'].nunique()}")
-    logger.info(f"[Inspector] Unique games: {df['game_id'].nunique()}")
+    index = LongSnapshotStore().index()["days"]
+    logger.info(f"[Inspector] Unique dates: {len(index)}")
+    logger.info(f"[Inspector] Unique games: {len({g for entry in index.values() for g in entry['games']})}")
 
     # ------------------------------------------------------------
     # Schema drift detection
@@ -12,11 +12,10 @@
 #     backfilling, and drift detection.
 # ============================================================
 
-from datetime import date, timedelta
-import pandas as pd
+from datetime import date
 from loguru import logger
 
-from src.config.paths import LONG_SNAPSHOT
+from src.ingestion.long_snapshot_store import LongSnapshotStore
 
 
 def detect_missing_dates(start: date, end: date) -> list[date]:
@@ -28,20 +27,13 @@ def detect_missing_dates(start: date, end: date) -> list[date]:
         logger.error("[MissingDates] start > end — invalid range.")
         return []
 
-    if not LONG_SNAPSHOT.exists():
+    store = LongSnapshotStore()
+    if not store.index()["days"]:
         logger.warning("[MissingDates] LONG_SNAPSHOT does not exist.")
         return []
 
-    # Projection: Only load 'date' column
-    df = pd.read_parquet(LONG_SNAPSHOT, columns=["date"])
-    df_dates = set(pd.to_datetime(df["date"]).dt.date)
-
-    missing = []
-    cur = start
-    while cur <= end:
-        if cur not in df_dates:
-            missing.append(cur)
-        cur += timedelta(days=1)
+    # Date index only: no parquet data is read
+    missing = store.missing_dates(start, end)
 
     if missing:
         logger.warning(f"[MissingDates] Missing {len(missing)} dates in range.")
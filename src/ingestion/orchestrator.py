@@ -8,12 +8,12 @@
 # ============================================================
 
 from datetime import date
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 import pandas as pd
 from loguru import logger
 
-from src.ingestion.collector import fetch_scoreboard_for_date
+from src.ingestion.collector import INGEST_MAX_WORKERS, fetch_scoreboard_for_date, iter_scoreboards
 from src.ingestion.normalizer.scoreboard_normalizer import normalize_scoreboard_to_wide
 from src.ingestion.normalizer.wide_to_long import wide_to_long
 from src.ingestion.normalizer.canonicalizer import canonicalize_team_game_df
@@ -30,7 +30,7 @@
 # Internal helpers
 # ------------------------------------------------------------
 
-def _process_single_date(day: date) -> pd.DataFrame:
+def _process_single_date(day: date, df_raw: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Fetch, normalize, canonicalize, fallback, validate.
     Returns canonical long-format rows for a single date.
@@ -40,7 +40,8 @@ def _process_single_date(day: date) -> pd.DataFrame:
     # --------------------------------------------------------
     # Fetch raw scoreboard
     # --------------------------------------------------------
-    df_raw = fetch_scoreboard_for_date(day)
+    if df_raw is None:
+        df_raw = fetch_scoreboard_for_date(day)
     logger.debug(f"[Orchestrator] Raw rows: {len(df_raw)}")
 
     # --------------------------------------------------------
@@ -96,8 +97,20 @@ def ingest_single_date(day: date) -> pd.DataFrame:
     return _process_single_date(day)
 
 
-def ingest_dates(dates: Iterable[date]) -> pd.DataFrame:
-    """Ingest multiple dates and return canonical long-format rows."""
+def ingest_dates(
+    dates: Iterable[date],
+    max_workers: int = INGEST_MAX_WORKERS,
+    force: bool = False,
+) -> pd.DataFrame:
+    """
+    Ingest multiple dates and return canonical long-format rows
+    (in date order).
+
+    max_workers > 1 downloads scoreboards concurrently (pooled session,
+    shared rate limiter) while finished dates are normalized here.
+    force=True re-downloads every date instead of using cached
+    scoreboards.
+    """
     dates = list(dates)
     if not dates:
         logger.warning("[Orchestrator] ingest_dates called with no dates.")
@@ -105,19 +118,21 @@ def ingest_dates(dates: Iterable[date]) -> pd.DataFrame:
 
     logger.info(
         f"[Orchestrator] Ingesting {len(dates)} dates "
-        f"(start={dates[0]}, end={dates[-1]})"
+        f"(start={dates[0]}, end={dates[-1]}, workers={max_workers})"
     )
 
-    all_rows: List[pd.DataFrame] = []
+    by_day: dict[date, pd.DataFrame] = {}
 
-    for d in dates:
+    for d, df_raw in iter_scoreboards(dates, max_workers=max_workers, force=force):
         try:
-            df_day = _process_single_date(d)
+            df_day = _process_single_date(d, df_raw)
             if not df_day.empty:
-                all_rows.append(df_day)
+                by_day[d] = df_day
         except Exception as e:
             logger.error(f"[Orchestrator] Failed to ingest {d}: {e}")
 
+    all_rows: List[pd.DataFrame] = [by_day[d] for d in dates if d in by_day]
+
     if not all_rows:
         return pd.DataFrame()
 
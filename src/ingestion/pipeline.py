@@ -7,21 +7,21 @@
 # Author: Sadiq
 # ============================================================
 
-import os
 from datetime import date
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 import pandas as pd
 from loguru import logger
 
-from src.config.paths import LONG_SNAPSHOT
-from src.ingestion.collector import fetch_scoreboard_for_date
+from src.ingestion.collector import INGEST_MAX_WORKERS, fetch_scoreboard_for_date, iter_scoreboards
 from src.ingestion.normalizer.scoreboard_normalizer import normalize_scoreboard_to_wide
 from src.ingestion.normalizer.wide_to_long import wide_to_long
 from src.ingestion.normalizer.canonicalizer import canonicalize_team_game_df
 from src.ingestion.validator.team_game_validator import validate_team_game_df
 from src.ingestion.fallback.manager import FallbackManager
 from src.ingestion.fallback.schedule_fallback import SeasonScheduleFallback
+from src.ingestion.long_snapshot_store import LongSnapshotStore
+from src.features.builder import FeatureBuilder
 
 
 # Instantiate fallbacks once
@@ -32,51 +32,32 @@
 # Helpers
 # ------------------------------------------------------------
 
-def _dedupe_and_sort(df: pd.DataFrame) -> pd.DataFrame:
-    if df.empty:
-        return df
-    return (
-        df.drop_duplicates(subset=["game_id", "team"])
-        .sort_values(["date", "game_id", "team"])
-        .reset_index(drop=True)
-    )
-
-
 def _update_snapshot_atomically(new_rows: pd.DataFrame) -> None:
-    """Writes to a temporary file before replacing the target to prevent corruption."""
-    if LONG_SNAPSHOT.exists():
-        existing = pd.read_parquet(LONG_SNAPSHOT)
-        combined = pd.concat([existing, new_rows], ignore_index=True)
-    else:
-        combined = new_rows
-
-    combined = _dedupe_and_sort(combined)
-
-    temp_path = LONG_SNAPSHOT.with_suffix(".tmp.parquet")
-    combined.to_parquet(temp_path, index=False)
-
-    os.replace(temp_path, LONG_SNAPSHOT)
-
-    # Verification
-    if not LONG_SNAPSHOT.exists():
-        raise FileNotFoundError(f"Verification Failed: {LONG_SNAPSHOT} was not created.")
-
-    verification_df = pd.read_parquet(LONG_SNAPSHOT)
-    if verification_df.empty:
-        raise ValueError(f"Verification Failed: {LONG_SNAPSHOT} is empty after write.")
-
-    logger.success(
-        f"[Ingestion] Snapshot updated → {LONG_SNAPSHOT.name} "
-        f"(Total rows: {len(combined)}, New rows: {len(new_rows)})"
-    )
+    """
+    Write the ingested dates into the date-partitioned long snapshot.
+    Only the partitions of those dates are rewritten (each one
+    atomically, verified from its parquet footer). The persisted
+    per-team feature state is then advanced with the new rows.
+    """
+    LongSnapshotStore().write_days(new_rows)
+    _advance_team_state(new_rows)
+
+
+def _advance_team_state(new_rows: pd.DataFrame) -> None:
+    """Best effort: predictions rebuild the state from history if this fails."""
+    try:
+        FeatureBuilder(use_cache=False).advance_state(new_rows)
+    except Exception as e:
+        logger.warning(f"[Ingestion] Team state not advanced: {e}")
 
 
-def _process_date_to_memory(day: date) -> pd.DataFrame:
+def _process_date_to_memory(day: date, df_raw: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """Fetch, normalize, canonicalize, fallback, validate — all in memory."""
     logger.info(f"[Ingestion] Processing {day}")
 
     # Fetch
-    df_raw = fetch_scoreboard_for_date(day)
+    if df_raw is None:
+        df_raw = fetch_scoreboard_for_date(day)
     logger.debug(f"[Ingestion] Raw rows: {len(df_raw)}")
 
     # Normalize → wide → long
@@ -119,8 +100,19 @@ def _process_date_to_memory(day: date) -> pd.DataFrame:
 # Public API
 # ------------------------------------------------------------
 
-def ingest_dates(dates: Iterable[date]) -> pd.DataFrame:
-    """Batch ingestion: Collects all data in memory before a single verified write."""
+def ingest_dates(
+    dates: Iterable[date],
+    max_workers: int = INGEST_MAX_WORKERS,
+    force: bool = False,
+) -> pd.DataFrame:
+    """
+    Batch ingestion: Collects all data in memory before a single verified write.
+
+    max_workers > 1 downloads scoreboards concurrently (pooled session,
+    shared rate limiter) while finished dates are normalized here.
+    force=True re-downloads every date instead of using cached
+    scoreboards.
+    """
     dates = list(dates)
     if not dates:
         logger.warning("[Ingestion] ingest_dates called with no dates.")
@@ -128,19 +120,21 @@ def ingest_dates(dates: Iterable[date]) -> pd.DataFrame:
 
     logger.info(
         f"[Ingestion] Ingesting {len(dates)} dates "
-        f"(start={dates[0]}, end={dates[-1]})"
+        f"(start={dates[0]}, end={dates[-1]}, workers={max_workers})"
     )
 
-    all_new_data: List[pd.DataFrame] = []
+    by_day: dict[date, pd.DataFrame] = {}
 
-    for d in dates:
+    for d, df_raw in iter_scoreboards(dates, max_workers=max_workers, force=force):
         try:
-            df_day = _process_date_to_memory(d)
+            df_day = _process_date_to_memory(d, df_raw)
             if not df_day.empty:
-                all_new_data.append(df_day)
+                by_day[d] = df_day
         except Exception as e:
             logger.error(f"[Ingestion] Failed to process {d}: {e}")
 
+    all_new_data: List[pd.DataFrame] = [by_day[d] for d in dates if d in by_day]
+
     if not all_new_data:
         logger.warning("[Ingestion] No new rows ingested.")
         return pd.DataFrame()
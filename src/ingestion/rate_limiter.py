@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Ingestion Rate Limiter
+# File: src/ingestion/rate_limiter.py
+# Author: Sadiq
+#
+# Description:
+#     Shared, thread-safe request pacing for concurrent
+#     ingestion:
+#         - one token bucket per host (requests per second plus
+#           a burst allowance)
+#         - a cap on in-flight requests per host
+#         - host-wide backoff: a 403 / 429 pauses that host for
+#           every worker, without blocking other hosts
+#
+#     Tokens are reserved under the lock and waited for outside
+#     it, so workers are served in arrival order. A pause drains
+#     the bucket, so waiters are released one token apart.
+# ============================================================
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable
+from urllib.parse import urlparse
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    rate: float             # sustained requests per second
+    burst: int = 1          # requests allowed back to back
+    max_concurrent: int = 4
+
+    def __post_init__(self):
+        if self.rate <= 0 or self.burst < 1 or self.max_concurrent < 1:
+            raise ValueError(f"Invalid host limit: {self}")
+
+
+DEFAULT_HOST_LIMIT = HostLimit(rate=2.0, burst=2, max_concurrent=2)
+
+HOST_LIMITS = {
+    "cdn.nba.com": HostLimit(rate=5.0, burst=5, max_concurrent=6),
+    "data.nba.net": HostLimit(rate=2.0, burst=2, max_concurrent=2),
+}
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # _updated may lie in the future while paused: nothing refills until then
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = max(self._updated, now)
+
+    def acquire(self) -> float:
+        """Take one token, waiting as needed. Returns seconds waited."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            debt = max(-self._tokens, 0.0)
+            wait = max(self._paused_until - now, 0.0) + debt / self.rate
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold every acquire for at least `seconds` from now. The bucket
+        is emptied and does not refill during the pause, so workers
+        queued behind it resume at the sustained rate, not as a burst.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = self._paused_until
+
+
+class RateLimiter:
+    """Per-host token buckets and concurrency caps, shared by all workers."""
+
+    def __init__(
+        self,
+        limits: dict[str, HostLimit] | None = None,
+        default: HostLimit = DEFAULT_HOST_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.limits = dict(HOST_LIMITS if limits is None else limits)
+        self.default = default
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc or url
+
+    def _host_state(self, host: str) -> tuple[TokenBucket, threading.BoundedSemaphore]:
+        with self._lock:
+            if host not in self._buckets:
+                limit = self.limits.get(host, self.default)
+                self._buckets[host] = TokenBucket(limit.rate, limit.burst, self._clock, self._sleep)
+                self._slots[host] = threading.BoundedSemaphore(limit.max_concurrent)
+            return self._buckets[host], self._slots[host]
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's concurrent slots, paced by its bucket."""
+        bucket, slots = self._host_state(self.host_of(url))
+        with slots:
+            bucket.acquire()
+            yield
+
+    def backoff(self, url: str, seconds: float) -> None:
+        """Pause every request to the url's host for `seconds`."""
+        host = self.host_of(url)
+        logger.warning(f"[RateLimiter] Backing off {host} for {seconds:.1f}s")
+        self._host_state(host)[0].pause(seconds)
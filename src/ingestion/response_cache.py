@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Scoreboard Response Cache
+# File: src/ingestion/response_cache.py
+# Author: Sadiq
+#
+# Description:
+#     On-disk cache of raw scoreboard JSON under
+#     SCOREBOARD_CACHE_DIR, addressed by sha256(endpoint + date).
+#
+#     Rules:
+#         - finished dates (in the past, every game final) are
+#           immutable: served from disk, never refetched
+#         - today / live dates are served for a short TTL, then
+#           revalidated with If-None-Match / If-Modified-Since
+#           (a 304 only refreshes the entry's timestamp)
+#         - past dates with an empty games list are never
+#           immutable (a CDN glitch or a late listing must not
+#           stick); they are revalidated after a long TTL
+#         - force=True bypasses every entry (backfills of dates
+#           whose cached board was incomplete)
+#         - total size is capped; least recently used entries
+#           are evicted first
+#
+#     Repeat historical ingests (backfills, repairs, prediction
+#     passes) then do almost no network I/O.
+# ============================================================
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+from loguru import logger
+
+from src.config.paths import SCOREBOARD_CACHE_DIR
+
+SCOREBOARD_CACHE_MAX_BYTES = 512 * 1024 ** 2
+LIVE_TTL_SECONDS = 60
+EMPTY_BOARD_TTL_SECONDS = 24 * 3600
+
+# Status of a finished game (V3 gameStatus / legacy statusNum)
+FINAL_STATUS = 3
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    day: str                        # ISO date the response is for
+    body: dict
+    fetched_at: float               # last download or revalidation (epoch s)
+    immutable: bool = False
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class FetchResult:
+    """A 200 (with body) or 304 (body None) from the network."""
+
+    status: int
+    body: dict | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def _games(body: dict) -> list[dict] | None:
+    if "scoreboard" in body:
+        return body["scoreboard"].get("games", [])
+    return body.get("games")
+
+
+def _status(game: dict) -> int | None:
+    value = game.get("gameStatus", game.get("statusNum"))
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_finished(day: date, body: dict, today: date) -> bool:
+    """
+    True once a date's scoreboard can no longer change: the date
+    is past and every game is final. A board without games is
+    never finished: an empty 200 may be a glitch or a listing
+    published late.
+    """
+    if day >= today:
+        return False
+    games = _games(body)
+    if not games:
+        return False
+    return all(_status(g) == FINAL_STATUS for g in games)
+
+
+@dataclass
+class ResponseCache:
+    root: Path = SCOREBOARD_CACHE_DIR
+    max_bytes: int = SCOREBOARD_CACHE_MAX_BYTES
+    ttl_seconds: float = LIVE_TTL_SECONDS
+    empty_ttl_seconds: float = EMPTY_BOARD_TTL_SECONDS
+    clock: Callable[[], float] = time.time
+    today: Callable[[], date] = date.today
+    stats: ResponseCacheStats = field(default_factory=ResponseCacheStats)
+
+    def __post_init__(self):
+        self.root = Path(self.root)
+        self._lock = threading.Lock()
+        self._total: int | None = None
+
+    # ------------------------------------------------------------
+    # Addressing
+    # ------------------------------------------------------------
+    @staticmethod
+    def key(url: str, day: date) -> str:
+        return hashlib.sha256(f"{url}|{day.isoformat()}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    # ------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------
+    def get(self, url: str, day: date) -> CachedResponse | None:
+        path = self._path(self.key(url, day))
+        try:
+            entry = CachedResponse(**json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            logger.warning(f"[ResponseCache] Dropping unreadable entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        os.utime(path)  # mark as recently used
+        return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        games = _games(entry.body)
+        # An empty board is never final, whatever its stored flag says
+        if entry.immutable and games:
+            return True
+        ttl = self.ttl_seconds
+        if games == [] and date.fromisoformat(entry.day) < self.today():
+            ttl = self.empty_ttl_seconds
+        return self.clock() - entry.fetched_at < ttl
+
+    @staticmethod
+    def validators(entry: CachedResponse | None) -> dict[str, str]:
+        """Conditional request headers for revalidating an entry."""
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def fetch_json(
+        self,
+        url: str,
+        day: date,
+        fetch: Callable[[str, dict[str, str]], FetchResult | None],
+        force: bool = False,
+    ) -> dict | None:
+        """
+        Body for (url, day): from the cache while fresh, otherwise via
+        fetch(url, conditional headers). A failed fetch falls back to
+        a stale entry when there is one.
+
+        force:
+            Skip the cache, even for immutable entries, and fetch
+            unconditionally (backfills re-fetching incomplete dates).
+        """
+        entry = self.get(url, day)
+        if not force and entry is not None and self.is_fresh(entry):
+            self.stats.hits += 1
+            return entry.body
+
+        result = fetch(url, {} if force else self.validators(entry))
+        if result is None:
+            if entry is not None:
+                logger.warning(f"[ResponseCache] Fetch failed; serving stale {url} ({day})")
+                return entry.body
+            return None
+
+        if result.status == 304:
+            if entry is None:
+                return None
+            self.stats.revalidated += 1
+            return self.revalidated(entry).body
+
+        self.stats.misses += 1
+        return self.put(url, day, result.body, result.etag, result.last_modified).body
+
+    # ------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------
+    def put(
+        self,
+        url: str,
+        day: date,
+        body: dict,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CachedResponse:
+        entry = CachedResponse(
+            url=url,
+            day=day.isoformat(),
+            body=body,
+            fetched_at=self.clock(),
+            immutable=is_finished(day, body, self.today()),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._write(entry)
+        return entry
+
+    def revalidated(self, entry: CachedResponse) -> CachedResponse:
+        """Record a 304: same body, new timestamp (and maybe now finished)."""
+        entry.fetched_at = self.clock()
+        entry.immutable = is_finished(date.fromisoformat(entry.day), entry.body, self.today())
+        self._write(entry)
+        return entry
+
+    def _write(self, entry: CachedResponse) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(self.key(entry.url, date.fromisoformat(entry.day)))
+        data = json.dumps(asdict(entry)).encode("utf-8")
+
+        old_size = path.stat().st_size if path.exists() else 0
+        temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._total is not None:
+                self._total += len(data) - old_size
+        self._evict()
+
+    # ------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------
+    def size_bytes(self) -> int:
+        with self._lock:
+            if self._total is None:
+                self._total = sum(p.stat().st_size for p in self.root.glob("*.json"))
+            return self._total
+
+    def _evict(self) -> None:
+        if self.size_bytes() <= self.max_bytes:
+            return
+
+        with self._lock:
+            entries = []
+            for path in self.root.glob("*.json"):
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                self.stats.evictions += 1
+                logger.debug(f"[ResponseCache] Evicted {path.name}")
+            self._total = total
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.root.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._total = 0
+
+
+_default_cache: ResponseCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_response_cache() -> ResponseCache:
+    """Process-wide scoreboard cache shared by all ingestion workers."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
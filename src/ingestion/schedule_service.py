@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Schedule Service
+# File: src/ingestion/schedule_service.py
+# Author: Sadiq
+#
+# Description:
+#     In-memory, date-indexed view of a schedule snapshot
+#     (DAILY_SCHEDULE_SNAPSHOT by default; any wide schedule
+#     with game_id / date / home_team / away_team works).
+#
+#     The parquet is read once, sorted by date, given canonical
+#     home_tricode / away_tricode columns, and indexed as
+#     {date: (first row, end row)}; the index is rebuilt only
+#     when the file's mtime or size changes. Per-date lookups
+#     are then a dict hit plus a slice, so fallbacks and
+#     planners can run across thousands of dates cheaply.
+# ============================================================
+
+import threading
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.config.paths import DAILY_SCHEDULE_SNAPSHOT
+from src.ingestion.normalizer.team_names import to_tricode
+
+SCHEDULE_COLUMNS = ("game_id", "date", "home_team", "away_team")
+
+
+def tricodes(names: pd.Series) -> np.ndarray:
+    """to_tricode over a column, evaluated once per distinct name."""
+    mapping = {name: to_tricode(name) for name in names.unique()}
+    return np.array([mapping[name] for name in names.to_numpy(dtype=object)], dtype=object)
+
+
+class ScheduleService:
+    """Date-indexed schedule snapshot, reloaded when the file changes."""
+
+    def __init__(self, path: Path = DAILY_SCHEDULE_SNAPSHOT):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._key: tuple[int, int] | None = None
+        self._frame = pd.DataFrame(columns=list(SCHEDULE_COLUMNS))
+        self._spans: dict[date, tuple[int, int]] = {}
+        self.loads = 0
+
+    # ------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------
+    def _file_key(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load(self, key: tuple[int, int] | None) -> None:
+        if key is None:
+            frame = pd.DataFrame(columns=list(SCHEDULE_COLUMNS))
+        else:
+            frame = pd.read_parquet(self.path)
+            missing = set(SCHEDULE_COLUMNS) - set(frame.columns)
+            if missing:
+                raise ValueError(f"Schedule snapshot {self.path} is missing columns: {sorted(missing)}")
+            frame["game_id"] = frame["game_id"].astype(str)
+            frame["date"] = pd.to_datetime(frame["date"], errors="coerce").dt.normalize()
+            frame = (
+                frame.dropna(subset=["date"])
+                .drop_duplicates(subset=["game_id"], keep="last")
+                .sort_values(["date", "game_id"], kind="mergesort")
+                .reset_index(drop=True)
+            )
+            frame["home_tricode"] = tricodes(frame["home_team"])
+            frame["away_tricode"] = tricodes(frame["away_team"])
+            self.loads += 1
+            logger.debug(f"[Schedule] Loaded {len(frame)} games from {self.path.name}")
+
+        days = frame["date"].dt.date.to_numpy() if len(frame) else np.array([], dtype=object)
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]]) if len(days) else np.array([], dtype=int)
+        stops = np.r_[starts[1:], len(days)]
+
+        self._frame = frame
+        self._spans = {days[a]: (int(a), int(b)) for a, b in zip(starts, stops)}
+        self._key = key
+
+    def _snapshot(self) -> tuple[pd.DataFrame, dict[date, tuple[int, int]]]:
+        """Current (frame, date spans), reloading first if the file changed."""
+        key = self._file_key()
+        with self._lock:
+            if key != self._key:
+                self._load(key)
+            return self._frame, self._spans
+
+    def frame(self) -> pd.DataFrame:
+        """The whole schedule, sorted by (date, game_id). Do not mutate."""
+        return self._snapshot()[0]
+
+    # ------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------
+    def exists(self) -> bool:
+        return self._file_key() is not None
+
+    def dates(self) -> list[date]:
+        return sorted(self._snapshot()[1])
+
+    def has_games(self, day: date) -> bool:
+        return day in self._snapshot()[1]
+
+    def games_on(self, day: date) -> pd.DataFrame:
+        """Scheduled games on a date (empty frame when none)."""
+        frame, spans = self._snapshot()
+        span = spans.get(day)
+        if span is None:
+            return frame.iloc[0:0]
+        return frame.iloc[span[0]:span[1]]
+
+    def games_between(self, start: date, end: date) -> pd.DataFrame:
+        """Scheduled games with start <= date <= end."""
+        frame = self.frame()
+        days = frame["date"]
+        lo = days.searchsorted(pd.Timestamp(start), side="left")
+        hi = days.searchsorted(pd.Timestamp(end), side="right")
+        return frame.iloc[lo:hi]
+
+
+_services: dict[Path, ScheduleService] = {}
+_services_lock = threading.Lock()
+
+
+def schedule_service(path: Path = DAILY_SCHEDULE_SNAPSHOT) -> ScheduleService:
+    """Process-wide service per schedule file."""
+    path = Path(path)
+    with _services_lock:
+        if path not in _services:
+            _services[path] = ScheduleService(path)
+        return _services[path]
@@ -40,8 +40,8 @@
     "elo_roll10",
     "opp_elo",
 
-    # Margin + rolling margin
-    "margin",
+    # Rolling margin (the game's own margin is the spread target,
+    # unknown before tip-off)
     "margin_rolling_5",
     "margin_rolling_10",
     "margin_rolling_20",
@@ -36,6 +36,7 @@ def _extract_feature_matrix(
     - Validates required features for the given model_type
     - Ensures stable column ordering
     - Validates presence of game_id and team columns
+    - Rejects feature columns that are entirely NaN
     """
     if df.empty:
         raise ValueError("Feature DataFrame is empty.")
@@ -53,6 +54,13 @@ def _extract_feature_matrix(
         raise ValueError(f"Missing required feature columns: {missing_features}")
 
     X = df[required_features].to_numpy(dtype=float)
+
+    # An all-NaN input (e.g. an outcome column of unplayed games) is a
+    # pipeline error, not missing data: no model should see it
+    empty = [f for f, col in zip(required_features, X.T) if np.isnan(col).all()]
+    if empty:
+        raise ValueError(f"Feature columns are entirely NaN: {empty}")
+
     return df, X
 
 
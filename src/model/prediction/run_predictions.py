@@ -7,6 +7,7 @@
 
 from src.config.paths import DATA_DIR, LONG_SNAPSHOT
 from src.features.builder import FeatureBuilder
+from src.ingestion.long_snapshot_store import LongSnapshotStore
 from src.model.registry import load_production_model
 from src.model.prediction import (
     predict_moneyline,
@@ -22,21 +23,26 @@ def run_prediction_for_date(pred_date: date) -> None:
     # --------------------------------------------------------
     # Load canonical long snapshot
     # --------------------------------------------------------
-    if not LONG_SNAPSHOT.exists():
+    store = LongSnapshotStore()
+    if not store.index()["days"]:
         raise FileNotFoundError(f"Snapshot missing: {LONG_SNAPSHOT}")
 
-    df = pd.read_parquet(LONG_SNAPSHOT)
-    df = df[df["date"] == pd.Timestamp(pred_date)]
+    # Single-date read located via the date index
+    pred_ts = pd.Timestamp(pred_date)
+    games = store.read_day(pred_ts.date())
+    games["date"] = pd.to_datetime(games["date"])
 
-    if df.empty:
+    if games.empty:
         logger.warning(f"No rows found for {pred_date} in snapshot.")
         return
 
     # --------------------------------------------------------
-    # Build features
+    # Build pre-game features from per-team state (the persisted
+    # state, advanced at ingest; rebuilt only for past dates)
     # --------------------------------------------------------
     fb = FeatureBuilder()
-    features = fb.build(df)
+    states = fb.state_before(pred_ts.date(), store=store)
+    features = fb.build_for_schedule(games, as_of=pred_ts, states=states)
 
     # Validate identity columns early
     for col in ["game_id", "team"]:
@@ -16,25 +16,31 @@
 #       • metadata for model registry
 # ============================================================
 
-import pandas as pd
 from sklearn.model_selection import train_test_split
 from loguru import logger
 
-from src.config.paths import FEATURES_SNAPSHOT
+from src.config.paths import LONG_SNAPSHOT
+from src.features.feature_pipeline import iter_features
+from src.features.feature_store import load_feature_snapshot
 from src.model.config.model_config import FEATURE_MAP, TARGET_MAP
 
 
-def build_dataset(model_type: str):
+def build_dataset(model_type: str, seasons: list[str] | None = None):
     """
     Build train/test splits for a given model type.
 
+    seasons:
+        Optional season labels to load; the filter and the column
+        selection are pushed down to the partitioned snapshot scan.
+
     Returns:
         X_train, X_test, y_train, y_test, feature_list, metadata
     """
     logger.info(f"📦 Building dataset for model_type='{model_type}'")
 
-    # Load snapshot
-    df = pd.read_parquet(FEATURES_SNAPSHOT)
+    # Load snapshot (only the partitions + columns this model needs)
+    columns = ["date", *FEATURE_MAP[model_type], TARGET_MAP[model_type]]
+    df = load_feature_snapshot(seasons=seasons, columns=columns)
     if df.empty:
         raise RuntimeError("Feature snapshot is empty — cannot build dataset.")
 
@@ -97,3 +103,23 @@ def build_dataset(model_type: str):
     )
 
     return X_train, X_test, y_train, y_test, feature_list, metadata
+
+
+def iter_dataset(model_type: str, chunks_by: str = "season", source=LONG_SNAPSHOT):
+    """
+    Stream (chunk label, X, y) batches for a model type straight from
+    the long snapshot (see iter_features), e.g. for partial_fit. Only
+    the model's feature + target columns are built per chunk.
+    """
+    if model_type not in FEATURE_MAP:
+        raise ValueError(f"Unknown model_type '{model_type}'. Expected one of {list(FEATURE_MAP)}.")
+
+    feature_list = FEATURE_MAP[model_type]
+    target_col = TARGET_MAP[model_type]
+
+    for label, df in iter_features(source, chunks_by=chunks_by, columns=[*feature_list, target_col]):
+        df = df.dropna(subset=[target_col, *feature_list])
+        if df.empty:
+            continue
+        logger.info(f"📦 [{model_type}] chunk {label}: {len(df):,} rows")
+        yield label, df[feature_list], df[target_col]
@@ -7,11 +7,10 @@
 # Author: Sadiq
 # ============================================================
 
-import pandas as pd
 from loguru import logger
 
-from src.config.paths import LONG_SNAPSHOT
 from src.features.builder import FeatureBuilder
+from src.ingestion.long_snapshot_store import load_long_snapshot
 from src.model.training.dataset_builder import build_dataset
 from src.model.training.common import train_model_common
 from src.model.training.metrics import compute_metrics
@@ -39,7 +38,7 @@ def auto_retrain(
     # 1. Load canonical long snapshot (same as run_end_to_end)
     # --------------------------------------------------------
     try:
-        df_long = pd.read_parquet(LONG_SNAPSHOT)
+        df_long = load_long_snapshot()
     except Exception as e:
         msg = f"Failed to load LONG_SNAPSHOT: {e}"
         logger.error(msg)
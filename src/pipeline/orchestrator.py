@@ -19,6 +19,7 @@
 import pandas as pd
 from loguru import logger
 
+from src.ingestion.long_snapshot_store import LongSnapshotStore
 from src.ingestion.pipeline import ingest_single_date
 from src.features.builder import FeatureBuilder
 from src.pipeline.run_predictions import run_predictions
@@ -53,12 +54,18 @@ def orchestrate_daily(
     # 2. Persist canonical long snapshot
     # --------------------------------------------------------
     try:
-        new_rows.to_parquet(LONG_SNAPSHOT, index=False)
+        LongSnapshotStore().write_days(new_rows)
         logger.success(f"📦 Saved canonical snapshot → {LONG_SNAPSHOT}")
     except Exception as e:
         logger.error(f"Failed to save canonical snapshot: {e}")
         return pd.DataFrame()
 
+    # Keep the persisted team state current for prediction runs
+    try:
+        FeatureBuilder(version=feature_version, use_cache=False).advance_state(new_rows)
+    except Exception as e:
+        logger.warning(f"Team state not updated (predictions will rebuild it): {e}")
+
     # --------------------------------------------------------
     # 3. Build features
     # --------------------------------------------------------
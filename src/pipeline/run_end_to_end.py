@@ -25,8 +25,8 @@
 from src.features.builder import FeatureBuilder
 from src.pipeline.run_predictions import run_predictions
 from src.pipeline.auto_retrain import auto_retrain
+from src.ingestion.long_snapshot_store import load_long_snapshot
 from src.config.paths import (
-    LONG_SNAPSHOT,
     PREDICTIONS_DIR,
 )
 
@@ -44,7 +44,7 @@ def run_end_to_end(
     # --------------------------------------------------------
     logger.info("📥 Loading canonical long snapshot...")
     try:
-        df_long = pd.read_parquet(LONG_SNAPSHOT)
+        df_long = load_long_snapshot()
     except Exception as e:
         logger.error(f"Failed to load LONG_SNAPSHOT: {e}")
         return pd.DataFrame()
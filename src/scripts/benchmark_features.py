@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Feature Benchmark CLI
+# File: src/scripts/benchmark_features.py
+# Author: Sadiq
+#
+# Description:
+#     Runs the feature pipeline benchmarks on synthetic leagues
+#     at 1×, 10× and 100× the current data size, writes the
+#     results to REPORTS_DIR and compares them with the stored
+#     baseline (exit code 1 on regression).
+#
+#     python -m src.scripts.benchmark_features --scales 1,10
+#     python -m src.scripts.benchmark_features --update-baseline
+# ============================================================
+
+import argparse
+import sys
+
+from loguru import logger
+
+from src.config.paths import FEATURE_BENCHMARK_BASELINE, FEATURE_BENCHMARK_RESULTS
+from src.features.benchmark import (
+    BENCHMARK_SCALES,
+    REGRESSION_TOLERANCE,
+    compare_benchmarks,
+    read_results,
+    run_benchmarks,
+    write_results,
+)
+
+
+def _ints(text: str) -> list[int]:
+    return [int(v) for v in text.split(",") if v.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the feature pipeline at scale")
+    parser.add_argument("--scales", type=_ints, default=list(BENCHMARK_SCALES))
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced peak-memory runs")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the baseline")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scales, track_memory=not args.no_memory)
+    write_results(results, FEATURE_BENCHMARK_RESULTS)
+
+    if args.update_baseline or not FEATURE_BENCHMARK_BASELINE.exists():
+        write_results(results, FEATURE_BENCHMARK_BASELINE)
+        logger.success(f"Baseline stored → {FEATURE_BENCHMARK_BASELINE}")
+        return
+
+    report = compare_benchmarks(results, read_results(FEATURE_BENCHMARK_BASELINE), args.tolerance)
+    print(report.to_string(index=False))
+
+    if report["regression"].any():
+        logger.error(f"❌ {int(report['regression'].sum())} benchmark(s) regressed by more than {args.tolerance:.0%}")
+        sys.exit(1)
+    logger.success("✅ No benchmark regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@
 from pathlib import Path
 from loguru import logger
 
+from src.features.builder import FeatureBuilder
+from src.ingestion.long_snapshot_store import LongSnapshotStore
 from src.config.paths import (
     CANONICAL_DIR,
     LONG_SNAPSHOT,
@@ -159,7 +161,8 @@ def convert_public_dataset(path: str):
     # --------------------------------------------------------
     CANONICAL_DIR.mkdir(parents=True, exist_ok=True)
 
-    long_df.to_parquet(LONG_SNAPSHOT, index=False)
+    LongSnapshotStore().rewrite(long_df)
+    FeatureBuilder(use_cache=False).build_state(long_df)
     df.to_parquet(DAILY_SCHEDULE_SNAPSHOT, index=False)
 
     logger.success("🎉 Conversion complete!")
@@ -34,6 +34,8 @@
 from src.config.env import MODEL_VERSION, MODEL_ENVIRONMENT
 
 from src.features.builder import FeatureBuilder
+from src.features.feature_store import load_feature_snapshot
+from src.ingestion.long_snapshot_store import load_long_snapshot, long_snapshot_exists
 from src.ingestion.validator.checks import (
     find_asymmetry,
     find_score_mismatches,
@@ -55,7 +57,8 @@ def _read_parquet_sample(path: Path, max_rows: int = 50) -> pd.DataFrame:
     if path.is_file():
         return pd.read_parquet(path).head(max_rows)
 
-    files = list(path.glob("**/*.parquet"))
+    # Skip metadata/state files ("_manifest.json", "_team_state.parquet")
+    files = [f for f in path.glob("**/*.parquet") if not f.name.startswith(("_", "."))]
     if not files:
         raise FileNotFoundError(f"No parquet files found in directory: {path}")
 
@@ -67,11 +70,11 @@ def _read_parquet_sample(path: Path, max_rows: int = 50) -> pd.DataFrame:
 # ------------------------------------------------------------
 
 def validate_long_snapshot() -> Dict[str, Any]:
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         return {"ok": False, "error": "Missing canonical long snapshot"}
 
     try:
-        df = pd.read_parquet(LONG_SNAPSHOT)
+        df = load_long_snapshot()
     except Exception as e:
         return {"ok": False, "error": f"Failed to read long snapshot: {e}"}
 
@@ -118,11 +121,11 @@ def validate_features(max_rows: int = 500) -> Dict[str, Any]:
             logger.warning(f"Feature snapshot failed: {e}")
 
     # 2. Fallback → dynamic feature building
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         return {"ok": False, "error": "No long snapshot for dynamic feature building"}
 
     try:
-        df_long = pd.read_parquet(LONG_SNAPSHOT)
+        df_long = load_long_snapshot()
         fb = FeatureBuilder()  # version-agnostic
         features = fb.build(df_long)
         sample = features.head(max_rows)
@@ -153,13 +156,9 @@ def compute_feature_drift() -> Dict[str, Any]:
 
     # Load full feature dataset
     if FEATURES_SNAPSHOT.exists():
-        if FEATURES_SNAPSHOT.is_dir():
-            parts = list(FEATURES_SNAPSHOT.glob("**/*.parquet"))
-            df = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
-        else:
-            df = pd.read_parquet(FEATURES_SNAPSHOT)
+        df = load_feature_snapshot()
     else:
-        df_long = pd.read_parquet(LONG_SNAPSHOT)
+        df_long = load_long_snapshot()
         fb = FeatureBuilder()
         df = fb.build(df_long)
 
@@ -241,7 +240,7 @@ def generate_dashboard() -> None:
         "metadata": {
             "model_version": MODEL_VERSION,
             "model_environment": MODEL_ENVIRONMENT,
-            "long_snapshot_mtime": LONG_SNAPSHOT.stat().st_mtime if LONG_SNAPSHOT.exists() else None,
+            "long_snapshot_mtime": LONG_SNAPSHOT.stat().st_mtime if long_snapshot_exists() else None,
             "features_snapshot_mtime": FEATURES_SNAPSHOT.stat().st_mtime if FEATURES_SNAPSHOT.exists() else None,
         },
         "long_snapshot": long_report,
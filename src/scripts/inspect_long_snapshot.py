@@ -16,6 +16,7 @@
 from loguru import logger
 
 from src.config.paths import LONG_SNAPSHOT
+from src.ingestion.long_snapshot_store import load_long_snapshot, long_snapshot_exists
 from src.ingestion.validator.checks import (
     find_incomplete_games,
     find_asymmetry,
@@ -27,11 +28,11 @@ def inspect_long_snapshot() -> dict:
     logger.info("=== Inspecting LONG_SNAPSHOT ===")
     logger.info(f"Path: {LONG_SNAPSHOT}")
 
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         logger.error("LONG_SNAPSHOT does not exist.")
         return {"ok": False, "error": "Snapshot missing"}
 
-    df = pd.read_parquet(LONG_SNAPSHOT)
+    df = load_long_snapshot()
     df["date"] = pd.to_datetime(df["date"], errors="coerce")
 
     # ------------------------------------------------------------
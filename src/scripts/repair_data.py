@@ -12,9 +12,10 @@
 from src.ingestion.fallback.manager import FallbackManager
 from src.ingestion.fallback.schedule_fallback import SeasonScheduleFallback
 
+from src.features.builder import FeatureBuilder
+from src.ingestion.long_snapshot_store import LongSnapshotStore
 from src.config.paths import (
     DAILY_SCHEDULE_SNAPSHOT,
-    LONG_SNAPSHOT,
 )
 
 
@@ -87,7 +88,8 @@ def total_repair():
     # Save snapshots
     DAILY_SCHEDULE_SNAPSHOT.parent.mkdir(parents=True, exist_ok=True)
     full_wide.to_parquet(DAILY_SCHEDULE_SNAPSHOT, index=False)
-    full_long.to_parquet(LONG_SNAPSHOT, index=False)
+    LongSnapshotStore().rewrite(full_long)
+    FeatureBuilder(use_cache=False).build_state(full_long)
 
     logger.success(
         f"REPAIR COMPLETE: {len(full_long)} canonical rows written "
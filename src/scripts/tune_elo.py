@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: ELO Tuning CLI
+# File: src/scripts/tune_elo.py
+# Author: Sadiq
+#
+# Description:
+#     Sweeps a grid of ELO settings (K, home advantage, season
+#     carryover) over the canonical long snapshot in one pass
+#     and writes log loss / Brier per setting to REPORTS_DIR.
+# ============================================================
+
+import argparse
+import sys
+
+from loguru import logger
+
+from src.config.paths import LONG_SNAPSHOT, REPORTS_DIR
+from src.features.elo_sweep import elo_grid, sweep_elo
+from src.ingestion.long_snapshot_store import load_long_snapshot, long_snapshot_exists
+
+
+def _floats(text: str) -> list[float]:
+    return [float(v) for v in text.split(",") if v.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sweep ELO hyperparameters")
+    parser.add_argument("--k", type=_floats, default=_floats("10,15,20,25,30,35,40"))
+    parser.add_argument("--home", type=_floats, default=_floats("0,25,50,75,100"))
+    parser.add_argument("--carryover", type=_floats, default=_floats("0,0.25,0.5"))
+    parser.add_argument("--burn_in", type=int, default=1000, help="Leading games left out of the metrics")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    if not long_snapshot_exists():
+        logger.error(f"❌ Missing canonical snapshot: {LONG_SNAPSHOT}")
+        sys.exit(1)
+
+    columns = ["game_id", "date", "team", "opponent", "is_home", "score", "opp_score"]
+    long_df = load_long_snapshot(columns=columns)
+
+    results = sweep_elo(long_df, elo_grid(args.k, args.home, args.carryover), burn_in=args.burn_in)
+
+    out_path = REPORTS_DIR / "elo_sweep.csv"
+    results.to_csv(out_path, index=False)
+    logger.success(f"ELO sweep results saved to {out_path}")
+
+    print(results.head(args.top).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
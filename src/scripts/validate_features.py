@@ -10,16 +10,17 @@
 #     Validates the canonical feature snapshot against FeatureRow.
 #     Checks:
 #       • Schema drift (missing/extra columns)
-#       • Row-level validation via Pydantic
+#       • Columnar FeatureRow validation (all rows at once)
 #       • NaN distribution
 #       • Summary of validation failures
 # ============================================================
 
-import pandas as pd
 from loguru import logger
 
 from src.config.paths import FEATURES_SNAPSHOT
+from src.features.feature_store import load_feature_snapshot
 from src.features.feature_schema import FeatureRow
+from src.features.feature_validation import find_feature_violations
 
 
 def validate_features(max_errors: int = 20):
@@ -29,10 +30,10 @@ def validate_features(max_errors: int = 20):
     logger.info("=== 🛡️ Validating FEATURES_SNAPSHOT ===")
 
     if not FEATURES_SNAPSHOT.exists():
-        logger.error(f"❌ Missing file: {FEATURES_SNAPSHOT}")
+        logger.error(f"❌ Missing feature snapshot: {FEATURES_SNAPSHOT}")
         return
 
-    df = pd.read_parquet(FEATURES_SNAPSHOT)
+    df = load_feature_snapshot()
     total_rows = len(df)
 
     logger.info(f"📊 Loaded {total_rows} rows across {len(df.columns)} columns.")
@@ -70,32 +71,25 @@ def validate_features(max_errors: int = 20):
         logger.info("✨ No NaN values detected.")
 
     # --------------------------------------------------------
-    # 3. Row-Level Deep Validation (Pydantic)
+    # 3. Columnar Schema Validation
     # --------------------------------------------------------
-    logger.info("🔍 Running row-level schema validation...")
+    logger.info("🔍 Running columnar schema validation...")
 
-    error_count = 0
-    sample_errors = []
-
-    for idx, row in df.iterrows():
-        try:
-            FeatureRow(**row.to_dict())
-        except Exception as e:
-            error_count += 1
-            if len(sample_errors) < max_errors:
-                sample_errors.append(f"Row {idx}: {e}")
+    violations = find_feature_violations(df)
+    error_rows = set()
+    for idx in violations.values():
+        error_rows.update(idx)
 
     # --------------------------------------------------------
     # 4. Summary
     # --------------------------------------------------------
-    if error_count > 0:
-        logger.error(f"❌ Validation failed for {error_count} rows.")
-        logger.error("Sample errors:")
-        for err in sample_errors:
-            logger.error(f"  - {err}")
+    if violations:
+        logger.error(f"❌ Validation failed for {len(error_rows)} rows.")
+        logger.error("Failed checks:")
+        for check, idx in list(violations.items())[:max_errors]:
+            logger.error(f"  - {check}: {len(idx)} rows (e.g. {list(idx[:5])})")
     else:
-        logger.success("✅ All rows passed Pydantic schema validation.")
-
+        logger.success("✅ All rows passed FeatureRow schema validation.")
 
 
 if __name__ == "__main__":
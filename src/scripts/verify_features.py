@@ -10,8 +10,10 @@
 import pandas as pd
 from loguru import logger
 
-from src.config.paths import FEATURES_SNAPSHOT, LONG_SNAPSHOT
+from src.config.paths import FEATURES_SNAPSHOT
 from src.features.builder import FeatureBuilder
+from src.features.feature_store import load_feature_snapshot
+from src.ingestion.long_snapshot_store import load_long_snapshot, long_snapshot_exists
 
 
 # ------------------------------------------------------------
@@ -22,23 +24,14 @@ def _load_features() -> pd.DataFrame:
     # 1. Snapshot exists
     if FEATURES_SNAPSHOT.exists():
         logger.info(f"Loading feature snapshot: {FEATURES_SNAPSHOT}")
-
-        if FEATURES_SNAPSHOT.is_file():
-            return pd.read_parquet(FEATURES_SNAPSHOT)
-
-        # Directory of parquet parts
-        parts = list(FEATURES_SNAPSHOT.glob("**/*.parquet"))
-        if not parts:
-            raise RuntimeError(f"FEATURES_SNAPSHOT directory is empty: {FEATURES_SNAPSHOT}")
-
-        return pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
+        return load_feature_snapshot()
 
     # 2. Fallback → dynamic build
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         raise RuntimeError("No feature snapshot and no LONG_SNAPSHOT available.")
 
     logger.info("Building features dynamically from LONG_SNAPSHOT...")
-    long_df = pd.read_parquet(LONG_SNAPSHOT)
+    long_df = load_long_snapshot()
 
     fb = FeatureBuilder()  # version‑agnostic
     return fb.build(long_df)
@@ -12,6 +12,7 @@
 from loguru import logger
 
 from src.config.paths import LONG_SNAPSHOT
+from src.ingestion.long_snapshot_store import load_long_snapshot, long_snapshot_exists
 from src.ingestion.validator.checks import (
     find_asymmetry,
     find_score_mismatches,
@@ -34,13 +35,13 @@ def verify_snapshot():
     # --------------------------------------------------------
     # Load snapshot
     # --------------------------------------------------------
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         logger.error(f"No LONG_SNAPSHOT found at {LONG_SNAPSHOT}")
         return
 
     logger.info(f"Loading LONG_SNAPSHOT from {LONG_SNAPSHOT}...")
     try:
-        df = pd.read_parquet(LONG_SNAPSHOT, engine="pyarrow")
+        df = load_long_snapshot()
     except Exception as e:
         logger.error(f"Failed to read LONG_SNAPSHOT: {e}")
         return
@@ -13,19 +13,19 @@
 #     Useful for building normalization maps and QA checks.
 # ============================================================
 
-import pandas as pd
 from loguru import logger
 from src.config.paths import LONG_SNAPSHOT
+from src.ingestion.long_snapshot_store import load_long_snapshot, long_snapshot_exists
 
 
 def extract_team_names() -> list[str]:
-    if not LONG_SNAPSHOT.exists():
+    if not long_snapshot_exists():
         raise FileNotFoundError(
             f"LONG_SNAPSHOT not found at {LONG_SNAPSHOT}. "
             f"Run canonical ingestion first."
         )
 
-    df = pd.read_parquet(LONG_SNAPSHOT)
+    df = load_long_snapshot()
 
     if "team" not in df.columns:
         raise KeyError(
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+# ============================================================
+# 🏀 NBA Analytics
+# Module: Synthetic League Generator
+# File: src/utils/synthetic_league.py
+# Author: Sadiq
+#
+# Description:
+#     Generates long-format team-game history (the feature
+#     pipeline's input format) of any size, for benchmarks and
+#     scale tests:
+#         - balanced schedules: every team plays games_per_team
+#           games a season, at most one per day, with varying
+#           rest (back-to-backs included)
+#         - scores from team strength (drifting between
+#           seasons), shared game pace, home advantage and
+#           noise; tied games go to overtime
+#
+#     Output is deterministic for a given LeagueConfig.
+# ============================================================
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.utils.team_names import NBA_TRICODES
+
+# Latest date pandas nanosecond timestamps can hold
+_LAST_YEAR = 2261
+
+
+@dataclass(frozen=True)
+class LeagueConfig:
+    seasons: int = 3
+    teams: int = 30
+    games_per_team: int = 82
+    start_year: int = 2022
+    season_days: int = 170          # first to last game date of a season
+    mean_points: float = 112.0
+    points_sd: float = 11.0         # per-team scoring noise
+    pace_sd: float = 5.0            # shared by both teams of a game
+    strength_sd: float = 4.0        # team rating spread (points)
+    strength_drift: float = 2.0     # season-to-season rating change
+    home_advantage: float = 2.5     # points
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.teams < 2 or self.teams % 2:
+            raise ValueError(f"teams must be an even number >= 2, got {self.teams}")
+        if self.games_per_team < 1 or self.seasons < 1:
+            raise ValueError("seasons and games_per_team must be positive")
+        if self.season_days < self.games_per_team:
+            raise ValueError("season_days must be at least games_per_team (one game per team per day)")
+        if self.start_year + self.seasons > _LAST_YEAR:
+            raise ValueError(f"Seasons would run past {_LAST_YEAR}; lower start_year")
+
+    @property
+    def rows(self) -> int:
+        return self.seasons * self.teams * self.games_per_team
+
+
+def team_names(n: int) -> list[str]:
+    """NBA tricodes for up to 30 teams, then T31, T32, ..."""
+    names = sorted(NBA_TRICODES)[:n]
+    return names + [f"T{i + 1:02d}" for i in range(len(names), n)]
+
+
+def _round_robin(teams: int, rounds: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (rounds, teams/2) arrays of team indices; every team plays once
+    per round (circle method, teams reshuffled each full cycle).
+    """
+    half = teams // 2
+    first = np.empty((rounds, half), dtype=np.int64)
+    second = np.empty((rounds, half), dtype=np.int64)
+
+    order = rng.permutation(teams)
+    for r in range(rounds):
+        k = r % (teams - 1)
+        if k == 0 and r:
+            order = rng.permutation(teams)
+        ring = np.r_[order[:1], np.roll(order[1:], k)]
+        first[r], second[r] = ring[:half], ring[half:][::-1]
+    return first, second
+
+
+def _game_days(rounds: int, half: int, season_days: int, rng: np.random.Generator) -> np.ndarray:
+    """Day offset of every game; round r is played within its own day window."""
+    bounds = np.floor(np.arange(rounds + 1) * season_days / rounds).astype(np.int64)
+    width = np.diff(bounds)
+    jitter = np.floor(rng.random((rounds, half)) * width[:, None]).astype(np.int64)
+    return bounds[:-1, None] + jitter
+
+
+def generate_long_df(config: LeagueConfig | None = None) -> pd.DataFrame:
+    """Long-format rows (two per game) for the configured league."""
+    config = config or LeagueConfig()
+    rng = np.random.default_rng(config.seed)
+    names = np.asarray(team_names(config.teams), dtype=object)
+    half = config.teams // 2
+    strength = rng.normal(0.0, config.strength_sd, config.teams)
+
+    parts = []
+    game_no = 0
+    for s in range(config.seasons):
+        year = config.start_year + s
+        strength = 0.7 * strength + rng.normal(0.0, config.strength_drift, config.teams)
+
+        first, second = _round_robin(config.teams, config.games_per_team, rng)
+        days = _game_days(config.games_per_team, half, config.season_days, rng)
+        first, second, days = first.ravel(), second.ravel(), days.ravel()
+        n = len(first)
+
+        first_home = rng.random(n) < 0.5
+        home = np.where(first_home, first, second)
+        away = np.where(first_home, second, first)
+
+        pace = rng.normal(0.0, config.pace_sd, n)
+        edge = (strength[home] - strength[away] + config.home_advantage) / 2
+        home_pts = np.rint(config.mean_points + pace + edge + rng.normal(0.0, config.points_sd, n))
+        away_pts = np.rint(config.mean_points + pace - edge + rng.normal(0.0, config.points_sd, n))
+
+        # Overtime: both teams add a period's worth until untied
+        tied = home_pts == away_pts
+        while tied.any():
+            home_pts[tied] += rng.integers(6, 16, tied.sum())
+            away_pts[tied] += rng.integers(6, 16, tied.sum())
+            tied = home_pts == away_pts
+
+        dates = np.datetime64(f"{year}-10-20") + days.astype("timedelta64[D]")
+        ids = np.array([f"S{game_no + i:08d}" for i in range(n)], dtype=object)
+        game_no += n
+
+        for team, opp, is_home, pts, opp_pts in (
+            (home, away, 1, home_pts, away_pts),
+            (away, home, 0, away_pts, home_pts),
+        ):
+            parts.append(
+                pd.DataFrame(
+                    {
+                        "game_id": ids,
+                        "date": dates.astype("datetime64[ns]"),
+                        "team": names[team],
+                        "opponent": names[opp],
+                        "is_home": is_home,
+                        "score": pts.astype(np.int64),
+                        "opp_score": opp_pts.astype(np.int64),
+                        "win": (pts > opp_pts).astype(np.int64),
+                        "total_points": (pts + opp_pts).astype(np.int64),
+                    }
+                )
+            )
+
+    df = pd.concat(parts, ignore_index=True)
+    return df.sort_values(["date", "game_id", "is_home"], kind="mergesort").reset_index(drop=True)
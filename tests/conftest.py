@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def make_long_df(seasons: int = 2, teams: int = 8, days: int = 40, seed: int = 0) -> pd.DataFrame:
+    """Small synthetic team-game history in feature-pipeline input format."""
+    rng = np.random.default_rng(seed)
+    names = [f"T{i:02d}" for i in range(teams)]
+    rows = []
+    game_no = 0
+
+    for s in range(seasons):
+        start = pd.Timestamp(f"{2016 + s}-10-20")
+        for day in range(days):
+            date = start + pd.Timedelta(days=day)
+            perm = rng.permutation(teams)
+            for g in range(teams // 2 - 1):
+                home, away = names[perm[2 * g]], names[perm[2 * g + 1]]
+                hs, aws = int(rng.normal(112, 12)), int(rng.normal(109, 12))
+                if hs == aws:
+                    hs += 1
+                game_no += 1
+                for team, opp, is_home, sc, osc in (
+                    (home, away, 1, hs, aws),
+                    (away, home, 0, aws, hs),
+                ):
+                    rows.append(
+                        {
+                            "game_id": f"G{game_no:06d}",
+                            "date": date,
+                            "team": team,
+                            "opponent": opp,
+                            "is_home": is_home,
+                            "score": sc,
+                            "opp_score": osc,
+                            "win": int(sc > osc),
+                            "total_points": sc + osc,
+                        }
+                    )
+
+    return pd.DataFrame(rows).sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+@pytest.fixture
+def long_df() -> pd.DataFrame:
+    return make_long_df()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_feature_cache(tmp_path, monkeypatch):
+    """Keep FeatureBuilder's shared cache out of the repo data dir."""
+    from src.features import feature_cache
+
+    monkeypatch.setattr(feature_cache, "_default_cache", feature_cache.FeatureCache(tmp_path / "feature_cache"))
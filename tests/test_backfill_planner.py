@@ -0,0 +1,114 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from src.ingestion.long_snapshot_store import LongSnapshotStore
+from src.ingestion.maintenance.backfill_planner import is_final_status, plan_backfill, write_plan_report
+
+# Three game days around an off-day (Jan 3) and a break (Jan 6-7)
+D1, D2, D4, D5, D8 = (date(2024, 1, d) for d in (1, 2, 4, 5, 8))
+TODAY = date(2024, 1, 9)
+
+
+def _schedule(path, games, home="BOS", away="NYK"):
+    pd.DataFrame(
+        [
+            {"game_id": gid, "date": pd.Timestamp(day), "home_team": home, "away_team": away}
+            for gid, day in games
+        ]
+    ).to_parquet(path, index=False)
+    return path
+
+
+def _stored(day, game_id, status="Final"):
+    base = {"game_id": game_id, "date": day, "season": "2023-24", "status": status, "schema_version": "v5"}
+    return [
+        {**base, "team": "BOS", "opponent": "NYK", "is_home": 1, "score": 100, "opponent_score": 90},
+        {**base, "team": "NYK", "opponent": "BOS", "is_home": 0, "score": 90, "opponent_score": 100},
+    ]
+
+
+@pytest.fixture
+def setup(tmp_path):
+    schedule = _schedule(
+        tmp_path / "schedule.parquet",
+        [("a", D1), ("b", D2), ("c", D2), ("d", D4), ("e", D5), ("f", D8)],
+    )
+    store = LongSnapshotStore(tmp_path / "long", legacy=None)
+    store.write_days(
+        pd.DataFrame(
+            _stored(D1, "a")
+            + _stored(D2, "b")                      # c missing
+            + _stored(D4, "d", status="scheduled")  # never finalised
+            + _stored(D5, "e", status="final/ot")
+        )
+    )
+    return schedule, store
+
+
+def test_plan_skips_off_days_and_complete_dates(setup):
+    schedule, store = setup
+    plan = plan_backfill(D1, D8, store=store, schedules=[schedule], today=TODAY)
+
+    assert [(i.day, i.reason) for i in plan.items] == [
+        (D2, "missing_games"),
+        (D4, "missing_scores"),
+        (D8, "no_rows"),
+    ]
+    assert plan.complete_dates == 2
+    assert plan.off_days == 3
+    assert plan.summary()["by_reason"] == {"no_rows": 1, "missing_games": 1, "missing_scores": 1}
+
+
+def test_sources_with_different_game_id_schemes_are_not_double_counted(setup, tmp_path):
+    schedule, store = setup
+    # Same games as the fixture schedule, keyed by NBA ids and full team names
+    nba = _schedule(
+        tmp_path / "schedule_nba.parquet",
+        [("0022300001", D1), ("0022300002", D2), ("0022300003", D2), ("0022300004", D4), ("0022300005", D5)],
+        home="Boston Celtics",
+        away="New York Knicks",
+    )
+    plan = plan_backfill(D1, D8, store=store, schedules=[schedule, nba], today=TODAY)
+
+    assert [(i.day, i.reason, i.scheduled_games) for i in plan.items] == [
+        (D2, "missing_games", 2),
+        (D4, "missing_scores", 1),
+        (D8, "no_rows", 1),
+    ]
+    assert plan.complete_dates == 2
+    assert plan.schedule_sources == ["schedule.parquet", "schedule_nba.parquet"]
+
+
+def test_plan_only_covers_past_dates(setup):
+    schedule, store = setup
+    plan = plan_backfill(D1, D8, store=store, schedules=[schedule], today=D8)
+    assert D8 not in plan.dates
+    assert plan_backfill(D8, D8, store=store, schedules=[schedule], today=D8).empty
+
+
+def test_plan_without_schedule_uses_calendar_gaps(setup, tmp_path):
+    _, store = setup
+    plan = plan_backfill(D1, D5, store=store, schedules=[tmp_path / "none.parquet"], today=TODAY)
+
+    assert plan.dates == [date(2024, 1, 3)]
+    assert plan.items[0].reason == "calendar_gap"
+    assert plan.schedule_sources == []
+
+
+def test_batches_and_report(setup, tmp_path):
+    schedule, store = setup
+    plan = plan_backfill(D1, D8, store=store, schedules=[schedule], today=TODAY)
+
+    assert plan.batches(2) == [[D2, D4], [D8]]
+    with pytest.raises(ValueError):
+        plan.batches(0)
+
+    report = write_plan_report(plan, tmp_path / "plan.json")
+    assert '"missing_scores"' in report.read_text(encoding="utf-8")
+
+
+def test_final_statuses():
+    assert is_final_status("Final") and is_final_status("final/ot") and is_final_status(3)
+    assert not is_final_status("scheduled") and not is_final_status("Q4 2:31")
@@ -0,0 +1,50 @@
+from dataclasses import replace
+
+import pytest
+
+from src.features.benchmark import (
+    ADD_STEPS,
+    BASE_LEAGUE,
+    compare_benchmarks,
+    read_results,
+    run_benchmarks,
+    write_results,
+)
+from src.utils.synthetic_league import LeagueConfig, generate_long_df
+
+TINY = replace(BASE_LEAGUE, seasons=1, teams=6, games_per_team=12)
+
+
+def test_synthetic_league_schedule_is_balanced():
+    cfg = LeagueConfig(seasons=2, teams=10, games_per_team=20, seed=3)
+    df = generate_long_df(cfg)
+
+    assert len(df) == cfg.rows
+    assert (df.groupby("team").size() == cfg.seasons * cfg.games_per_team).all()
+    assert not df.duplicated(["team", "date"]).any()
+    assert (df["score"] != df["opp_score"]).all()
+    assert (df.groupby("game_id")["win"].sum() == 1).all()
+    assert 100 < df["score"].mean() < 125
+    assert generate_long_df(cfg).equals(df)
+
+
+def test_invalid_league_raises():
+    with pytest.raises(ValueError):
+        LeagueConfig(teams=7)
+
+
+def test_benchmarks_record_every_step_and_flag_regressions(tmp_path):
+    results = run_benchmarks([1, 2], base=TINY)
+
+    names = {r.name for r in results}
+    assert names == {"build_features", "_validate_feature_rows", *(n for n, _ in ADD_STEPS)}
+    assert {r.rows for r in results} == {TINY.rows, 2 * TINY.rows}
+    assert all(r.peak_alloc_bytes > 0 for r in results)
+
+    path = write_results(results, tmp_path / "baseline.json")
+    baseline = read_results(path)
+    assert compare_benchmarks(baseline, baseline)["regression"].sum() == 0
+
+    slower = [replace(r, wall_s=r.wall_s * 2) if r.name == "build_features" else r for r in baseline]
+    flagged = compare_benchmarks(slower, baseline)
+    assert set(flagged.loc[flagged["regression"], "name"]) == {"build_features"}
@@ -0,0 +1,98 @@
+import random
+import threading
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from src.ingestion import collector, orchestrator, pipeline
+from src.ingestion.collector import iter_scoreboards
+
+DATES = [date(2024, 1, 1) + timedelta(days=i) for i in range(12)]
+
+
+class StubFetch:
+    """fetch_scoreboard_for_date stand-in with jittered latency."""
+
+    def __init__(self, fail=(), jitter=0.01, seed=0):
+        self.fail = set(fail)
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.started = []
+        self.forced = []
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, day, force=False):
+        with self.lock:
+            self.started.append(day)
+            self.forced.append(force)
+            self.threads.add(threading.get_ident())
+            delay = self.rng.random() * self.jitter
+        time.sleep(delay)
+        if day in self.fail:
+            raise RuntimeError(f"boom {day}")
+        return pd.DataFrame({"day": [day]})
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    fetch = StubFetch(fail={DATES[3], DATES[8]})
+    monkeypatch.setattr(collector, "fetch_scoreboard_for_date", fetch)
+    return fetch
+
+
+def test_failed_dates_are_skipped(stub):
+    got = dict(iter_scoreboards(DATES, max_workers=4))
+
+    assert set(got) == set(DATES) - stub.fail
+    assert all(raw["day"].iloc[0] == day for day, raw in got.items())
+
+
+def test_in_flight_bounded_by_twice_max_workers(stub):
+    max_workers = 2
+    for consumed, _ in enumerate(iter_scoreboards(DATES, max_workers=max_workers), start=1):
+        time.sleep(0.02)    # slow consumer
+        with stub.lock:
+            ahead = len(stub.started) - consumed - len(stub.fail & set(stub.started))
+        assert ahead <= 2 * max_workers
+
+    assert len(stub.started) == len(DATES)
+
+
+def test_single_worker_fetches_lazily_in_date_order(stub):
+    it = iter_scoreboards(DATES, max_workers=1)
+
+    first_day, _ = next(it)
+    assert first_day == DATES[0]
+    assert stub.started == [DATES[0]]
+
+    rest = [day for day, _ in it]
+    assert [first_day, *rest] == [d for d in DATES if d not in stub.fail]
+    assert stub.started == DATES
+    assert stub.threads == {threading.get_ident()}
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_force_reaches_every_fetch(stub, max_workers):
+    list(iter_scoreboards(DATES, max_workers=max_workers))
+    assert not any(stub.forced)
+
+    stub.forced.clear()
+    list(iter_scoreboards(DATES, max_workers=max_workers, force=True))
+    assert len(stub.forced) == len(DATES) and all(stub.forced)
+
+
+@pytest.mark.parametrize("module", [orchestrator, pipeline])
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_ingest_dates_returns_rows_in_date_order(monkeypatch, stub, module, max_workers):
+    process = "_process_single_date" if module is orchestrator else "_process_date_to_memory"
+    monkeypatch.setattr(module, process, lambda day, raw: raw.assign(date=pd.Timestamp(day)))
+    if module is pipeline:
+        monkeypatch.setattr(pipeline, "_update_snapshot_atomically", lambda df: None)
+
+    out = module.ingest_dates(DATES, max_workers=max_workers)
+
+    expected = [pd.Timestamp(d) for d in DATES if d not in stub.fail]
+    assert out["date"].tolist() == expected
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.elo import add_elo_features
+
+
+def test_array_engine_matches_loop_engine(long_df):
+    loop = add_elo_features(long_df, engine="loop")
+    array = add_elo_features(long_df, engine="array")
+
+    pd.testing.assert_frame_equal(loop, array, check_exact=True)
+
+
+def test_array_engine_handles_unplayed_and_unpaired_rows(long_df):
+    df = long_df.copy()
+    df.loc[df.index[:6], ["score", "opp_score"]] = np.nan
+    df = df.drop(index=df.index[10])
+
+    loop = add_elo_features(df, engine="loop")
+    array = add_elo_features(df, engine="array")
+
+    pd.testing.assert_frame_equal(loop, array, check_exact=True)
+
+
+def test_unknown_engine_raises(long_df):
+    with pytest.raises(ValueError):
+        add_elo_features(long_df, engine="numba")
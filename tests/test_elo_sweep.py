@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.elo import _apply_elo_array
+from src.features.elo_sweep import EloSetting, elo_grid, run_elo_sweep, sweep_elo
+from src.ingestion.normalizer.season import infer_season_label
+
+
+def test_sweep_matches_array_engine_without_home_or_carryover(long_df):
+    ks = [10.0, 20.0, 32.0]
+    _, ratings, teams = run_elo_sweep(long_df, [EloSetting(k) for k in ks])
+
+    for row, k in zip(ratings, ks):
+        expected = _apply_elo_array(long_df, k=k).final_ratings()
+        np.testing.assert_allclose(row, [expected[t] for t in teams])
+
+
+def test_sweep_scores_every_setting(long_df):
+    grid = elo_grid([10, 20], home_advantages=[0, 50], carryovers=[0, 0.5])
+    results = sweep_elo(long_df, grid, burn_in=20)
+
+    assert len(results) == len(grid)
+    assert results["log_loss"].is_monotonic_increasing
+    assert results[["log_loss", "brier", "accuracy"]].notna().all().all()
+    assert results["brier"].between(0, 1).all()
+    assert (results["games"] == long_df["game_id"].nunique() - 20).all()
+
+
+def test_full_carryover_resets_ratings_each_season(long_df):
+    _, ratings, teams = run_elo_sweep(long_df, [EloSetting(20, carryover=1.0)])
+
+    seasons = pd.to_datetime(long_df["date"]).dt.date.map(infer_season_label)
+    last = seasons == seasons.max()
+    expected = _apply_elo_array(long_df[last], k=20).final_ratings()
+    np.testing.assert_allclose(ratings[0], [expected[t] for t in teams])
+
+
+def _games(*games):
+    rows = []
+    for i, (day, home, away, hs, aws) in enumerate(games):
+        for team, opp, is_home, sc, osc in ((home, away, 1, hs, aws), (away, home, 0, aws, hs)):
+            rows.append({"game_id": f"G{i}", "date": pd.Timestamp(day), "team": team, "opponent": opp,
+                         "is_home": is_home, "score": sc, "opp_score": osc})
+    return pd.DataFrame(rows)
+
+
+def test_carryover_applies_at_october_opener_not_jan_1():
+    one_season = _games(
+        ("2023-12-30", "BOS", "NYK", 110, 100),
+        ("2024-01-02", "NYK", "BOS", 105, 99),
+        ("2024-03-01", "BOS", "NYK", 120, 101),
+    )
+    _, carried, _ = run_elo_sweep(one_season, [EloSetting(20, carryover=1.0)])
+    _, plain, _ = run_elo_sweep(one_season, [EloSetting(20)])
+    np.testing.assert_allclose(carried, plain)
+
+    next_season = pd.concat([one_season, _games(("2024-10-22", "BOS", "NYK", 100, 90)).assign(game_id="G9")])
+    _, ratings, teams = run_elo_sweep(next_season, [EloSetting(20, carryover=1.0)])
+    expected = _apply_elo_array(next_season[next_season["game_id"] == "G9"], k=20).final_ratings()
+    np.testing.assert_allclose(ratings[0], [expected[t] for t in teams])
+
+
+def test_season_column_overrides_inferred_boundaries():
+    # 2020 bubble: the 2019-20 season ran into October
+    df = _games(("2020-10-09", "BOS", "NYK", 110, 100), ("2020-10-11", "NYK", "BOS", 105, 99))
+    _, carried, _ = run_elo_sweep(df.assign(season="2019-20"), [EloSetting(20, carryover=1.0)])
+    _, plain, _ = run_elo_sweep(df, [EloSetting(20)])
+    np.testing.assert_allclose(carried, plain)
+
+
+def test_sweep_requires_settings(long_df):
+    with pytest.raises(ValueError):
+        run_elo_sweep(long_df, [])
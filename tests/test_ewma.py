@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from src.features.ewma import EWMA_COLUMNS, ewma_alpha
+from src.features.feature_pipeline import build_features
+from src.features.team_state import TeamStateStore, build_team_state
+
+KEY = ["game_id", "team"]
+
+
+def _sorted(df):
+    return df.sort_values(KEY).reset_index(drop=True)
+
+
+def test_ewma_matches_pandas_ewm(long_df):
+    out = build_features(long_df, columns=["ewma_points_for_hl5", "ewma_margin_hl10"])
+    df = long_df.assign(date=pd.to_datetime(long_df["date"]), margin=long_df["score"] - long_df["opp_score"])
+    df = df.sort_values(["team", "date"], kind="mergesort")
+
+    for col, source, h in (("ewma_points_for_hl5", "score", 5), ("ewma_margin_hl10", "margin", 10)):
+        alpha = ewma_alpha(h)
+        expected = df.groupby("team")[source].transform(
+            lambda s, alpha=alpha: s.astype(float).ewm(alpha=alpha, adjust=False).mean().shift(1)
+        )
+        got = out.set_index(KEY)[col].reindex(pd.MultiIndex.from_frame(df[KEY]))
+        np.testing.assert_allclose(got.to_numpy(), expected.to_numpy(), rtol=1e-6)
+
+
+def test_warm_start_ewma_is_exact(long_df):
+    dates = np.sort(long_df["date"].unique())
+    cut = dates[len(dates) // 2]
+    history, recent = long_df[long_df["date"] < cut], long_df[long_df["date"] >= cut]
+
+    full = _sorted(build_features(long_df, columns=list(EWMA_COLUMNS)))
+    warm = build_features(recent, columns=list(EWMA_COLUMNS), states=build_team_state(history))
+
+    expected = full[full["date"] >= cut].reset_index(drop=True)
+    pd.testing.assert_frame_equal(_sorted(warm)[list(EWMA_COLUMNS)], expected[list(EWMA_COLUMNS)], check_exact=True)
+
+
+def test_store_round_trips_ewma_state(long_df, tmp_path):
+    store = TeamStateStore(tmp_path / "state.parquet")
+    states = build_team_state(long_df)
+    store.save(states)
+
+    loaded = store.load()
+    assert loaded["T00"].ewma == states["T00"].ewma
+
+    # State files written before EWMA state load with it empty
+    legacy = pd.read_parquet(store.path).drop(columns=list(EWMA_COLUMNS))
+    legacy.to_parquet(store.path, index=False)
+    assert np.isnan(store.load()["T00"].ewma_value("ewma_margin_hl5"))
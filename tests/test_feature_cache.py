@@ -0,0 +1,42 @@
+import pandas as pd
+
+from src.features.builder import FeatureBuilder
+from src.features.feature_cache import FeatureCache
+
+
+def test_builder_returns_cached_features(long_df, tmp_path):
+    cache = FeatureCache(tmp_path / "cache")
+    fb = FeatureBuilder(cache=cache)
+
+    first = fb.build(long_df)
+    first["elo"] = 0.0  # callers get copies
+    second = fb.build(long_df)
+
+    assert cache.stats.misses == 1
+    assert cache.stats.memory_hits == 1
+    pd.testing.assert_frame_equal(second, FeatureBuilder(use_cache=False).build(long_df))
+
+    # A fresh process-level cache over the same directory hits on disk
+    cold = FeatureCache(tmp_path / "cache")
+    pd.testing.assert_frame_equal(FeatureBuilder(cache=cold).build(long_df), second)
+    assert cold.stats.disk_hits == 1
+
+    # Changed input rows → new key
+    changed = long_df.copy()
+    changed.loc[0, "score"] += 1
+    fb.build(changed)
+    assert cache.stats.misses == 2
+
+
+def test_disk_tier_evicts_least_recently_used(long_df, tmp_path):
+    cache = FeatureCache(tmp_path / "cache", memory_entries=1)
+    fb = FeatureBuilder(cache=cache)
+
+    fb.build(long_df)
+    entry_bytes = next((tmp_path / "cache").glob("*.parquet")).stat().st_size
+    cache.max_bytes = int(entry_bytes * 1.5)
+
+    fb.build(long_df.head(200))
+
+    assert cache.stats.evictions == 1
+    assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.builder import FeatureBuilder
+from src.features.feature_pipeline import build_features
+from src.features.team_state import build_team_state
+from src.model.config.model_config import FEATURE_MAP, TARGET_MAP
+
+
+def test_columnar_engine_matches_pandas_full_build(long_df):
+    pd.testing.assert_frame_equal(
+        build_features(long_df, engine="columnar"),
+        build_features(long_df),
+        check_exact=True,
+    )
+
+
+@pytest.mark.parametrize("columns", [FEATURE_MAP["moneyline"] + [TARGET_MAP["moneyline"]], ["sos"], ["win_streak"]])
+def test_columnar_engine_matches_pandas_partial_build(long_df, columns):
+    pd.testing.assert_frame_equal(
+        build_features(long_df, columns=columns, engine="columnar"),
+        build_features(long_df, columns=columns),
+        check_exact=True,
+    )
+
+
+def test_columnar_engine_matches_pandas_warm_start_with_unplayed_games(long_df):
+    dates = np.sort(long_df["date"].unique())
+    history = long_df[long_df["date"] < dates[len(dates) // 2]]
+    rows = long_df[long_df["date"] >= dates[len(dates) // 2]].copy()
+    rows.loc[rows["date"] == dates[-1], ["score", "opp_score", "win", "total_points"]] = np.nan
+
+    states = build_team_state(history)
+    columns = FEATURE_MAP["moneyline"]
+    pd.testing.assert_frame_equal(
+        build_features(rows, columns=columns, states=states, engine="columnar"),
+        build_features(rows, columns=columns, states=states),
+        check_exact=True,
+    )
+
+
+def test_feature_builder_engine_selection(long_df):
+    fb = FeatureBuilder(engine="columnar", use_cache=False)
+    assert fb.engine == "columnar"
+    pd.testing.assert_frame_equal(fb.build(long_df), FeatureBuilder(use_cache=False).build(long_df))
+
+    with pytest.raises(ValueError, match="Unknown feature engine"):
+        FeatureBuilder(engine="polars")
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+from src.features.builder import FeatureBuilder
+from src.features.frame_layout import compact_feature_frame
+from src.features.team_state import TeamStateStore
+
+KEY = ["game_id", "team"]
+
+
+def _sorted(df):
+    return df.sort_values(KEY).reset_index(drop=True)
+
+
+def test_build_incremental_matches_full_build(long_df, tmp_path):
+    fb = FeatureBuilder(state_store=TeamStateStore(tmp_path / "state.parquet"))
+    dates = np.sort(long_df["date"].unique())
+
+    fb.build_state(long_df[long_df["date"] < dates[-4]])
+    first = fb.build_incremental(long_df[long_df["date"].isin(dates[-4:-2])])
+    second = fb.build_incremental(long_df[long_df["date"] >= dates[-2]])
+
+    full = fb.build(long_df)
+    full = full[full["date"] >= dates[-4]]
+
+    # Batches carry their own dictionaries; restore the shared layout
+    incremental = compact_feature_frame(pd.concat([first, second], ignore_index=True))
+    pd.testing.assert_frame_equal(_sorted(incremental), _sorted(full)[incremental.columns])
+
+
+def test_build_incremental_skips_rows_already_in_state(long_df, tmp_path):
+    fb = FeatureBuilder(state_store=TeamStateStore(tmp_path / "state.parquet"))
+    fb.build_state(long_df)
+
+    assert fb.build_incremental(long_df[long_df["date"] == long_df["date"].max()]).empty
+
+
+def _state_view(states):
+    return {
+        t: (st.last_date, st.streak, list(st.scores), list(st.opp_scores), st.elo, sorted(st.ewma.items()))
+        for t, st in sorted(states.items())
+    }
+
+
+def _assert_same_state(a, b):
+    va, vb = _state_view(a), _state_view(b)
+    assert va.keys() == vb.keys()
+    for team in va:
+        assert va[team][:4] == vb[team][:4], team
+        np.testing.assert_allclose(va[team][4], vb[team][4])
+        np.testing.assert_allclose([v for _, v in va[team][5]], [v for _, v in vb[team][5]])
+
+
+def test_advance_state_day_by_day_matches_rebuild(long_df, tmp_path, monkeypatch):
+    from src.features import builder
+
+    # Canonical snapshot naming (opponent_score), as written by ingestion
+    snapshot = long_df.rename(columns={"opp_score": "opponent_score"})
+    dates = np.sort(snapshot["date"].unique())
+    # No state yet: the first ingest builds it from the snapshot so far
+    monkeypatch.setattr(builder, "load_long_snapshot", lambda: snapshot[snapshot["date"] <= dates[0]])
+    fb = FeatureBuilder(state_store=TeamStateStore(tmp_path / "state.parquet"), use_cache=False)
+
+    for day in dates:
+        fb.advance_state(snapshot[snapshot["date"] == day])
+    fb.advance_state(snapshot[snapshot["date"] == dates[-1]])     # re-ingest is a no-op
+
+    reference = FeatureBuilder(state_store=TeamStateStore(tmp_path / "ref.parquet"), use_cache=False)
+    reference.build_state(long_df)
+    _assert_same_state(fb.state_store.load(), reference.state_store.load())
+
+
+def test_advance_state_rebuilds_when_history_changes_behind_it(long_df, tmp_path, monkeypatch):
+    from src.features import builder
+
+    dates = np.sort(long_df["date"].unique())
+    missing_day = dates[len(dates) // 2]
+    fb = FeatureBuilder(state_store=TeamStateStore(tmp_path / "state.parquet"), use_cache=False)
+    fb.build_state(long_df[long_df["date"] != missing_day])
+
+    # Backfilled date: the snapshot now holds it, the state does not
+    monkeypatch.setattr(builder, "load_long_snapshot", lambda: long_df)
+    fb.advance_state(long_df[long_df["date"] == missing_day])
+
+    reference = FeatureBuilder(state_store=TeamStateStore(tmp_path / "ref.parquet"), use_cache=False)
+    reference.build_state(long_df)
+    _assert_same_state(fb.state_store.load(), reference.state_store.load())
+
+
+def test_state_before_uses_persisted_state_for_the_next_day(long_df, tmp_path):
+    from src.ingestion.long_snapshot_store import LongSnapshotStore
+
+    dates = np.sort(long_df["date"].unique())
+    store = LongSnapshotStore(tmp_path / "long", legacy=None)
+    store.write_days(long_df.assign(date=pd.to_datetime(long_df["date"]).dt.date))
+    fb = FeatureBuilder(state_store=TeamStateStore(tmp_path / "state.parquet"), use_cache=False)
+    fb.build_state(long_df)
+
+    def no_history(*args, **kwargs):
+        raise AssertionError("history read")
+
+    next_day = (pd.Timestamp(dates[-1]) + pd.Timedelta(days=1)).date()
+    real_read, store.read = store.read, no_history
+    _assert_same_state(fb.state_before(next_day, store=store), fb.state_store.load())
+
+    # A past date rebuilds from the partitions before it (stored in
+    # (date, game_id, team) order, which fixes Elo update order)
+    store.read = real_read
+    past = pd.Timestamp(dates[-3]).date()
+    history = long_df[pd.to_datetime(long_df["date"]).dt.date < past].sort_values(["date", "game_id", "team"])
+    expected = FeatureBuilder(state_store=TeamStateStore(tmp_path / "ref.parquet"), use_cache=False)
+    expected.build_state(history)
+    _assert_same_state(fb.state_before(past, store=store), expected.state_store.load())
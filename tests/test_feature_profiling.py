@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from src.features.feature_pipeline import build_features
+from src.features.profiling import FeatureProfile, read_profile_log
+from src.features.registry import plan_features
+from src.features.feature_schema import FeatureRow
+
+
+@pytest.mark.parametrize("engine", ["pandas", "columnar"])
+def test_profile_covers_every_step_and_stage(long_df, engine):
+    profile = FeatureProfile(trace_allocations=True)
+    features = build_features(long_df, engine=engine, profile=profile)
+
+    report = profile.to_frame()
+    steps = {s.name for s in plan_features(FeatureRow.model_fields).steps}
+    first_stage = "scan" if engine == "columnar" else "base frame"
+    assert set(report["step"]) == steps | {first_stage, "validation"}
+
+    plan_rows = report[report["step"].isin(steps)]
+    assert (plan_rows["rows_out"] == plan_rows["rows_in"]).all()
+    assert (report["wall_s"] >= 0).all() and (report["cpu_s"] >= 0).all()
+    assert (report["bytes_out"] > 0).all()
+    assert report["alloc_peak_bytes"].notna().all()
+
+    validation = report.set_index("step").loc["validation"]
+    assert validation["rows_out"] == len(features)
+    assert profile.meta["rows"] == len(long_df) and profile.meta["engine"] == engine
+
+    pd.testing.assert_frame_equal(features, build_features(long_df, engine=engine))
+
+
+def test_profile_log_round_trip(long_df, tmp_path):
+    path = tmp_path / "profiles.jsonl"
+    for _ in range(2):
+        profile = FeatureProfile()
+        build_features(long_df, columns=["sos"], profile=profile)
+        profile.write(path)
+
+    log = read_profile_log(path)
+    assert log["recorded_at"].nunique() == 2
+    assert set(log["step"]) == {"base frame", "sos"}
+    assert (log["columns"] == 1).all()
+    assert read_profile_log(tmp_path / "missing.jsonl").empty
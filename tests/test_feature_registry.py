@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+
+from src.features.builder import FeatureBuilder
+from src.features.feature_pipeline import build_features
+from src.features.registry import plan_features
+
+
+def test_plan_prunes_to_requested_columns():
+    plan = plan_features(["opp_win_pct_last10"])
+
+    assert [[s.name for s in level] for level in plan.levels] == [
+        ["margin"],
+        ["rolling"],
+        ["opponent:opp_win_pct_last10"],
+    ]
+    assert plan.wanted["rolling"] == {"team_win_pct_last10"}
+
+
+def test_unknown_column_raises():
+    with pytest.raises(ValueError):
+        plan_features(["not_a_feature"])
+
+
+def test_model_build_matches_full_build(long_df):
+    fb = FeatureBuilder()
+    full = fb.build(long_df)
+    partial = fb.build_for_model(long_df, "moneyline")
+
+    for col in partial.columns:
+        pd.testing.assert_series_equal(partial[col], full[col], check_dtype=False)
+
+
+def test_serial_and_concurrent_runs_agree(long_df):
+    serial = build_features(long_df, max_workers=1)
+    threaded = build_features(long_df, max_workers=4)
+
+    pd.testing.assert_frame_equal(serial, threaded)
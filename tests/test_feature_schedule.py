@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.builder import FeatureBuilder
+from src.features.team_state import OUTCOME_COLUMNS, TeamStateStore, build_team_state
+from src.model.config.model_config import FEATURE_MAP
+
+KEY = ["game_id", "team"]
+
+
+def _sorted(df):
+    return df.sort_values(KEY).reset_index(drop=True)
+
+
+def _split(long_df):
+    dates = np.sort(long_df["date"].unique())
+    cut = pd.Timestamp(dates[-3])
+    return long_df[long_df["date"] < cut], long_df[long_df["date"] >= cut], cut
+
+
+def test_build_for_schedule_matches_full_build_for_next_slate(long_df, tmp_path):
+    history, schedule, cut = _split(long_df)
+    fb = FeatureBuilder(state_store=TeamStateStore(tmp_path / "state.parquet"))
+    fb.build_state(history)
+
+    features = fb.build_for_schedule(schedule, as_of=cut)
+
+    # Reference: full build over history plus the unplayed slate
+    slate = schedule[schedule["date"] == cut].assign(
+        score=np.nan, opp_score=np.nan, win=np.nan, total_points=np.nan
+    )
+    columns = [c for c in FEATURE_MAP["moneyline"] if c not in OUTCOME_COLUMNS]
+    full = fb.build(pd.concat([history, slate], ignore_index=True), columns=columns)
+    full = full[full["date"] == cut]
+
+    ours = features[features["date"] == cut]
+    assert len(ours) == len(full)
+    pd.testing.assert_frame_equal(
+        _sorted(ours)[columns].astype("float64"),
+        _sorted(full)[columns].astype("float64"),
+    )
+
+
+def test_build_for_schedule_never_reads_results(long_df, tmp_path):
+    history, schedule, cut = _split(long_df)
+    fb = FeatureBuilder(state_store=TeamStateStore(tmp_path / "state.parquet"))
+
+    features = fb.build_for_schedule(schedule, as_of=cut, states=build_team_state(history))
+
+    assert len(features) == len(schedule)
+    assert features[list(OUTCOME_COLUMNS)].isna().all().all()
+
+    # Later games see the same state (no results yet), rest days count
+    # from the team's previous scheduled game
+    by_team = features.groupby("team", observed=True)
+    assert (by_team["elo"].nunique() == 1).all()
+    assert (by_team["win_streak"].nunique() == 1).all()
+
+
+def test_schedule_features_fill_every_model_input(long_df, tmp_path):
+    history, schedule, cut = _split(long_df)
+    fb = FeatureBuilder(state_store=TeamStateStore(tmp_path / "state.parquet"))
+
+    features = fb.build_for_schedule(schedule, as_of=cut, states=build_team_state(history))
+
+    for model_type, columns in FEATURE_MAP.items():
+        assert not set(columns) & set(OUTCOME_COLUMNS), model_type
+        assert features[columns].notna().all().all(), model_type
+
+
+def test_build_for_schedule_rejects_state_after_as_of(long_df, tmp_path):
+    _, schedule, cut = _split(long_df)
+    fb = FeatureBuilder(state_store=TeamStateStore(tmp_path / "state.parquet"))
+    fb.build_state(long_df)
+
+    with pytest.raises(ValueError, match="not before as_of"):
+        fb.build_for_schedule(schedule, as_of=cut)
@@ -0,0 +1,23 @@
+import pandas as pd
+
+from src.features.feature_pipeline import build_features
+from tests.conftest import make_long_df
+
+
+def test_season_shards_match_serial_build():
+    long_df = make_long_df(seasons=3)
+
+    serial = build_features(long_df)
+    sharded = build_features(long_df, processes=3)
+
+    pd.testing.assert_frame_equal(sharded, serial, check_exact=True)
+
+
+def test_season_shards_support_column_pruning():
+    long_df = make_long_df(seasons=3)
+    columns = ["elo_roll10", "opp_win_pct_last10", "rest_days"]
+
+    serial = build_features(long_df, columns=columns)
+    sharded = build_features(long_df, columns=columns, processes=2)
+
+    pd.testing.assert_frame_equal(sharded, serial, check_exact=True)
@@ -0,0 +1,104 @@
+import pandas as pd
+
+from src.features.feature_pipeline import build_features, refresh_feature_snapshot
+from src.features.feature_store import FeatureStore
+from tests.conftest import make_long_df
+
+KEY = ["game_id", "team"]
+
+
+def _sorted(df):
+    return df.sort_values(KEY).reset_index(drop=True)
+
+
+def _long_df():
+    # Three seasons; T00 wins every game so its streak outlasts the state buffer
+    df = make_long_df(seasons=3)
+    df.loc[df["team"] == "T00", "score"] = 200
+    df.loc[df["opponent"] == "T00", "opp_score"] = 200
+    df["win"] = (df["score"] > df["opp_score"]).astype(int)
+    return df
+
+
+def test_refresh_rebuilds_only_changed_seasons(tmp_path):
+    store = FeatureStore(tmp_path / "features")
+    long_df = _long_df()
+
+    assert refresh_feature_snapshot(long_df, store) == ["2016-2017", "2017-2018", "2018-2019"]
+    assert refresh_feature_snapshot(long_df, store) == []
+
+    before = store.load_manifest()["seasons"]
+
+    changed = long_df.copy()
+    last_season = changed["date"] >= "2018-01-01"
+    changed.loc[last_season & (changed["team"] == "T03"), "score"] += 5
+    changed.loc[last_season & (changed["opponent"] == "T03"), "opp_score"] += 5
+    changed["win"] = (changed["score"] > changed["opp_score"]).astype(int)
+
+    assert refresh_feature_snapshot(changed, store) == ["2018-2019"]
+
+    after = store.load_manifest()["seasons"]
+    assert after["2016-2017"] == before["2016-2017"]
+    assert after["2018-2019"]["input_hash"] != before["2018-2019"]["input_hash"]
+
+    full = build_features(changed)
+    pd.testing.assert_frame_equal(_sorted(store.read()), _sorted(full))
+    assert full.loc[full["team"] == "T00", "win_streak"].max() > 20
+
+
+def test_read_pushes_down_seasons_and_columns(tmp_path):
+    store = FeatureStore(tmp_path / "features")
+    refresh_feature_snapshot(_long_df(), store)
+
+    df = store.read(seasons=["2017-2018"], columns=["team", "date", "elo"])
+
+    assert list(df.columns) == ["season", "team", "date", "elo"]
+    assert set(df["season"]) == {"2017-2018"}
+
+
+def _rewrite_partitions(store, edit):
+    manifest = store.load_manifest()
+    for season in store.seasons():
+        path = store.root / manifest["seasons"][season]["path"]
+        edit(pd.read_parquet(path)).to_parquet(path, index=False)
+
+
+def test_refresh_recomputes_only_columns_of_changed_modules(tmp_path):
+    store = FeatureStore(tmp_path / "features")
+    long_df = _long_df()
+    refresh_feature_snapshot(long_df, store)
+
+    # Pretend sos.py changed since the snapshot was written
+    manifest = store.load_manifest()
+    manifest["module_versions"]["src.features.sos"] = "outdated"
+    store.save_manifest(manifest)
+    _rewrite_partitions(store, lambda df: df.assign(sos=-1.0, elo_roll5=1234.0))
+
+    assert refresh_feature_snapshot(long_df, store) == ["2016-2017", "2017-2018", "2018-2019"]
+
+    out = _sorted(store.read())
+    full = _sorted(build_features(long_df))
+    pd.testing.assert_series_equal(out["sos"], full["sos"])
+    assert (out["elo_roll5"] == 1234.0).all()  # other modules' columns are left as stored
+    assert refresh_feature_snapshot(long_df, store) == []
+
+
+def test_refresh_splices_new_columns_and_rebuilds_changed_seasons(tmp_path):
+    store = FeatureStore(tmp_path / "features")
+    long_df = _long_df()
+    refresh_feature_snapshot(long_df, store)
+
+    # Snapshot written before the EWMA columns existed
+    ewma_cols = [c for c in store.load_manifest()["columns"] if c.startswith("ewma_")]
+    manifest = store.load_manifest()
+    manifest["columns"] = [c for c in manifest["columns"] if c not in ewma_cols]
+    store.save_manifest(manifest)
+    _rewrite_partitions(store, lambda df: df.drop(columns=ewma_cols))
+
+    changed = long_df.copy()
+    changed.loc[(changed["date"] >= "2018-01-01") & (changed["team"] == "T03"), "score"] += 5
+    changed.loc[(changed["date"] >= "2018-01-01") & (changed["opponent"] == "T03"), "opp_score"] += 5
+    changed["win"] = (changed["score"] > changed["opp_score"]).astype(int)
+
+    assert refresh_feature_snapshot(changed, store) == ["2016-2017", "2017-2018", "2018-2019"]
+    pd.testing.assert_frame_equal(_sorted(store.read()), _sorted(build_features(changed)))
@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from src.features.feature_pipeline import build_features, iter_features
+from src.features.frame_layout import compact_feature_frame
+
+KEY = ["team", "date"]
+
+
+def _stream(path, **kwargs):
+    return list(iter_features(path, **kwargs))
+
+
+@pytest.mark.parametrize("chunks_by", ["season", "month"])
+def test_iter_features_matches_full_build(long_df, tmp_path, chunks_by):
+    path = tmp_path / "long.parquet"
+    long_df.to_parquet(path, index=False)
+
+    chunks = _stream(path, chunks_by=chunks_by)
+    labels = [label for label, _ in chunks]
+    assert labels == sorted(labels) and len(labels) == len(set(labels))
+
+    # Chunks carry their own dictionaries; restore the shared layout
+    streamed = compact_feature_frame(pd.concat([df for _, df in chunks], ignore_index=True))
+    streamed = streamed.sort_values(KEY, kind="mergesort").reset_index(drop=True)
+    pd.testing.assert_frame_equal(streamed, build_features(long_df), check_exact=True)
+
+
+def test_iter_features_partial_columns_by_month(long_df, tmp_path):
+    path = tmp_path / "long.parquet"
+    long_df.to_parquet(path, index=False)
+
+    for label, df in _stream(path, chunks_by="month", columns=["elo", "win_streak"]):
+        assert (df["date"].dt.strftime("%Y-%m") == label).all()
+        assert {"elo", "win_streak", "game_id", "team"} <= set(df.columns)
+
+
+def test_iter_features_rejects_unknown_chunking(tmp_path):
+    with pytest.raises(ValueError, match="chunks_by"):
+        next(iter_features(tmp_path / "long.parquet", chunks_by="week"))
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.feature_pipeline import build_features
+from src.features.feature_schema import FeatureRow
+from src.features.feature_validation import (
+    FeatureValidationError,
+    validate_feature_frame,
+)
+
+
+@pytest.fixture
+def features(long_df):
+    return build_features(long_df)
+
+
+def test_columnar_matches_row_validation_and_keeps_float32(features):
+    rows = pd.DataFrame([FeatureRow(**r).model_dump() for r in features.to_dict("records")])
+    validated = validate_feature_frame(features)
+
+    assert validated["margin_rolling_5"].dtype == np.float32
+    assert list(validated.columns) == list(FeatureRow.model_fields)
+    pd.testing.assert_frame_equal(
+        validated.astype({"team": str, "opponent": str, "season": str}),
+        rows,
+        check_dtype=False,
+    )
+
+
+def test_violations_are_reported_in_bulk(features):
+    bad = features.copy()
+    bad.loc[[1, 4], "is_home"] = 2
+    bad.loc[[2], "elo"] = 9000.0
+    bad.loc[[3, 5], "win_rolling_5"] = np.float32(1.5)
+    bad.loc[[6], "game_id"] = " "
+
+    with pytest.raises(FeatureValidationError) as exc:
+        validate_feature_frame(bad)
+
+    violations = exc.value.violations
+    assert list(violations["is_home: expected binary 0/1"]) == [1, 4]
+    assert list(violations["elo: ELO outside [500, 3000]"]) == [2]
+    assert list(violations["win_rolling_5: win rate outside [0.0, 1.0]"]) == [3, 5]
+    assert list(violations["game_id: empty identifier"]) == [6]
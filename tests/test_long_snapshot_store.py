@@ -0,0 +1,141 @@
+import json
+from datetime import date
+
+import pandas as pd
+
+from src.ingestion.long_snapshot_store import LongSnapshotStore, long_snapshot_exists
+
+
+def _rows(day, game_id, home, away, home_score, away_score, status="Final"):
+    base = {"game_id": game_id, "date": day, "season": "2023-24", "status": status, "schema_version": "v5"}
+    return [
+        {**base, "team": home, "opponent": away, "is_home": 1, "score": home_score, "opponent_score": away_score},
+        {**base, "team": away, "opponent": home, "is_home": 0, "score": away_score, "opponent_score": home_score},
+    ]
+
+
+def _frame(*games):
+    return pd.DataFrame([row for game in games for row in _rows(*game)])
+
+
+D1, D2, D3 = date(2023, 10, 24), date(2023, 10, 25), date(2024, 10, 22)
+
+
+def test_write_days_only_touches_ingested_dates(tmp_path):
+    store = LongSnapshotStore(tmp_path / "long", legacy=None)
+    store.write_days(_frame((D1, "g1", "BOS", "NYK", 108, 104), (D2, "g2", "LAL", "DEN", 107, 119)))
+
+    untouched = store.partition_path(D1).stat().st_mtime_ns
+    store.write_days(_frame((D2, "g3", "PHX", "GSW", 108, 104)))
+
+    assert store.partition_path(D1).stat().st_mtime_ns == untouched
+    assert store.days() == [D1, D2]
+    assert store.load_manifest()["days"][D2.isoformat()]["rows"] == 4
+    assert store.load_manifest()["rows"] == 6
+
+
+def test_later_ingest_replaces_same_rows(tmp_path):
+    store = LongSnapshotStore(tmp_path / "long", legacy=None)
+    store.write_days(_frame((D1, "g1", "BOS", "NYK", 50, 48, "Live")))
+    store.write_days(_frame((D1, "g1", "BOS", "NYK", 108, 104, "Final")))
+
+    day = store.read_day(D1)
+    assert len(day) == 2
+    assert set(day["status"]) == {"Final"}
+    assert sorted(day["score"]) == [104, 108]
+
+
+def test_dataset_reads_in_date_order(tmp_path):
+    root = tmp_path / "long"
+    store = LongSnapshotStore(root, legacy=None)
+    store.write_days(_frame((D3, "g9", "BOS", "NYK", 108, 104), (D1, "g1", "LAL", "DEN", 107, 119)))
+    store.write_days(_frame((D2, "g2", "PHX", "GSW", 108, 104)))
+
+    whole = pd.read_parquet(root)
+    assert list(pd.to_datetime(whole["date"]).dt.date) == [D1, D1, D2, D2, D3, D3]
+    assert "_manifest" not in "".join(whole.columns)
+
+    ranged = store.read(start=D2, end=D2, columns=["game_id", "team"])
+    assert list(ranged.columns) == ["game_id", "team"]
+    assert set(ranged["game_id"]) == {"g2"}
+    assert store.read(start=date(2030, 1, 1)).empty
+
+
+def test_legacy_snapshot_is_migrated_and_rewrite_drops_dates(tmp_path):
+    legacy = tmp_path / "long_snapshot.parquet"
+    _frame((D1, "g1", "BOS", "NYK", 108, 104), (D2, "g2", "LAL", "DEN", 107, 119)).to_parquet(legacy, index=False)
+
+    store = LongSnapshotStore(tmp_path / "long", legacy=legacy)
+    assert len(store.read()) == 4
+    assert store.days() == [D1, D2]
+
+    store.rewrite(_frame((D2, "g2", "LAL", "DEN", 107, 119)))
+    assert store.days() == [D2]
+    assert not store.partition_path(D1).exists()
+
+
+def test_existence_check_migrates_legacy_snapshot(tmp_path):
+    legacy = tmp_path / "long_snapshot.parquet"
+    root = tmp_path / "long"
+    _frame((D1, "g1", "BOS", "NYK", 108, 104)).to_parquet(legacy, index=False)
+
+    assert not root.exists()
+    assert long_snapshot_exists(root, legacy=legacy)
+    # Direct directory readers now see the migrated rows
+    assert len(pd.read_parquet(root)) == 2
+    assert not long_snapshot_exists(tmp_path / "other", legacy=None)
+
+
+def test_index_answers_lookups_without_reading_data(tmp_path, monkeypatch):
+    store = LongSnapshotStore(tmp_path / "long", legacy=None)
+    store.write_days(
+        _frame(
+            (D1, "g1", "BOS", "NYK", 108, 104),
+            (D1, "g2", "LAL", "DEN", 0, 0, "Scheduled"),
+            (D2, "g3", "PHX", "GSW", 108, 104),
+        )
+    )
+
+    def no_data_reads(*args, **kwargs):
+        raise AssertionError("data read")
+
+    monkeypatch.setattr("src.ingestion.long_snapshot_store.pd.read_parquet", no_data_reads)
+    monkeypatch.setattr("src.ingestion.long_snapshot_store.pq.read_table", no_data_reads)
+
+    assert store.has_date(D1) and not store.has_date(D3)
+    assert store.missing_dates(date(2023, 10, 23), date(2023, 10, 26)) == [date(2023, 10, 23), date(2023, 10, 26)]
+    assert store.games_on(D1) == ["g1", "g2"]
+    assert store.status_counts(D1) == {"Final": 1, "Scheduled": 1}
+    assert store.locate_game("g2") == (D1, 2, 4)
+    assert store.locate_game("nope") is None
+
+
+def test_read_day_selects_games_by_row_range(tmp_path):
+    store = LongSnapshotStore(tmp_path / "long", legacy=None)
+    store.write_days(_frame((D1, "g1", "BOS", "NYK", 108, 104), (D1, "g2", "LAL", "DEN", 107, 119)))
+
+    rows = store.read_day(D1, game_ids=["g2"])
+    assert list(rows["game_id"]) == ["g2", "g2"]
+    assert sorted(rows["team"]) == ["DEN", "LAL"]
+    assert store.read_day(D1, game_ids=["missing"]).empty
+    assert store.read_day(D3).empty
+
+
+def test_index_refreshes_after_write_and_upgrades_old_manifests(tmp_path):
+    store = LongSnapshotStore(tmp_path / "long", legacy=None)
+    store.write_days(_frame((D1, "g1", "BOS", "NYK", 108, 104)))
+    assert store.games_on(D1) == ["g1"]
+
+    store.write_days(_frame((D1, "g2", "LAL", "DEN", 107, 119)))
+    assert store.games_on(D1) == ["g1", "g2"]
+
+    # A manifest written before the index existed is indexed on first use
+    manifest = store.load_manifest()
+    manifest.pop("index_version")
+    for entry in manifest["days"].values():
+        entry.pop("games")
+        entry.pop("status")
+    store.manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    assert store.games_on(D1) == ["g1", "g2"]
+    assert store.load_manifest()["days"][D1.isoformat()]["status"] == {"Final": 2}
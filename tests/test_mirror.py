@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+from src.features.mirror import build_mirror_index, gather_opponent
+
+
+def test_mirror_index_pairs_rows_and_flags_bad_games():
+    df = pd.DataFrame(
+        {
+            "game_id": ["1", "2", "1", "3", "2", "4", "4"],
+            "team":     ["A", "C", "B", "E", "D", "F", "G"],
+            "opponent": ["B", "D", "A", "X", "C", "G", "H"],  # game 3 unpaired, game 4 asymmetric
+        }
+    )
+
+    mirror = build_mirror_index(df)
+    assert mirror.tolist() == [2, 4, 0, -1, 1, -1, -1]
+
+    values = np.arange(7, dtype="float32")
+    opp = gather_opponent(values, mirror)
+    assert opp.dtype == np.float32
+    np.testing.assert_array_equal(opp, [2, 4, 0, np.nan, 1, np.nan, np.nan])
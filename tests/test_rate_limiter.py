@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+from src.ingestion.rate_limiter import HostLimit, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+def test_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == [0.5, 0.5]
+    assert clock.now == 1.0
+
+
+def test_backoff_pauses_only_that_host():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        limits={"a.test": HostLimit(rate=100.0, burst=10), "b.test": HostLimit(rate=100.0, burst=10)},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    limiter.backoff("https://a.test/x", 7.0)
+    with limiter.slot("https://b.test/y"):
+        assert clock.now == 0.0
+    with limiter.slot("https://a.test/x"):
+        # The paused bucket is drained: one token interval after the pause
+        assert clock.now == pytest.approx(7.01)
+
+
+def test_concurrency_cap_per_host():
+    limiter = RateLimiter(limits={"a.test": HostLimit(rate=1000.0, burst=100, max_concurrent=2)})
+    active, peak = [0], [0]
+    lock = threading.Lock()
+    gate = threading.Barrier(2, timeout=1)
+
+    def worker():
+        with limiter.slot("https://a.test/x"):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            try:
+                gate.wait()
+            except threading.BrokenBarrierError:
+                pass
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak[0] == 2
+
+
+def test_pause_releases_queued_waiters_at_sustained_rate():
+    clock = FakeClock()
+    waits = []
+    bucket = TokenBucket(rate=2.0, capacity=3, clock=clock, sleep=waits.append)
+
+    bucket.pause(5.0)
+    # Four workers queue during the backoff (clock does not advance)
+    for _ in range(4):
+        bucket.acquire()
+
+    assert waits == [5.5, 6.0, 6.5, 7.0]
+
+
+def test_pause_does_not_refill_while_paused():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+    bucket.pause(5.0)
+    clock.now = 4.0
+    assert bucket.acquire() == 1.5
+    assert clock.now == 5.5
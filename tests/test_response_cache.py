@@ -0,0 +1,172 @@
+import os
+from datetime import date
+
+from src.ingestion.response_cache import FetchResult, ResponseCache, is_finished
+
+URL = "https://cdn.test/scoreboard.json"
+TODAY = date(2024, 3, 10)
+
+
+def _board(*statuses):
+    return {"scoreboard": {"games": [{"gameId": str(i), "gameStatus": s} for i, s in enumerate(statuses)]}}
+
+
+class FakeNet:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def __call__(self, url, headers):
+        self.calls.append(headers)
+        return self.results.pop(0)
+
+
+def _cache(tmp_path, clock, **kwargs):
+    return ResponseCache(root=tmp_path, clock=lambda: clock[0], today=lambda: TODAY, **kwargs)
+
+
+def test_is_finished_rules():
+    assert is_finished(date(2024, 3, 9), _board(3, 3), TODAY)
+    assert not is_finished(date(2024, 3, 9), _board(3, 2), TODAY)
+    assert not is_finished(TODAY, _board(3, 3), TODAY)
+    assert not is_finished(date(2024, 3, 9), _board(), TODAY)
+    assert not is_finished(date(2024, 3, 1), _board(), TODAY)
+    assert is_finished(date(2024, 3, 1), {"games": [{"statusNum": 3}]}, TODAY)
+
+
+def test_finished_dates_are_never_refetched(tmp_path):
+    clock = [0.0]
+    cache = _cache(tmp_path, clock)
+    net = FakeNet(FetchResult(200, _board(3, 3)))
+    day = date(2024, 3, 1)
+
+    first = cache.fetch_json(URL, day, net)
+    clock[0] += 10 * 86400
+    second = cache.fetch_json(URL, day, net)
+
+    assert first == second == _board(3, 3)
+    assert len(net.calls) == 1
+    assert cache.stats.misses == 1 and cache.stats.hits == 1
+
+
+def test_empty_past_board_is_refetched_after_long_ttl(tmp_path):
+    clock = [0.0]
+    day = date(2024, 3, 1)
+    cache = _cache(tmp_path, clock, ttl_seconds=60, empty_ttl_seconds=3600)
+    net = FakeNet(FetchResult(200, _board()), FetchResult(200, _board(3, 3)))
+
+    assert cache.fetch_json(URL, day, net) == _board()
+    assert not cache.get(URL, day).immutable
+
+    clock[0] = 600.0
+    assert cache.fetch_json(URL, day, net) == _board()
+    assert len(net.calls) == 1
+
+    clock[0] = 3601.0
+    assert cache.fetch_json(URL, day, net) == _board(3, 3)
+    assert cache.get(URL, day).immutable
+
+
+def test_legacy_immutable_empty_entry_is_not_trusted(tmp_path):
+    clock = [0.0]
+    day = date(2024, 3, 1)
+    cache = _cache(tmp_path, clock, empty_ttl_seconds=3600)
+    entry = cache.put(URL, day, _board())
+    entry.immutable = True
+    cache._write(entry)
+
+    clock[0] = 3601.0
+    assert cache.fetch_json(URL, day, FakeNet(FetchResult(200, _board(3)))) == _board(3)
+
+
+def test_force_refetches_immutable_entry(tmp_path):
+    clock = [0.0]
+    day = date(2024, 3, 1)
+    cache = _cache(tmp_path, clock)
+    # Every listed game final, but one game missing from the board
+    cache.fetch_json(URL, day, FakeNet(FetchResult(200, _board(3), etag='"v1"')))
+    assert cache.get(URL, day).immutable
+
+    net = FakeNet(FetchResult(200, _board(3, 3)))
+    assert cache.fetch_json(URL, day, net) == _board(3)
+    assert net.calls == []
+
+    assert cache.fetch_json(URL, day, net, force=True) == _board(3, 3)
+    assert net.calls == [{}]
+    assert cache.fetch_json(URL, day, net) == _board(3, 3)
+
+
+def test_live_dates_revalidate_after_ttl(tmp_path):
+    clock = [0.0]
+    cache = _cache(tmp_path, clock, ttl_seconds=60)
+    net = FakeNet(
+        FetchResult(200, _board(2), etag='"v1"', last_modified="Sun, 10 Mar 2024 20:00:00 GMT"),
+        FetchResult(304),
+        FetchResult(200, _board(3), etag='"v2"'),
+    )
+
+    cache.fetch_json(URL, TODAY, net)
+    clock[0] = 30.0
+    cache.fetch_json(URL, TODAY, net)
+    assert len(net.calls) == 1
+
+    clock[0] = 61.0
+    assert cache.fetch_json(URL, TODAY, net) == _board(2)
+    assert net.calls[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Sun, 10 Mar 2024 20:00:00 GMT"}
+    assert cache.stats.revalidated == 1
+
+    clock[0] = 122.0
+    assert cache.fetch_json(URL, TODAY, net) == _board(3)
+    assert cache.get(URL, TODAY).etag == '"v2"'
+
+
+def test_failed_fetch_serves_stale_entry(tmp_path):
+    clock = [0.0]
+    cache = _cache(tmp_path, clock, ttl_seconds=60)
+    net = FakeNet(FetchResult(200, _board(2)), None, None)
+
+    cache.fetch_json(URL, TODAY, net)
+    clock[0] = 100.0
+
+    assert cache.fetch_json(URL, TODAY, net) == _board(2)
+    assert cache.fetch_json(URL, date(2024, 3, 11), net) is None
+
+
+def test_revalidation_can_mark_entry_immutable(tmp_path):
+    clock = [0.0]
+    day = date(2024, 3, 9)
+    cache = _cache(tmp_path, clock)
+    cache.today = lambda: day
+    cache.fetch_json(URL, day, FakeNet(FetchResult(200, _board(3), etag='"v1"')))
+    assert not cache.get(URL, day).immutable
+
+    cache.today = lambda: TODAY
+    clock[0] = 100.0
+    cache.fetch_json(URL, day, FakeNet(FetchResult(304)))
+
+    assert cache.get(URL, day).immutable
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    clock = [0.0]
+    days = [date(2024, 3, d) for d in (1, 2, 3)]
+    probe = ResponseCache(root=tmp_path / "probe", today=lambda: TODAY)
+    probe.put(URL, days[0], _board(3))
+    size = next((tmp_path / "probe").glob("*.json")).stat().st_size
+
+    cache = _cache(tmp_path / "cache", clock, max_bytes=2 * size + size // 2)
+    cache.put(URL, days[0], _board(3))
+    cache.put(URL, days[1], _board(3))
+
+    # Age day 2, then read day 1: day 2 is now least recently used
+    old = os.path.getmtime(cache._path(cache.key(URL, days[1]))) - 100
+    os.utime(cache._path(cache.key(URL, days[1])), (old, old))
+    cache.get(URL, days[0])
+
+    cache.put(URL, days[2], _board(3))
+
+    assert cache.get(URL, days[1]) is None
+    assert cache.get(URL, days[0]) is not None
+    assert cache.get(URL, days[2]) is not None
+    assert cache.stats.evictions == 1
+    assert cache.size_bytes() <= cache.max_bytes
@@ -0,0 +1,97 @@
+import os
+from datetime import date
+
+import pandas as pd
+
+from src.ingestion.fallback.manager import FallbackManager
+from src.ingestion.fallback.schedule_fallback import SeasonScheduleFallback, schedule_fallback_rows
+from src.ingestion.schedule_service import ScheduleService
+
+D1, D2, D3 = date(2024, 1, 5), date(2024, 1, 6), date(2024, 1, 8)
+
+
+def _write_schedule(path, games):
+    pd.DataFrame(
+        [
+            {"game_id": gid, "date": pd.Timestamp(day), "home_team": home, "away_team": away, "status": "final"}
+            for gid, day, home, away in games
+        ]
+    ).to_parquet(path, index=False)
+
+
+def _schedule(tmp_path):
+    path = tmp_path / "schedule.parquet"
+    _write_schedule(
+        path,
+        [
+            ("g3", D2, "Phoenix Suns", "Golden State Warriors"),
+            ("g1", D1, "Boston Celtics", "New York Knicks"),
+            ("g2", D1, "Los Angeles Lakers", "Denver Nuggets"),
+        ],
+    )
+    return path
+
+
+def test_service_indexes_by_date_and_loads_once(tmp_path):
+    service = ScheduleService(_schedule(tmp_path))
+
+    assert service.dates() == [D1, D2]
+    assert list(service.games_on(D1)["game_id"]) == ["g1", "g2"]
+    assert service.games_on(D3).empty
+    assert list(service.games_between(D1, D3)["game_id"]) == ["g1", "g2", "g3"]
+    for _ in range(100):
+        service.games_on(D2)
+    assert service.loads == 1
+
+
+def test_service_reloads_when_file_changes(tmp_path):
+    path = _schedule(tmp_path)
+    service = ScheduleService(path)
+    assert not service.has_games(D3)
+
+    _write_schedule(path, [("g9", D3, "Miami Heat", "Orlando Magic")])
+    stamp = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+    assert service.has_games(D3)
+    assert not service.has_games(D1)
+    assert service.loads == 2
+
+
+def test_missing_schedule_is_empty(tmp_path):
+    service = ScheduleService(tmp_path / "missing.parquet")
+    assert not service.exists()
+    assert service.games_on(D1).empty
+    assert not SeasonScheduleFallback(tmp_path / "missing.parquet").can_fill(D1, pd.DataFrame())
+
+
+def test_fallback_rows_are_canonical_home_away_pairs():
+    games = pd.DataFrame(
+        {
+            "game_id": ["g1", "g2"],
+            "date": pd.to_datetime([D1, D1]),
+            "home_team": ["Boston Celtics", "Los Angeles Lakers"],
+            "away_team": ["New York Knicks", "Denver Nuggets"],
+        }
+    )
+    rows = schedule_fallback_rows(games)
+
+    assert list(rows["game_id"]) == ["g1", "g1", "g2", "g2"]
+    assert list(rows["team"]) == ["BOS", "NYK", "LAL", "DEN"]
+    assert list(rows["opponent"]) == ["NYK", "BOS", "DEN", "LAL"]
+    assert list(rows["is_home"]) == [1, 0, 1, 0]
+    assert rows["score"].isna().all() and rows["opponent_score"].isna().all()
+    assert set(rows["season"]) == {"2023-24"}
+    assert set(rows["status"]) == {"scheduled"}
+    assert list(rows["date"]) == [D1] * 4
+
+
+def test_manager_fills_only_missing_games(tmp_path):
+    fallback = SeasonScheduleFallback(_schedule(tmp_path))
+    ingested = schedule_fallback_rows(fallback.schedule.games_on(D1).iloc[:1]).assign(status="final")
+
+    filled = FallbackManager([fallback]).fill_missing_for_date(D1, ingested)
+
+    assert list(filled["game_id"]) == ["g1", "g1", "g2", "g2"]
+    assert list(filled["status"]) == ["final", "final", "scheduled", "scheduled"]
+    assert not fallback.can_fill(D1, filled)